@@ -1,18 +1,52 @@
 """FastAPI News Analysis and Audio Generation Service."""
 import asyncio
+import base64
+import json
+import os
 import time
+from typing import List, Literal
+from urllib.parse import quote
 
+import requests
 import uvicorn
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field
 
-from news_extractor import fetch_news
+from cache import DiskCache, MemoCache, NewsCache
+from encoding import (
+    encode,
+    etag_matches,
+    negotiate,
+    paginate_articles,
+    select_fields
+)
+from feeds import FEEDS
+from history import SentimentHistory
+from prefetch import PrefetchScheduler
+from tts import SYNTHESIZER
+from metrics import REGISTRY, ServerTimingMiddleware, increment, stage_timer
+from workers import POOLS
 from utils import (
     process_articles, 
-    generate_audio, 
-    create_empty_result
+    analyze_article_sentiments,
+    analyze_grouped_sentiments,
+    article_ids,
+    cluster_near_duplicates,
+    copy_cluster_labels,
+    score_articles,
+    structure_article,
+    normalize_articles,
+    SENTIMENT_BATCH_SIZE,
+    generate_audio_bytes, 
+    create_empty_result,
+    get_audio_memo_stats,
+    ARTICLE_MEMO
 )
 
+STARTED_AT = time.time()
+
 # FastAPI Setup with performance optimizations
 app = FastAPI()
 
@@ -25,92 +59,1130 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Report per-stage durations of each request
+app.add_middleware(ServerTimingMiddleware)
+
 # Cache to store recent results
-NEWS_CACHE = {}
 CACHE_EXPIRY = 60 * 15  # 15 minutes
+CACHE_STALE_WINDOW = 60 * 5  # Serve expired entries while refreshing
+CACHE_MAX_ENTRIES = 256
+CACHE_MAX_BYTES = 64 * 1024 * 1024  # 64 MB
+CACHE_SWEEP_INTERVAL = 60
+NEWS_CACHE = NewsCache(
+    ttl=CACHE_EXPIRY,
+    max_entries=CACHE_MAX_ENTRIES,
+    max_bytes=CACHE_MAX_BYTES,
+    stale_ttl=CACHE_STALE_WINDOW
+)
 
-@app.get("/news")
-async def get_news(company: str = Query(..., description="Enter company name")):
+# Optional on-disk tier shared by all workers, enabled by NEWS_CACHE_DB
+CACHE_DB_PATH = os.environ.get("NEWS_CACHE_DB")
+DISK_CACHE = DiskCache(CACHE_DB_PATH, ttl=CACHE_EXPIRY) if CACHE_DB_PATH else None
+
+# Append-only Sentiment Distribution history, disabled by an empty NEWS_HISTORY_DIR
+HISTORY_DIR = os.environ.get("NEWS_HISTORY_DIR", "news_history")
+HISTORY = SentimentHistory(HISTORY_DIR) if HISTORY_DIR else None
+HISTORY_MAX_POINTS = 5000
+
+# Model warmup progress, reported by /ready
+WARMUP_STATE = {"ready": False, "error": None, "seconds": None}
+
+# Article pages of /news
+ARTICLES_MAX_LIMIT = 100
+
+# Multi-company requests
+BATCH_MAX_COMPANIES = 250
+BATCH_CONCURRENCY = 8  # Feeds fetched at once per batch
+
+# Analyses running, keyed by cache key, and audio syntheses, keyed by
+# cache key and a hash of the spoken text
+IN_FLIGHT = {}
+AUDIO_IN_FLIGHT = {}
+
+# Running batch analyses: companies each holds in IN_FLIGHT and its weight
+RUNNING_BATCHES = {}
+
+# Load shedding: new analyses beyond this many in flight get a 503
+MAX_PENDING_ANALYSES = int(os.environ.get("NEWS_MAX_PENDING_ANALYSES", "64"))
+RETRY_AFTER_SECONDS = 5
+
+def _start_once(cache_key: str, compute, registry: dict = IN_FLIGHT) -> asyncio.Future:
     """
-    Fetch and analyze news for a given company.
+    Start a computation for a cache key unless one is already running.
+
+    Args:
+        cache_key: Key of the computation in ``registry``.
+        compute: Zero-argument coroutine function producing the result.
+        registry (dict): In-flight registry the computation belongs to.
+
+    Returns:
+        asyncio.Future: The running computation.
+    """
+    task = registry.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(compute())
+        registry[cache_key] = task
+
+        def _release(done_task):
+            if registry.get(cache_key) is done_task:
+                del registry[cache_key]
+            if not done_task.cancelled():
+                done_task.exception()  # Mark as retrieved if every waiter left
+
+        task.add_done_callback(_release)
+
+    return task
+
+async def _single_flight(cache_key: str, compute):
+    """
+    Run at most one computation per cache key and share its outcome.
+
+    Args:
+        cache_key (str): Normalized cache key.
+        compute: Zero-argument coroutine function producing the result.
+
+    Returns:
+        dict: Result of the shared computation.
+    """
+    task = _start_once(cache_key, compute)
+
+    # Shield so a disconnecting client does not cancel the other waiters
+    return await asyncio.shield(task)
+
+def _pending_analyses() -> int:
+    """
+    Count the analyses held against the queue limit.
+
+    A batch fetches at most ``BATCH_CONCURRENCY`` feeds at once and scores
+    its articles in one pass, so it counts as at most that many analyses
+    however many companies it holds.
+
+    Returns:
+        int: Analyses in flight.
+    """
+    batched = sum(companies for companies, _ in RUNNING_BATCHES.values())
+    weight = sum(weight for _, weight in RUNNING_BATCHES.values())
+    return len(IN_FLIGHT) - batched + weight
+
+def _has_capacity(count: int = 1) -> bool:
+    """
+    Check whether more analyses may start without exceeding the queue limit.
+
+    Args:
+        count (int): Number of analyses about to start.
+
+    Returns:
+        bool: True if they fit within ``MAX_PENDING_ANALYSES``.
+    """
+    return _pending_analyses() + count <= MAX_PENDING_ANALYSES
+
+def _reject_if_overloaded(count: int = 1) -> None:
+    """
+    Refuse new analyses while the analysis queue is full.
+
+    Args:
+        count (int): Number of analyses about to start.
+
+    Raises:
+        HTTPException: 503 with ``Retry-After`` when over the limit.
+    """
+    if not _has_capacity(count):
+        increment("news_overload_rejections_total", "Requests refused with 503 under overload.")
+        raise HTTPException(
+            status_code=503,
+            detail="Too many analyses in progress, please retry later.",
+            headers={"Retry-After": str(RETRY_AFTER_SECONDS)}
+        )
+
+def _report_refresh_failure(company: str, task: asyncio.Future) -> None:
+    """
+    Log and count a background refresh that failed.
+
+    Nobody awaits these refreshes, so without this a failure would only
+    show as the entry going stale and then expiring.
+
+    Args:
+        company (str): Name of the company that was refreshed.
+        task (asyncio.Future): The finished refresh.
+    """
+    if task.cancelled() or task.exception() is None:
+        return
+    error = task.exception()
+    print(f"Error refreshing {company}: {str(error) or type(error).__name__}")
+    increment("news_refresh_failures_total", "Background refreshes of stale entries that failed.")
+
+def _refresh_stale(company: str, cache_key: str) -> None:
+    """
+    Refresh a stale cache entry in the background if there is capacity.
+
+    Args:
+        company (str): Name of the company to search for.
+        cache_key (str): Normalized cache key.
+    """
+    if cache_key in IN_FLIGHT:
+        return
+    if _has_capacity():
+        task = _start_once(cache_key, lambda: _analyze_company(company, cache_key))
+        task.add_done_callback(lambda done_task: _report_refresh_failure(company, done_task))
+
+def _fetch_news(company: str, conditional: bool = False) -> tuple:
+    """
+    Download a company's feed and extract its articles.
+
+    If the news extractor provides ``parse_news`` the feed is downloaded
+    over the pooled session and the bytes are handed to it. Otherwise
+    ``fetch_news`` downloads the feed itself, and the pooled session is
+    only used to revalidate a feed whose result is cached. If the pooled
+    download fails, ``fetch_news`` is used as if it had not been tried.
+
+    Args:
+        company (str): Name of the company to search for.
+        conditional (bool): Skip extraction if the feed is unchanged since
+            the last download.
+
+    Returns:
+        tuple: Extracted articles, or ``None`` if the feed is unchanged, and
+            the ``FeedResult`` to remember once the result is stored, or
+            ``None`` if the pooled session was not used.
+    """
+    import news_extractor  # Heavy import deferred to keep startup fast
+
+    parse_news = getattr(news_extractor, "parse_news", None)
+    if parse_news is None and not conditional:
+        return news_extractor.fetch_news(company), None
+
+    try:
+        feed = FEEDS.fetch(FEEDS.url_for(company), conditional=conditional)
+    except requests.RequestException as e:
+        print(f"Error downloading feed for {company}: {str(e)}")
+        return news_extractor.fetch_news(company), None
+    if not feed.changed:
+        return None, feed
+    if parse_news is not None:
+        return parse_news(feed.content, company), feed
+    return news_extractor.fetch_news(company), feed
+
+async def _fetch_articles(company: str, conditional: bool = False) -> tuple:
+    """
+    Fetch articles off the event loop and normalize their summaries.
 
     Args:
         company (str): Name of the company to search for.
+        conditional (bool): Return no articles if the feed is unchanged.
+
+    Returns:
+        tuple: Articles with plain-text summaries, links and sources, or
+            ``None`` if the feed is unchanged, and the downloaded
+            ``FeedResult`` or ``None``.
+    """
+    with stage_timer("fetch"):
+        articles, feed = await asyncio.to_thread(_fetch_news, company, conditional)
+    if articles is None:
+        return None, feed
+    with stage_timer("normalize"):
+        return normalize_articles(articles), feed
+
+def _audio_url(cache_key: str) -> str:
+    """
+    Build the audio endpoint path for a company.
+
+    Args:
+        cache_key (str): Normalized cache key.
+
+    Returns:
+        str: Path of the audio endpoint.
+    """
+    return f"/news/{quote(cache_key, safe='')}/audio"
+
+async def _load_or_generate_audio(cache_key: str, text: str) -> bytes:
+    """
+    Serve audio from the disk cache, synthesizing it on a miss.
+
+    Audio from a fallback TTS backend is served but not written to disk,
+    so the preferred backend gets another try on the next miss. Audio is
+    only attached to the disk row it was looked up in, so a result stored
+    while the synthesis ran keeps no audio for the old summary.
+
+    Args:
+        cache_key (str): Normalized cache key.
+        text (str): Text to convert to audio.
+
+    Returns:
+        bytes: MP3 audio, empty if synthesis failed.
+    """
+    timestamp = None
+    if DISK_CACHE is not None:
+        audio_bytes, timestamp = await asyncio.to_thread(DISK_CACHE.get_audio, cache_key)
+        if audio_bytes:
+            return audio_bytes
+
+    audio_bytes, backend = await generate_audio_bytes(text)
+    if audio_bytes and backend == SYNTHESIZER.preferred() and timestamp is not None:
+        await asyncio.to_thread(DISK_CACHE.set_audio, cache_key, audio_bytes, timestamp)
+    return audio_bytes
+
+def _start_audio(cache_key: str, text: str) -> asyncio.Future:
+    """
+    Start audio synthesis for a result unless it is already running.
+
+    A synthesis is shared only by callers speaking the same text, so a
+    refreshed summary never waits on audio for the previous one.
+
+    Args:
+        cache_key (str): Normalized cache key.
+        text (str): Text to convert to audio.
+
+    Returns:
+        asyncio.Future: The running synthesis.
+    """
+    return _start_once(
+        (cache_key, MemoCache.make_key(text)),
+        lambda: _load_or_generate_audio(cache_key, text),
+        AUDIO_IN_FLIGHT
+    )
+
+async def _store_result(cache_key: str, result: dict) -> None:
+    """
+    Cache a result in memory and, when enabled, on disk.
+
+    Args:
+        cache_key (str): Normalized cache key.
+        result (dict): Analysis result.
+    """
+    timestamp = time.time()
+    NEWS_CACHE.set(cache_key, result, timestamp=timestamp)
+    if DISK_CACHE is not None:
+        await asyncio.to_thread(DISK_CACHE.set, cache_key, result, timestamp)
+
+async def _load_from_disk(cache_key: str) -> dict:
+    """
+    Promote a fresh disk cache entry into the in-memory cache.
+
+    Args:
+        cache_key (str): Normalized cache key.
+
+    Returns:
+        dict: Cached result, or ``None`` on a miss or when disabled.
+    """
+    if DISK_CACHE is None:
+        return None
+
+    cached = await asyncio.to_thread(DISK_CACHE.get, cache_key)
+    if cached is None:
+        return None
+    data, timestamp = cached
+    NEWS_CACHE.set(cache_key, data, timestamp=timestamp)
+    return data
+
+async def _load_or_analyze(company: str, cache_key: str) -> dict:
+    """
+    Serve a result from the disk cache, analyzing the company on a miss.
+
+    Args:
+        company (str): Name of the company to search for.
+        cache_key (str): Normalized cache key.
 
     Returns:
         dict: Comprehensive news analysis and sentiment report.
     """
-    cache_key = company.lower().strip()
-    current_time = time.time()
+    data = await _load_from_disk(cache_key)
+    if data is not None:
+        return data
 
-    # Return cached result if available and not expired
-    if (cache_key in NEWS_CACHE and
-            (current_time - NEWS_CACHE[cache_key]["timestamp"]) < CACHE_EXPIRY):
-        return NEWS_CACHE[cache_key]["data"]
+    return await _analyze_company(company, cache_key)
 
-    # Fetch fresh data asynchronously
-    articles = await asyncio.to_thread(fetch_news, company)
+async def _build_result(
+    company: str,
+    cache_key: str,
+    articles: list,
+    sentiments: list = None,
+    feed=None
+) -> dict:
+    """
+    Analyze fetched articles, then cache the result and start its audio.
+
+    The feed's validators are only remembered once the result is stored,
+    so a failed analysis is retried on the next refresh.
+
+    Args:
+        company (str): Name of the company to search for.
+        cache_key (str): Normalized cache key.
+        articles (list): Articles returned by ``fetch_news``.
+        sentiments (list): Precomputed sentiment labels, one per article.
+        feed (FeedResult): Download the articles came from, if any.
 
+    Returns:
+        dict: Comprehensive news analysis and sentiment report.
+    """
     if not articles:
         result = create_empty_result(company)
-        NEWS_CACHE[cache_key] = {
-            "data": result,
-            "timestamp": current_time
-        }
+        await _store_result(cache_key, result)
+        if feed is not None:
+            FEEDS.remember(feed)
         return result
 
-    # Sentiment and Topic Analysis
-    sentiment_counts, structured_articles, analysis_result = process_articles(
-        articles, company
+    # Sentiment and Topic Analysis, off the event loop
+    if sentiments is None:
+        sentiments = await _score_articles(articles)
+    sentiment_counts, structured_articles, analysis_result = await POOLS.run(
+        process_articles, articles, company, sentiments
     )
 
-    # Generate audio as base64 string asynchronously
-    audio_base64 = await generate_audio(analysis_result["Final Sentiment Analysis"])
-
     result = {
         "Company": company,
         "Articles": structured_articles,
         "Comparative Sentiment Score": {
             "Sentiment Distribution": sentiment_counts,
             "Coverage Differences": analysis_result.get("Coverage Differences", []),
-            "Topic Overlap": analysis_result.get("Topic Overlap", {})
+            "Topic Overlap": analysis_result.get("Topic Overlap", {}),
+            "Coverage Similarity": analysis_result.get("Coverage Similarity", {})
         },
         "Final Sentiment Analysis": analysis_result["Final Sentiment Analysis"],
-        "Audio": "",
-        "AudioBase64": audio_base64
+        "Article Reuse": analysis_result["Article Reuse"],
+        "Audio": _audio_url(cache_key),
+        "AudioBase64": ""
     }
 
-    # Cache the result
-    NEWS_CACHE[cache_key] = {
-        "data": result,
-        "timestamp": current_time
-    }
+    # Cache the result and synthesize audio off the response path
+    await _store_result(cache_key, result)
+    if feed is not None:
+        FEEDS.remember(feed)
+    if HISTORY is not None:
+        await asyncio.to_thread(HISTORY.append, cache_key, sentiment_counts)
+    _start_audio(cache_key, result["Final Sentiment Analysis"])
 
     return result
 
+async def _score_articles(articles: list) -> list:
+    """
+    Score articles on the analysis pool, with inference in worker processes.
+
+    Args:
+        articles (list): Normalized articles.
+
+    Returns:
+        list: Sentiment labels in the same order as ``articles``.
+    """
+    with stage_timer("sentiment"):
+        return await POOLS.run(analyze_article_sentiments, articles, POOLS.infer)
+
+async def _analyze_company(company: str, cache_key: str) -> dict:
+    """
+    Fetch, analyze and cache news for a company.
+
+    Args:
+        company (str): Name of the company to search for.
+        cache_key (str): Normalized cache key.
+
+    Returns:
+        dict: Comprehensive news analysis and sentiment report.
+    """
+    # Revalidate the feed behind a cached result instead of re-analyzing it
+    previous = NEWS_CACHE.peek(cache_key)
+    articles, feed = await _fetch_articles(company, conditional=previous is not None)
+    if articles is None:
+        await _store_result(cache_key, previous)
+        return previous
+    return await _build_result(company, cache_key, articles, feed=feed)
+
+async def _analyze_batch(companies: dict) -> dict:
+    """
+    Fetch and analyze several companies with one sentiment pass.
+
+    Feeds are fetched with at most ``BATCH_CONCURRENCY`` requests in
+    flight, then every company's articles are clustered on their own and
+    scored in a single batched sentiment call before each company's
+    result is built.
+
+    Args:
+        companies (dict): Company names keyed by normalized cache key.
+
+    Returns:
+        dict: Result or raised exception keyed by cache key.
+    """
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    outcomes = {}
+    fetched = {}
+
+    async def _fetch(cache_key: str, company: str) -> None:
+        async with semaphore:
+            try:
+                data = await _load_from_disk(cache_key)
+                if data is not None:
+                    outcomes[cache_key] = data
+                else:
+                    fetched[cache_key] = await _fetch_articles(company)
+            except Exception as e:
+                outcomes[cache_key] = e
+
+    await asyncio.gather(*(
+        _fetch(cache_key, company) for cache_key, company in companies.items()
+    ))
+
+    scored = [cache_key for cache_key, (articles, _) in fetched.items() if articles]
+    try:
+        with stage_timer("sentiment"):
+            grouped = await POOLS.run(
+                analyze_grouped_sentiments,
+                [fetched[cache_key][0] for cache_key in scored],
+                POOLS.infer
+            )
+        all_sentiments = dict(zip(scored, grouped))
+    except Exception as e:
+        all_sentiments = {}
+        print(f"Error in batched sentiment analysis: {str(e)}")
+
+    for cache_key, (articles, feed) in fetched.items():
+        sentiments = all_sentiments.get(cache_key)
+        try:
+            outcomes[cache_key] = await _build_result(
+                companies[cache_key], cache_key, articles, sentiments, feed
+            )
+        except Exception as e:
+            outcomes[cache_key] = e
+
+    return outcomes
+
+async def _batch_item(batch: asyncio.Future, cache_key: str) -> dict:
+    """
+    Await one company's outcome from a running batch.
+
+    Args:
+        batch (asyncio.Future): Task running ``_analyze_batch``.
+        cache_key (str): Normalized cache key.
+
+    Returns:
+        dict: The company's result; its exception is re-raised.
+    """
+    outcome = (await batch)[cache_key]
+    if isinstance(outcome, Exception):
+        raise outcome
+    return outcome
+
+async def _get_result(company: str, record: bool = False) -> dict:
+    """
+    Return the cached analysis for a company, computing it on a miss.
+
+    Concurrent requests for the same company share a single analysis, and
+    a recently expired result is served while it is refreshed.
+
+    Args:
+        company (str): Name of the company to search for.
+        record (bool): Count the request towards the company's popularity.
+            Only requests for an analysis count, not its audio or later
+            article pages.
+
+    Returns:
+        dict: Comprehensive news analysis and sentiment report.
+    """
+    cache_key = company.lower().strip()
+
+    # Return cached result if available, refreshing stale entries
+    cached = NEWS_CACHE.get(cache_key)
+    if record:
+        PREFETCHER.record(cache_key, company, hit=cached is not None)
+    if cached is not None:
+        data, is_stale = cached
+        if is_stale:
+            _refresh_stale(company, cache_key)
+        return data
+
+    if cache_key not in IN_FLIGHT:
+        _reject_if_overloaded()
+    return await _single_flight(
+        cache_key, lambda: _load_or_analyze(company, cache_key)
+    )
+
+async def _embed_audio(company: str, result: dict) -> dict:
+    """
+    Wait for a result's audio and embed it as base64.
+
+    Args:
+        company (str): Name of the company to search for.
+        result (dict): Analysis result.
+
+    Returns:
+        dict: Copy of the result with ``AudioBase64`` filled in.
+    """
+    cache_key = company.lower().strip()
+    audio_bytes = await asyncio.shield(
+        _start_audio(cache_key, result["Final Sentiment Analysis"])
+    )
+    return {
+        **result,
+        "AudioBase64": base64.b64encode(audio_bytes).decode("utf-8")
+    }
+
+async def analyze_news(
+    company: str,
+    inline_audio: bool = False,
+    limit: int = None,
+    cursor: str = None
+) -> dict:
+    """
+    Fetch and analyze news for a given company as a Python object.
+
+    Args:
+        company (str): Name of the company to search for.
+        inline_audio (bool): Whether to wait for and embed the audio.
+        limit (int): Articles per page, or ``None`` for all of them.
+        cursor (str): ``Next Cursor`` of the previous page.
+
+    Returns:
+        dict: Comprehensive news analysis and sentiment report.
+
+    Raises:
+        ValueError: If the cursor does not match the current result.
+    """
+    result = await _get_result(company, record=cursor is None)
+    if limit is not None:
+        result = paginate_articles(result, limit, cursor)
+    if not inline_audio or not result["Audio"]:
+        return result
+    return await _embed_audio(company, result)
+
+@app.get("/news")
+async def get_news(
+    request: Request,
+    company: str = Query(..., description="Enter company name"),
+    inline_audio: bool = Query(False, description="Embed base64 audio in the response"),
+    fields: str = Query(
+        None, description="Comma-separated fields to return, e.g. Sentiment Distribution"
+    ),
+    limit: int = Query(
+        None, ge=1, le=ARTICLES_MAX_LIMIT, description="Articles per page, all if omitted"
+    ),
+    cursor: str = Query(None, description="Next Cursor of the previous page")
+):
+    """
+    Fetch and analyze news for a given company.
+
+    The response links to the audio endpoint instead of waiting for speech
+    synthesis, unless ``inline_audio`` asks for the base64 payload. The
+    body is JSON, or MessagePack if the ``Accept`` header asks for it, and
+    is compressed according to ``Accept-Encoding``. Encoded bodies of
+    cached results are reused, so repeated requests skip serialization.
+    Responses carry an ETag derived from the cached result's content hash
+    and a ``Cache-Control`` max-age of the entry's remaining lifetime; a
+    matching ``If-None-Match`` gets an empty 304. With ``limit`` the
+    articles are returned a page at a time, while the aggregates still
+    cover every article.
+
+    Args:
+        request (Request): Incoming request, for content negotiation.
+        company (str): Name of the company to search for.
+        inline_audio (bool): Whether to wait for and embed the audio.
+        fields (str): Comma-separated result fields to keep.
+        limit (int): Articles per page.
+        cursor (str): ``Next Cursor`` of the previous page.
+
+    Returns:
+        Response: Encoded news analysis and sentiment report.
+    """
+    result = await _get_result(company, record=cursor is None)
+    cache_key = company.lower().strip()
+    selected = [field.strip() for field in (fields or "").split(",") if field.strip()]
+    media_type, coding = negotiate(
+        request.headers.get("accept"), request.headers.get("accept-encoding")
+    )
+
+    headers = {"Vary": "Accept, Accept-Encoding", "Cache-Control": "no-cache"}
+    validator = NEWS_CACHE.validator(cache_key, result)
+    if validator is not None:
+        content_hash, age = validator
+        headers["Cache-Control"] = (
+            f"public, max-age={max(0, int(CACHE_EXPIRY - age))}, "
+            f"stale-while-revalidate={CACHE_STALE_WINDOW}"
+        )
+        # Embedded audio is synthesized per request, so it is never revalidated
+        if not inline_audio:
+            variant = MemoCache.make_key(
+                media_type, ",".join(selected), str(limit), cursor or ""
+            )[:8]
+            # Weak, because compressed and uncompressed bodies share the tag
+            headers["ETag"] = f'W/"{content_hash}-{variant}"'
+            if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+                increment("news_not_modified_total", "/news requests answered with 304.")
+                return Response(status_code=304, headers=headers)
+
+    data = result
+    if limit is not None:
+        try:
+            data = paginate_articles(data, limit, cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    if inline_audio and result["Audio"]:
+        data = await _embed_audio(company, data)
+    if selected:
+        try:
+            data = select_fields(data, selected)
+        except KeyError as e:
+            raise HTTPException(status_code=400, detail=f"Unknown field: {e.args[0]}")
+
+    # Embedded audio is not kept, so only plain results reuse their body
+    encoded = variant = None
+    if not inline_audio:
+        variant = MemoCache.make_key(
+            media_type, coding, ",".join(selected), str(limit), cursor or ""
+        )
+        encoded = NEWS_CACHE.get_encoded(cache_key, result, variant)
+    if encoded is not None:
+        body, applied = encoded
+    else:
+        with stage_timer("serialize"):
+            body, applied = encode(data, media_type, coding)
+        if variant is not None:
+            NEWS_CACHE.set_encoded(cache_key, result, variant, body, applied)
+    increment(
+        "news_response_bytes_total", "Bytes of /news response bodies sent.",
+        len(body), media_type=media_type, encoding=applied
+    )
+
+    if applied != "identity":
+        headers["Content-Encoding"] = applied
+    return Response(body, media_type=media_type, headers=headers)
+
+async def _analyze_streaming(company: str, cache_key: str, queue: asyncio.Queue) -> dict:
+    """
+    Analyze a company, publishing each article once it has been scored.
+
+    Args:
+        company (str): Name of the company to search for.
+        cache_key (str): Normalized cache key.
+        queue (asyncio.Queue): Receives structured articles, then ``None``.
+
+    Returns:
+        dict: Comprehensive news analysis and sentiment report.
+    """
+    try:
+        data = await _load_from_disk(cache_key)
+        if data is not None:
+            return data
+
+        articles, feed = await _fetch_articles(company)
+        if not articles:
+            return await _build_result(company, cache_key, articles, feed=feed)
+
+        # Cluster the whole list so duplicates are found across chunks
+        with stage_timer("dedup"):
+            clusters = await POOLS.run(cluster_near_duplicates, articles)
+        representatives = sorted(set(clusters))
+        sentiments = [None] * len(articles)
+        ids = article_ids(articles)
+        published = 0
+        for start in range(0, len(representatives), SENTIMENT_BATCH_SIZE):
+            chunk = representatives[start:start + SENTIMENT_BATCH_SIZE]
+            with stage_timer("sentiment"):
+                labels = await POOLS.run(score_articles, articles, chunk, POOLS.infer)
+            for i, sentiment in zip(chunk, labels):
+                sentiments[i] = sentiment
+
+            # Articles before the next unscored representative are labelled
+            following = start + SENTIMENT_BATCH_SIZE
+            ready = range(
+                published,
+                representatives[following] if following < len(representatives) else len(articles)
+            )
+            copy_cluster_labels(articles, clusters, sentiments, ready)
+            for i in ready:
+                queue.put_nowait(
+                    structure_article({**articles[i], "sentiment": sentiments[i]}, ids[i])
+                )
+            published = ready.stop
+
+        return await _build_result(company, cache_key, articles, sentiments, feed)
+    finally:
+        queue.put_nowait(None)
+
+async def _news_events(company: str):
+    """
+    Yield the events of a streamed news analysis.
+
+    Emits a header, one event per article, the aggregate block and finally
+    the audio status. Cached results are replayed immediately.
+
+    Args:
+        company (str): Name of the company to search for.
+
+    Yields:
+        dict: Event payloads tagged with an ``event`` name.
+    """
+    cache_key = company.lower().strip()
+    yield {"event": "header", "Company": company}
+
+    emitted = 0
+    try:
+        cached = NEWS_CACHE.get(cache_key)
+        PREFETCHER.record(cache_key, company, hit=cached is not None)
+        if cached is not None:
+            data, is_stale = cached
+            if is_stale:
+                _refresh_stale(company, cache_key)
+        elif cache_key in IN_FLIGHT:
+            data = await asyncio.shield(IN_FLIGHT[cache_key])
+        else:
+            queue = asyncio.Queue()
+            task = _start_once(
+                cache_key, lambda: _analyze_streaming(company, cache_key, queue)
+            )
+            while (article := await queue.get()) is not None:
+                yield {"event": "article", "Index": emitted, **article}
+                emitted += 1
+            data = await asyncio.shield(task)
+    except Exception as e:
+        yield {"event": "error", "detail": str(e) or type(e).__name__}
+        return
+
+    for article in data["Articles"][emitted:]:
+        yield {"event": "article", "Index": emitted, **article}
+        emitted += 1
+
+    yield {
+        "event": "aggregate",
+        "Comparative Sentiment Score": data["Comparative Sentiment Score"],
+        "Final Sentiment Analysis": data["Final Sentiment Analysis"]
+    }
+
+    if data["Audio"]:
+        audio_bytes = await asyncio.shield(
+            _start_audio(cache_key, data["Final Sentiment Analysis"])
+        )
+        yield {"event": "audio", "Audio": data["Audio"], "Ready": bool(audio_bytes)}
+
+@app.get("/news/stream")
+async def stream_news(
+    company: str = Query(..., description="Enter company name"),
+    stream_format: Literal["ndjson", "sse"] = Query("ndjson", alias="format")
+):
+    """
+    Stream a news analysis as NDJSON or server-sent events.
+
+    Args:
+        company (str): Name of the company to search for.
+        stream_format (str): ``ndjson`` or ``sse``.
+
+    Returns:
+        StreamingResponse: Header, article, aggregate and audio events.
+    """
+    cache_key = company.lower().strip()
+    if cache_key not in NEWS_CACHE and cache_key not in IN_FLIGHT:
+        _reject_if_overloaded()
+
+    async def _encode():
+        async for event in _news_events(company):
+            if stream_format == "sse":
+                yield f"event: {event['event']}\ndata: {json.dumps(event)}\n\n"
+            else:
+                yield json.dumps(event) + "\n"
+
+    media_type = "text/event-stream" if stream_format == "sse" else "application/x-ndjson"
+    return StreamingResponse(_encode(), media_type=media_type)
+
+@app.get("/news/{company}/audio")
+async def get_news_audio(company: str):
+    """
+    Stream the Hindi audio summary for a company as MP3.
+
+    Args:
+        company (str): Name of the company to search for.
+
+    Returns:
+        Response: ``audio/mpeg`` bytes.
+    """
+    result = await _get_result(company)
+    if not result["Audio"]:
+        raise HTTPException(status_code=404, detail="No audio summary for this company.")
+
+    cache_key = company.lower().strip()
+    audio_bytes = await asyncio.shield(
+        _start_audio(cache_key, result["Final Sentiment Analysis"])
+    )
+    if not audio_bytes:
+        raise HTTPException(status_code=503, detail="Audio generation failed.")
+    return Response(content=audio_bytes, media_type="audio/mpeg")
+
+@app.get("/news/{company}/history")
+async def get_news_history(
+    company: str,
+    start: float = Query(None, description="Earliest Unix timestamp, inclusive"),
+    end: float = Query(None, description="Latest Unix timestamp, inclusive"),
+    points: int = Query(200, ge=1, le=HISTORY_MAX_POINTS, description="Maximum points returned")
+):
+    """
+    Chart how a company's Sentiment Distribution has moved over time.
+
+    Every fresh analysis is recorded; the records in range are downsampled
+    on the server to at most ``points`` evenly spaced buckets.
+
+    Args:
+        company (str): Name of the company.
+        start (float): Earliest Unix timestamp, inclusive.
+        end (float): Latest Unix timestamp, inclusive.
+        points (int): Maximum number of points returned.
+
+    Returns:
+        dict: Record count in range and the downsampled points.
+    """
+    if HISTORY is None:
+        raise HTTPException(status_code=404, detail="Sentiment history is disabled.")
+
+    cache_key = company.lower().strip()
+    with stage_timer("history"):
+        history = await asyncio.to_thread(HISTORY.query, cache_key, start, end, points)
+    return {"Company": company, "Start": start, "End": end, **history}
+
+class BatchNewsRequest(BaseModel):
+    """Request body for ``/news/batch``."""
+
+    companies: List[str] = Field(..., min_length=1, max_length=BATCH_MAX_COMPANIES)
+
+@app.post("/news/batch")
+async def get_news_batch(request: BatchNewsRequest):
+    """
+    Fetch and analyze news for several companies at once.
+
+    Names are deduplicated by cache key. Cached results are returned
+    directly, companies already being analyzed are awaited, and the rest
+    are analyzed together with bounded fetch concurrency.
+
+    Args:
+        request (BatchNewsRequest): Companies to analyze.
+
+    Returns:
+        dict: Per-company results and per-company errors.
+    """
+    companies = {}
+    for company in request.companies:
+        companies.setdefault(company.lower().strip(), company)
+
+    waiters = {}
+    pending = {}
+    for cache_key, company in companies.items():
+        cached = NEWS_CACHE.get(cache_key)
+        PREFETCHER.record(cache_key, company, hit=cached is not None)
+        if cached is not None:
+            data, is_stale = cached
+            if is_stale:
+                _refresh_stale(company, cache_key)
+            waiters[cache_key] = data
+        elif cache_key in IN_FLIGHT:
+            waiters[cache_key] = asyncio.shield(IN_FLIGHT[cache_key])
+        else:
+            pending[cache_key] = company
+
+    if pending:
+        weight = min(len(pending), BATCH_CONCURRENCY)
+        _reject_if_overloaded(weight)
+        batch = asyncio.ensure_future(_analyze_batch(pending))
+        RUNNING_BATCHES[batch] = (len(pending), weight)
+        batch.add_done_callback(lambda done: RUNNING_BATCHES.pop(done, None))
+        for cache_key in pending:
+            waiters[cache_key] = asyncio.shield(_start_once(
+                cache_key, lambda k=cache_key: _batch_item(batch, k)
+            ))
+
+    results = {}
+    errors = {}
+    for cache_key, waiter in waiters.items():
+        company = companies[cache_key]
+        if isinstance(waiter, dict):
+            results[company] = waiter
+            continue
+        try:
+            results[company] = await waiter
+        except Exception as e:
+            errors[company] = str(e) or type(e).__name__
+
+    return {"results": results, "errors": errors}
+
 @app.get("/healthcheck")
 async def healthcheck():
     """
     Endpoint to check if the service is running.
 
     Returns:
-        dict: Service status and cache size.
+        dict: Service status, cache size, cache and memo counters.
+    """
+    return {
+        "status": "healthy",
+        "cache_size": len(NEWS_CACHE),
+        "cache": NEWS_CACHE.stats(),
+        "disk_cache": DISK_CACHE.stats() if DISK_CACHE is not None else None,
+        "audio_memo": get_audio_memo_stats(),
+        "tts": SYNTHESIZER.stats(),
+        "article_memo": ARTICLE_MEMO.stats(),
+        "workers": POOLS.stats(),
+        "history": HISTORY.stats() if HISTORY is not None else None,
+        "prefetch": PREFETCHER.stats(),
+        "feeds": FEEDS.stats(),
+        "in_flight": len(IN_FLIGHT)
+    }
+
+def _cache_samples() -> list:
+    """
+    Expose cache and memo counters as Prometheus samples.
+
+    Returns:
+        list: ``(name, type, help, labels, value)`` tuples.
+    """
+    stats = NEWS_CACHE.stats()
+    samples = [
+        ("news_cache_lookups_total", "counter", "Result cache lookups by outcome.",
+         {"result": "hit"}, stats["hits"]),
+        ("news_cache_lookups_total", "counter", "Result cache lookups by outcome.",
+         {"result": "stale"}, stats["stale_hits"]),
+        ("news_cache_lookups_total", "counter", "Result cache lookups by outcome.",
+         {"result": "miss"}, stats["misses"]),
+        ("news_cache_evictions_total", "counter", "Result cache LRU evictions.",
+         {}, stats["evictions"]),
+        ("news_cache_entries", "gauge", "Entries in the result cache.",
+         {}, stats["entries"]),
+        ("news_cache_bytes", "gauge", "Approximate bytes held by the result cache.",
+         {}, stats["bytes"]),
+    ]
+    memos = {"article": ARTICLE_MEMO.stats(), **get_audio_memo_stats()}
+    for memo, memo_stats in memos.items():
+        for result, field in (("hit", "hits"), ("miss", "misses")):
+            samples.append((
+                "news_memo_lookups_total", "counter", "Memo lookups by memo and outcome.",
+                {"memo": memo, "result": result}, memo_stats[field]
+            ))
+    if DISK_CACHE is not None:
+        disk_stats = DISK_CACHE.stats()
+        for result, field in (("hit", "hits"), ("miss", "misses")):
+            samples.append((
+                "news_disk_cache_lookups_total", "counter", "Disk cache lookups by outcome.",
+                {"result": result}, disk_stats[field]
+            ))
+    for result, value in (
+            ("ok", PREFETCHER.prefetches),
+            ("error", PREFETCHER.failures),
+            ("rate_limited", PREFETCHER.rate_limited)):
+        samples.append((
+            "news_prefetch_total", "counter", "Background refreshes by outcome.",
+            {"result": result}, value
+        ))
+    feed_stats = FEEDS.stats()
+    for result, value in (
+            ("changed", feed_stats["requests"] - feed_stats["not_modified"]
+             - feed_stats["unchanged"] - feed_stats["errors"]),
+            ("not_modified", feed_stats["not_modified"]),
+            ("unchanged", feed_stats["unchanged"]),
+            ("error", feed_stats["errors"])):
+        samples.append((
+            "news_feed_requests_total", "counter", "Feed downloads by outcome.",
+            {"result": result}, value
+        ))
+    samples.append((
+        "news_feed_bytes_total", "counter", "Feed body bytes received.", {}, feed_stats["bytes"]
+    ))
+    prefetch_stats = PREFETCHER.stats()
+    for scope, field in (("all", "hit_rate"), ("prefetched", "prefetched_hit_rate")):
+        if prefetch_stats[field] is not None:
+            samples.append((
+                "news_request_hit_ratio", "gauge", "Share of requests served from the cache.",
+                {"companies": scope}, prefetch_stats[field]
+            ))
+    return samples
+
+REGISTRY.register_collector(_cache_samples)
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
     """
-    return {"status": "healthy", "cache_size": len(NEWS_CACHE)}
+    Expose stage latency histograms and counters for Prometheus.
+
+    Returns:
+        PlainTextResponse: Metrics in the text exposition format.
+    """
+    return PlainTextResponse(
+        REGISTRY.render(), media_type="text/plain; version=0.0.4"
+    )
+
+async def _prefetch_company(company: str, cache_key: str) -> None:
+    """
+    Re-analyze a company ahead of its cache entry expiring.
+
+    Args:
+        company (str): Name of the company to search for.
+        cache_key (str): Normalized cache key.
+
+    Raises:
+        RuntimeError: If the analysis queue has no room for a refresh.
+    """
+    if cache_key not in IN_FLIGHT and not _has_capacity():
+        raise RuntimeError("analysis queue is full")
+    await asyncio.shield(
+        _start_once(cache_key, lambda: _analyze_company(company, cache_key))
+    )
+
+PREFETCHER = PrefetchScheduler(_prefetch_company, NEWS_CACHE.age, CACHE_EXPIRY)
+
+async def _sweep_cache_periodically():
+    """
+    Purge expired cache entries every ``CACHE_SWEEP_INTERVAL`` seconds.
+    """
+    while True:
+        await asyncio.sleep(CACHE_SWEEP_INTERVAL)
+        NEWS_CACHE.sweep()
+        if DISK_CACHE is not None:
+            await asyncio.to_thread(DISK_CACHE.sweep)
+
+@app.get("/ready")
+async def ready():
+    """
+    Readiness probe: succeeds once the models have been warmed up.
+
+    Returns:
+        JSONResponse: Warmup state, with status 503 until ready.
+    """
+    body = {
+        "status": "ready" if WARMUP_STATE["ready"] else "warming",
+        "uptime_seconds": round(time.time() - STARTED_AT, 3),
+        **WARMUP_STATE
+    }
+    if WARMUP_STATE["error"] is not None:
+        body["status"] = "failed"
+    return JSONResponse(body, status_code=200 if WARMUP_STATE["ready"] else 503)
+
+def _warm_up() -> None:
+    """
+    Import the news extractor and warm the sentiment model.
+    """
+    start = time.perf_counter()
+    try:
+        import news_extractor  # noqa: F401
+
+        POOLS.warm_up()
+    except Exception as e:
+        print(f"Error warming up models: {str(e)}")
+        WARMUP_STATE["error"] = str(e)
+        return
+    WARMUP_STATE["seconds"] = round(time.perf_counter() - start, 3)
+    WARMUP_STATE["ready"] = True
 
 @app.on_event("startup")
+async def start_background_tasks():
+    """
+    Start the background cache sweeper, prefetcher and model warmup.
+    """
+    POOLS.install_io_pool(asyncio.get_running_loop())
+    NEWS_CACHE.sweep()
+    app.state.cache_sweeper = asyncio.create_task(_sweep_cache_periodically())
+    app.state.prefetcher = asyncio.create_task(PREFETCHER.run())
+    app.state.warmup = asyncio.create_task(asyncio.to_thread(_warm_up))
+
 @app.on_event("shutdown")
 async def cleanup_cache():
     """
-    Clean expired cache entries periodically.
+    Stop background tasks and worker pools and clean expired cache entries.
     """
-    current_time = time.time()
-    expired_keys = [
-        key for key, value in NEWS_CACHE.items()
-        if (current_time - value["timestamp"]) >= CACHE_EXPIRY
-    ]
-    for key in expired_keys:
-        del NEWS_CACHE[key]
+    for name in ("cache_sweeper", "prefetcher"):
+        task = getattr(app.state, name, None)
+        if task is not None:
+            task.cancel()
+    NEWS_CACHE.sweep()
+    POOLS.shutdown()
 
 # Add this to make the app runnable with uvicorn directly
 if __name__ == "__main__":
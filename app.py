@@ -1,23 +1,38 @@
+import html
 import os
 import threading
-import matplotlib.pyplot as plt
-import pandas as pd
+import time
 import plotly.express as px
 import plotly.graph_objs as go
-import requests
 import streamlit as st
 import uvicorn
-from backendapis import app
 from collections import Counter
 import re
-import base64
+
+from service import HttpNewsService, NewsService
+
+# "inprocess" runs the pipeline inside Streamlit; "http" calls an API server.
+# Setting NEWS_API_URL selects a remote server, otherwise one is started locally.
+BACKEND_MODE = os.environ.get("NEWS_BACKEND_MODE", "inprocess")
+API_BASE_URL = os.environ.get("NEWS_API_URL", "http://127.0.0.1:8026")
+SESSION_CACHE_TTL = 60 * 15  # Matches the API's CACHE_EXPIRY
+ARTICLES_PAGE_SIZE = 10  # Article cards fetched and rendered at a time
+
+SENTIMENT_BADGE_CLASSES = {'Positive': 'sentiment-positive', 'Neutral': 'sentiment-neutral'}
+STOP_WORDS = set(['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'])
 
 def run_fastapi() -> None:
-    uvicorn.run(app, host="127.0.0.1", port=8026)
+    uvicorn.run("api:app", host="127.0.0.1", port=8026)
 
-# Start FastAPI server in a background thread
-BACKEND_THREAD = threading.Thread(target=run_fastapi, daemon=True)
-BACKEND_THREAD.start()
+@st.cache_resource
+def get_backend():
+    """Create the backend once per Streamlit server, not on every rerun."""
+    if BACKEND_MODE == "http":
+        if "NEWS_API_URL" not in os.environ:
+            # Start FastAPI server in a background thread
+            threading.Thread(target=run_fastapi, daemon=True).start()
+        return HttpNewsService(API_BASE_URL)
+    return NewsService()
 
 # Configure page settings
 st.set_page_config(
@@ -83,8 +98,10 @@ body {
 </style>
 """, unsafe_allow_html=True)
 
-# Set up API base URL
-API_BASE_URL = "http://127.0.0.1:8026"
+# Set up the analysis backend and per-session result cache
+backend = get_backend()
+if 'results' not in st.session_state:
+    st.session_state.results = {}
 
 # Function to convert company name with spaces to underscore format
 def format_company_name(name):
@@ -94,6 +111,53 @@ def format_company_name(name):
     formatted_name = cleaned_name.strip().replace(' ', '_')
     return formatted_name
 
+def render_article_cards(articles):
+    """Build the HTML for a page of article cards, two per row, for a single render call."""
+    cards = []
+    for article in articles:
+        sentiment_badge_class = SENTIMENT_BADGE_CLASSES.get(article['Sentiment'], 'sentiment-negative')
+        cards.append(
+            '<div class="col-md-6 mb-4"><div class="card article-card h-100">'
+            '<div class="card-body d-flex flex-column">'
+            f'<h5 class="card-title"><a href="{html.escape(article.get("Link", ""))}" target="_blank">'
+            f'{html.escape(article["Title"])}</a></h5>'
+            f'<p class="card-text flex-grow-1">{html.escape(article["Summary"])}</p>'
+            f'<p class="card-text"><small class="text-muted">{html.escape(article.get("Source", ""))}</small></p>'
+            '<div class="mt-auto">'
+            f'<span class="sentiment-badge {sentiment_badge_class}">{article["Sentiment"]} Sentiment</span>'
+            f'<p class="card-text mt-2"><small class="text-muted">Topics: {html.escape(", ".join(article["Topics"]))}</small></p>'
+            '</div></div></div></div>'
+        )
+    return "".join(
+        '<div class="row">' + "".join(cards[i:i + 2]) + '</div>'
+        for i in range(0, len(cards), 2)
+    )
+
+def add_article_page(cached, page):
+    """Render a page of articles once and count its keywords."""
+    articles = page.get("Articles", [])
+    cached["pages"].append(render_article_cards(articles))
+    cached["loaded"] += len(articles)
+    cached["keywords"].update(
+        word
+        for article in articles
+        for word in re.findall(r'\w+', (article.get("Summary") or "").lower())
+        if word not in STOP_WORDS
+    )
+    cached["next_cursor"] = page.get("Pagination", {}).get("Next Cursor")
+
+def load_more_articles(company):
+    """Fetch the next page of articles before the rerun that shows it."""
+    cached = st.session_state.results[company]
+    try:
+        add_article_page(
+            cached,
+            backend.get_news(company, limit=ARTICLES_PAGE_SIZE, cursor=cached["next_cursor"])
+        )
+        cached["error"] = None
+    except Exception as e:
+        cached["error"] = str(e)
+
 # Header Section
 st.markdown("""
 <div class="header">
@@ -128,165 +192,23 @@ if st.session_state.analyze_clicked and company_name:
 
     with st.spinner("Fetching news and analyzing sentiment..."):
         try:
-            response = requests.get(f"{API_BASE_URL}/news", params={"company": formatted_company_name})
-            if response.status_code == 200:
-                data = response.json()
-                
-                if not data.get("Articles"):
-                    st.warning(f"No significant news coverage found for {company_name}.")
-                else:
-                    df = pd.DataFrame(data["Articles"])
-                    sentiment_mapping = {"Positive": 1, "Neutral": 0, "Negative": -1}
-                    df["sentiment_score"] = df["Sentiment"].map(sentiment_mapping)
-                    
-                    sentiment_counts = df["Sentiment"].value_counts()
-                    total_articles = len(df)
-                    positive_percent = round((sentiment_counts.get("Positive", 0) / total_articles) * 100, 1)
-                    negative_percent = round((sentiment_counts.get("Negative", 0) / total_articles) * 100, 1)
-                    neutral_percent = round((sentiment_counts.get("Neutral", 0) / total_articles) * 100, 1)
-                    
-                    # Sentiment Overview
-                    st.markdown('<div class="container">', unsafe_allow_html=True)
-                    st.markdown('<h2>Sentiment Overview</h2>', unsafe_allow_html=True)
-                    fig_pie = px.pie(
-                        names=sentiment_counts.index, 
-                        values=sentiment_counts.values,
-                        color=sentiment_counts.index,
-                        color_discrete_map={
-                            "Positive": "#2ecc71", 
-                            "Neutral": "#95a5a6", 
-                            "Negative": "#e74c3c"
-                        },
-                        hole=0.3
-                    )
-                    st.plotly_chart(fig_pie, use_container_width=True)
-                    
-                    # Sentiment Analysis Summary
-                    st.markdown('<h2>Sentiment Analysis Summary</h2>', unsafe_allow_html=True)
-                    final_sentiment = data["Final Sentiment Analysis"]
-                    st.write(final_sentiment)
-                    
-                    # Stock Recommendation
-                    st.markdown('<h2>Stock Recommendation</h2>', unsafe_allow_html=True)
-                    stock_rec_fig = px.line(
-                        x=['🟢Buy', '🟡Hold', '🔴Sell'], 
-                        y=[positive_percent, neutral_percent, negative_percent],
-                        markers=True,
-                        labels={'x': 'Recommendation', 'y': 'Percentage'},
-                        title='Stock Recommendation Trend'
-                    )
-                    stock_rec_fig.update_traces(line=dict(color='#3498db'))
-                    st.plotly_chart(stock_rec_fig, use_container_width=True)
-                    
-                    # Audio Summary
-                    st.markdown('<h2>Audio Summary</h2>', unsafe_allow_html=True)
-                    st.markdown('<div class="container audio-container">', unsafe_allow_html=True)
-                    audio_base64 = data.get('AudioBase64', '')
-                    if audio_base64:
-                        # Decode base64 audio
-                        audio_bytes = base64.b64decode(audio_base64)
-                        
-                        # Display audio player
-                        st.audio(audio_bytes, format='audio/mp3')
-                    else:
-                        st.warning("Audio summary not available.")
-                    st.markdown('</div>', unsafe_allow_html=True)
-                    
-                    # News Articles with Bootstrap Cards
-                    st.markdown('<h2>News Articles</h2>', unsafe_allow_html=True)
-                    
-                    # Ensure we always have an even number of articles
-                    articles = data["Articles"]
-                    if len(articles) % 2 != 0:
-                        articles.append(None)  # Add a None to make it even
-                    
-                    # Create rows with 2 cards each
-                    for i in range(0, len(articles), 2):
-                        st.markdown('<div class="row">', unsafe_allow_html=True)
-                        
-                        # First card in the row
-                        if articles[i] is not None:
-                            article = articles[i]
-                            # Determine sentiment badge class
-                            if article['Sentiment'] == 'Positive':
-                                sentiment_badge_class = 'sentiment-positive'
-                            elif article['Sentiment'] == 'Neutral':
-                                sentiment_badge_class = 'sentiment-neutral'
-                            else:
-                                sentiment_badge_class = 'sentiment-negative'
-                            
-                            st.markdown(f'''
-                            <div class="col-md-6 mb-4">
-                                <div class="card article-card h-100">
-                                    <div class="card-body d-flex flex-column">
-                                        <h5 class="card-title">{article['Title']}</h5>
-                                        <p class="card-text flex-grow-1">{article['Summary']}</p>
-                                        <div class="mt-auto">
-                                            <span class="sentiment-badge {sentiment_badge_class}">
-                                                {article['Sentiment']} Sentiment
-                                            </span>
-                                            <p class="card-text mt-2">
-                                                <small class="text-muted">Topics: {', '.join(article['Topics'])}</small>
-                                            </p>
-                                        </div>
-                                    </div>
-                                </div>
-                            </div>
-                            ''', unsafe_allow_html=True)
-                        
-                        # Second card in the row
-                        if articles[i+1] is not None:
-                            article = articles[i+1]
-                            # Determine sentiment badge class
-                            if article['Sentiment'] == 'Positive':
-                                sentiment_badge_class = 'sentiment-positive'
-                            elif article['Sentiment'] == 'Neutral':
-                                sentiment_badge_class = 'sentiment-neutral'
-                            else:
-                                sentiment_badge_class = 'sentiment-negative'
-                            
-                            st.markdown(f'''
-                            <div class="col-md-6 mb-4">
-                                <div class="card article-card h-100">
-                                    <div class="card-body d-flex flex-column">
-                                        <h5 class="card-title">{article['Title']}</h5>
-                                        <p class="card-text flex-grow-1">{article['Summary']}</p>
-                                        <div class="mt-auto">
-                                            <span class="sentiment-badge {sentiment_badge_class}">
-                                                {article['Sentiment']} Sentiment
-                                            </span>
-                                            <p class="card-text mt-2">
-                                                <small class="text-muted">Topics: {', '.join(article['Topics'])}</small>
-                                            </p>
-                                        </div>
-                                    </div>
-                                </div>
-                            </div>
-                            ''', unsafe_allow_html=True)
-                        
-                        st.markdown('</div>', unsafe_allow_html=True)
-                    
-                    # Common Keywords
-                    st.markdown('<h2>Common Keywords in Articles</h2>', unsafe_allow_html=True)
-                    text = " ".join(article for article in df["Summary"].fillna("") if article)
-                    if text.strip():
-                        words = re.findall(r'\w+', text.lower())
-                        stop_words = set(['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'])
-                        filtered_words = [word for word in words if word not in stop_words]
-                        word_counts = Counter(filtered_words)
-                        top_words = dict(sorted(word_counts.items(), key=lambda x: x[1], reverse=True)[:10])
-                        
-                        fig_bar = go.Figure(data=[
-                            go.Bar(x=list(top_words.keys()), y=list(top_words.values()), marker_color='#3498db')
-                        ])
-                        fig_bar.update_layout(xaxis_title='Words', yaxis_title='Frequency')
-                        st.plotly_chart(fig_bar, use_container_width=True)
-                    else:
-                        st.info("No descriptions available to generate a word cloud.")
-                    
-                    st.markdown('</div>', unsafe_allow_html=True)
-            else:
-                st.error(f"Failed to fetch data: {response.status_code}")
+            cached = st.session_state.results.get(formatted_company_name)
+            if cached is None or time.time() - cached["timestamp"] >= SESSION_CACHE_TTL:
+                # Only the first page of articles is fetched up front
+                first_page = backend.get_news(formatted_company_name, limit=ARTICLES_PAGE_SIZE)
+                cached = {
+                    "data": first_page,
+                    "pages": [],
+                    "loaded": 0,
+                    "keywords": Counter(),
+                    "next_cursor": None,
+                    "error": None,
+                    "audio": None,
+                    "timestamp": time.time()
+                }
+                add_article_page(cached, first_page)
+                st.session_state.results[formatted_company_name] = cached
+            st.session_state.current_company = formatted_company_name
         except Exception as e:
             st.error(f"An error occurred: {e}")
 elif st.session_state.analyze_clicked:
@@ -294,6 +216,100 @@ elif st.session_state.analyze_clicked:
     # Reset the flag
     st.session_state.analyze_clicked = False
 
+# Show the current company until another one is analyzed
+current_company = st.session_state.get("current_company")
+if current_company in st.session_state.results:
+    cached = st.session_state.results[current_company]
+    data = cached["data"]
+    try:
+        # Aggregates cover every article, not just the pages loaded so far
+        sentiment_counts = data["Comparative Sentiment Score"]["Sentiment Distribution"]
+        total_articles = data.get("Pagination", {}).get("Total Articles", len(data["Articles"]))
+
+        if not total_articles:
+            st.warning(f"No significant news coverage found for {data['Company']}.")
+        else:
+            counted = sum(sentiment_counts.values()) or 1
+            positive_percent = round((sentiment_counts.get("Positive", 0) / counted) * 100, 1)
+            negative_percent = round((sentiment_counts.get("Negative", 0) / counted) * 100, 1)
+            neutral_percent = round((sentiment_counts.get("Neutral", 0) / counted) * 100, 1)
+            labels = [label for label, count in sentiment_counts.items() if count]
+
+            # Sentiment Overview
+            st.markdown('<div class="container">', unsafe_allow_html=True)
+            st.markdown('<h2>Sentiment Overview</h2>', unsafe_allow_html=True)
+            fig_pie = px.pie(
+                names=labels, 
+                values=[sentiment_counts[label] for label in labels],
+                color=labels,
+                color_discrete_map={
+                    "Positive": "#2ecc71", 
+                    "Neutral": "#95a5a6", 
+                    "Negative": "#e74c3c"
+                },
+                hole=0.3
+            )
+            st.plotly_chart(fig_pie, use_container_width=True)
+
+            # Sentiment Analysis Summary
+            st.markdown('<h2>Sentiment Analysis Summary</h2>', unsafe_allow_html=True)
+            final_sentiment = data["Final Sentiment Analysis"]
+            st.write(final_sentiment)
+
+            # Stock Recommendation
+            st.markdown('<h2>Stock Recommendation</h2>', unsafe_allow_html=True)
+            stock_rec_fig = px.line(
+                x=['🟢Buy', '🟡Hold', '🔴Sell'], 
+                y=[positive_percent, neutral_percent, negative_percent],
+                markers=True,
+                labels={'x': 'Recommendation', 'y': 'Percentage'},
+                title='Stock Recommendation Trend'
+            )
+            stock_rec_fig.update_traces(line=dict(color='#3498db'))
+            st.plotly_chart(stock_rec_fig, use_container_width=True)
+
+            # Audio Summary
+            st.markdown('<h2>Audio Summary</h2>', unsafe_allow_html=True)
+            st.markdown('<div class="container audio-container">', unsafe_allow_html=True)
+            if cached["audio"] is None and data.get('Audio'):
+                cached["audio"] = backend.get_audio(current_company)
+            if cached["audio"]:
+                # Display audio player
+                st.audio(cached["audio"], format='audio/mp3')
+            else:
+                st.warning("Audio summary not available.")
+            st.markdown('</div>', unsafe_allow_html=True)
+
+            # News Articles, one pre-rendered HTML block per loaded page
+            st.markdown('<h2>News Articles</h2>', unsafe_allow_html=True)
+            for page_html in cached["pages"]:
+                st.markdown(page_html, unsafe_allow_html=True)
+            if cached["error"]:
+                st.warning(f"Could not load more articles: {cached['error']}")
+            if cached["next_cursor"]:
+                st.button(
+                    f"Load more articles ({cached['loaded']} of {total_articles} shown)",
+                    on_click=load_more_articles,
+                    args=(current_company,)
+                )
+
+            # Common Keywords
+            st.markdown('<h2>Common Keywords in Articles</h2>', unsafe_allow_html=True)
+            if cached["keywords"]:
+                top_words = dict(cached["keywords"].most_common(10))
+
+                fig_bar = go.Figure(data=[
+                    go.Bar(x=list(top_words.keys()), y=list(top_words.values()), marker_color='#3498db')
+                ])
+                fig_bar.update_layout(xaxis_title='Words', yaxis_title='Frequency')
+                st.plotly_chart(fig_bar, use_container_width=True)
+            else:
+                st.info("No descriptions available to generate a word cloud.")
+
+            st.markdown('</div>', unsafe_allow_html=True)
+    except Exception as e:
+        st.error(f"An error occurred: {e}")
+
 # Footer
 st.markdown("""
 <div class="container">
@@ -0,0 +1,105 @@
+"""
+Compare dashboard click-to-data latency of the HTTP and in-process backends.
+
+A "click" is what the dashboard does per analysis: fetch the result, then
+the audio. Both backends are measured on a cold cache and on repeat clicks
+served from the API cache, with feeds, translation and TTS stubbed offline.
+
+Usage:
+    python benchmarks/bench_dashboard_backend.py --clicks 50
+"""
+import argparse
+import os
+import socket
+import statistics
+import threading
+import time
+
+from offline import install_offline_stubs, reset_caches
+
+os.environ.pop("NEWS_CACHE_DB", None)
+install_offline_stubs()
+
+import api
+import uvicorn
+from service import HttpNewsService, NewsService
+
+COMPANY = "tesla"
+
+def _click(backend) -> float:
+    """
+    Time one dashboard analysis.
+
+    Args:
+        backend: ``NewsService`` or ``HttpNewsService``.
+
+    Returns:
+        float: Latency in milliseconds.
+    """
+    start = time.perf_counter()
+    backend.get_news(COMPANY)
+    backend.get_audio(COMPANY)
+    return (time.perf_counter() - start) * 1000
+
+def _measure(backend, clicks: int) -> dict:
+    """
+    Measure a cold click followed by repeated warm clicks.
+
+    Args:
+        backend: ``NewsService`` or ``HttpNewsService``.
+        clicks (int): Number of warm clicks.
+
+    Returns:
+        dict: Cold latency and warm median/p95 in milliseconds.
+    """
+    reset_caches()
+    cold = _click(backend)
+    warm = sorted(_click(backend) for _ in range(clicks))
+    return {
+        "cold_ms": round(cold, 2),
+        "warm_p50_ms": round(statistics.median(warm), 3),
+        "warm_p95_ms": round(warm[int(len(warm) * 0.95) - 1], 3),
+    }
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def run_benchmark(clicks: int) -> dict:
+    """
+    Measure the HTTP backend against a local server, then the in-process one.
+
+    Args:
+        clicks (int): Number of warm clicks per backend.
+
+    Returns:
+        dict: Results keyed by backend mode.
+    """
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(api.app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+
+    results = {"http": _measure(HttpNewsService(f"http://127.0.0.1:{port}"), clicks)}
+    server.should_exit = True
+    thread.join()
+
+    results["inprocess"] = _measure(NewsService(), clicks)
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare dashboard backends.")
+    parser.add_argument("--clicks", type=int, default=50)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.clicks)
+    for mode, stats in results.items():
+        print(
+            f"{mode:<10} cold {stats['cold_ms']:>9.2f}ms  "
+            f"warm p50 {stats['warm_p50_ms']:>8.3f}ms  p95 {stats['warm_p95_ms']:>8.3f}ms"
+        )
+    speedup = results["http"]["warm_p50_ms"] / results["inprocess"]["warm_p50_ms"]
+    print(f"in-process warm clicks are {speedup:.1f}x faster")
@@ -0,0 +1,114 @@
+"""
+Compare /news response encodings by size and serialization time.
+
+The result for the recorded feed is encoded with the standard library JSON
+encoder, orjson and MessagePack, each uncompressed, gzipped and
+brotli-compressed, for the full result and a ``fields=`` subset. The
+memoized path a cache hit takes is timed separately, as is a repeat
+request revalidated with ``If-None-Match``.
+
+Usage:
+    python benchmarks/bench_encoding.py --repeats 200
+"""
+import argparse
+import json
+import os
+import time
+
+from offline import install_offline_stubs
+
+os.environ.pop("NEWS_CACHE_DB", None)
+install_offline_stubs()
+
+import api
+import encoding
+from cache import NewsCache
+from fastapi.testclient import TestClient
+
+FIELD_SUBSET = ["Sentiment Distribution", "Final Sentiment Analysis"]
+
+SERIALIZERS = {
+    "json": lambda data: json.dumps(data).encode("utf-8"),
+    "orjson": lambda data: encoding.serialize(data, encoding.JSON_MEDIA_TYPE),
+    "msgpack": lambda data: encoding.serialize(data, encoding.MSGPACK_MEDIA_TYPES[0]),
+}
+
+def _mean_ms(fn, repeats: int) -> float:
+    """
+    Mean latency of a call.
+
+    Args:
+        fn: Zero-argument callable.
+        repeats (int): Timed calls.
+
+    Returns:
+        float: Mean milliseconds per call.
+    """
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeats
+
+def run_benchmark(repeats: int) -> list:
+    """
+    Encode the result in every variant.
+
+    Args:
+        repeats (int): Timed encodings per variant.
+
+    Returns:
+        list: Rows of variant name, body bytes and encoding milliseconds.
+    """
+    with TestClient(api.app) as client:
+        response = client.get("/news", params={"company": "tesla"})
+        result = response.json()
+        revalidate = {"If-None-Match": response.headers["etag"]}
+
+        def _revalidate():
+            return client.get("/news", params={"company": "tesla"}, headers=revalidate)
+
+        assert _revalidate().status_code == 304
+        revalidated = (
+            "full/revalidated/304", len(_revalidate().content), _mean_ms(_revalidate, repeats)
+        )
+
+    payloads = {"full": result, "fields": encoding.select_fields(result, FIELD_SUBSET)}
+    rows = []
+    for payload_name, payload in payloads.items():
+        for serializer_name, serializer in SERIALIZERS.items():
+            if serializer_name == "msgpack" and encoding.msgpack is None:
+                continue
+            for coding in ("identity", "gzip", "br"):
+                if coding == "br" and encoding.brotli is None:
+                    continue
+
+                def _encode():
+                    return encoding.compress(serializer(payload), coding)[0]
+
+                rows.append((
+                    f"{payload_name}/{serializer_name}/{coding}",
+                    len(_encode()),
+                    _mean_ms(_encode, repeats),
+                ))
+
+    cache = NewsCache(ttl=3600)
+    cache.set("tesla", result)
+    cache.set_encoded(
+        "tesla", result, "br", *encoding.encode(result, encoding.JSON_MEDIA_TYPE, "br")
+    )
+    rows.append((
+        "full/cached/br",
+        len(cache.get_encoded("tesla", result, "br")[0]),
+        _mean_ms(lambda: cache.get_encoded("tesla", result, "br"), repeats),
+    ))
+    rows.append(revalidated)
+    return rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare /news response encodings.")
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'variant':<28}{'bytes':>10}{'encode ms':>12}")
+    for name, size, elapsed in run_benchmark(args.repeats):
+        print(f"{name:<28}{size:>10}{elapsed:>12.4f}")
@@ -0,0 +1,148 @@
+"""
+Benchmark cache refreshes against a local feed server.
+
+A stub server on ``127.0.0.1`` serves the recorded feed for every company
+and counts requests, TCP connections and body bytes of the pooled session.
+Downloads made by ``news_extractor.fetch_news`` itself are counted
+separately. Each company is analyzed once, then refreshed ``--cycles``
+times the way the stale-entry and prefetch paths refresh it:
+
+* ``unconditional``: full download and analysis on every refresh.
+* ``etag``: the server honours ETag / If-Modified-Since and answers 304.
+* ``hash``: the server ignores validators, so unchanged bodies are
+  detected by their digest.
+
+A final cycle publishes a changed feed to check that it is re-analyzed.
+
+Usage:
+    python benchmarks/bench_feeds.py --companies 20 --cycles 5
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from feed_server import StubFeedServer
+from offline import install_offline_stubs, load_feed_fixture
+
+os.environ.pop("NEWS_CACHE_DB", None)
+install_offline_stubs()
+
+async def _refresh_cycles(api, server, companies: list, cycles: int, conditional: bool) -> dict:
+    """
+    Analyze each company, then refresh every company repeatedly.
+
+    Args:
+        api: The imported ``api`` module.
+        server (StubFeedServer): Running feed server.
+        companies (list): Company names.
+        cycles (int): Refresh passes after the initial analysis.
+        conditional (bool): Refresh through ``_analyze_company`` (which
+            revalidates the feed) instead of forcing a full analysis.
+
+    Returns:
+        dict: Server counters, analyses run and mean seconds per refresh.
+    """
+    import news_extractor
+    from feeds import FeedFetcher
+
+    api.NEWS_CACHE.clear()
+    api.FEEDS = FeedFetcher(host_interval=0)
+    builds = []
+    downloads = []
+    build_result = api._build_result
+    fetch_news = news_extractor.fetch_news
+
+    def _counting_fetch(company, *args, **kwargs):
+        downloads.append(company)
+        return fetch_news(company, *args, **kwargs)
+
+    async def _counting_build(company, cache_key, articles, *args, **kwargs):
+        builds.append(cache_key)
+        return await build_result(company, cache_key, articles, *args, **kwargs)
+
+    async def _refresh(company: str) -> None:
+        cache_key = company.lower()
+        if conditional:
+            await api._analyze_company(company, cache_key)
+        else:
+            articles, feed = await api._fetch_articles(company)
+            await api._build_result(company, cache_key, articles, feed=feed)
+
+    api._build_result = _counting_build
+    news_extractor.fetch_news = _counting_fetch
+    try:
+        await asyncio.gather(*(_refresh(company) for company in companies))
+        requests, connections, sent = server.requests, server.connections, server.bytes_sent
+        analyses, extractor_downloads = len(builds), len(downloads)
+
+        start = time.perf_counter()
+        for _ in range(cycles):
+            await asyncio.gather(*(_refresh(company) for company in companies))
+        elapsed = time.perf_counter() - start
+
+        refreshes = cycles * len(companies)
+        result = {
+            "requests": server.requests - requests,
+            "not_modified": server.not_modified,
+            "new_connections": server.connections - connections,
+            "bytes": server.bytes_sent - sent,
+            "extractor_downloads": len(downloads) - extractor_downloads,
+            "analyses": len(builds) - analyses,
+            "ms_per_refresh": round(elapsed / refreshes * 1000, 3),
+        }
+
+        # A changed feed must still be analyzed
+        server.set_body(server.body.replace(b"</channel>", b"<!-- updated --></channel>"))
+        before = len(builds)
+        await _refresh(companies[0])
+        result["reanalyzed_after_change"] = len(builds) - before == 1
+        return result
+    finally:
+        api._build_result = build_result
+        news_extractor.fetch_news = fetch_news
+
+def run_benchmark(companies: int, cycles: int) -> dict:
+    """
+    Compare refresh modes, each against a fresh feed server.
+
+    Args:
+        companies (int): Number of companies.
+        cycles (int): Refresh passes per mode.
+
+    Returns:
+        dict: Results keyed by mode.
+    """
+    body = load_feed_fixture()
+    names = [f"company-{i}" for i in range(companies)]
+    results = {}
+    api = None
+    for mode, validators, conditional in (
+            ("unconditional", True, False), ("etag", True, True), ("hash", False, True)):
+        with StubFeedServer(body, validators=validators) as server:
+            os.environ["NEWS_FEED_URL"] = server.url + "/rss/search?q={query}"
+            if api is None:
+                import api
+                api.POOLS.warm_up()
+            import feeds
+            feeds.FEED_URL_TEMPLATE = os.environ["NEWS_FEED_URL"]
+            results[mode] = asyncio.run(
+                _refresh_cycles(api, server, names, cycles, conditional)
+            )
+    api.POOLS.shutdown()
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark conditional feed refreshes.")
+    parser.add_argument("--companies", type=int, default=20)
+    parser.add_argument("--cycles", type=int, default=5)
+    args = parser.parse_args()
+
+    for mode, result in run_benchmark(args.companies, args.cycles).items():
+        print(
+            f"{mode:<14} requests {result['requests']:>4}  304s {result['not_modified']:>4}  "
+            f"new connections {result['new_connections']:>3}  bytes {result['bytes']:>9}  "
+            f"extractor downloads {result['extractor_downloads']:>4}  "
+            f"analyses {result['analyses']:>4}  {result['ms_per_refresh']:.2f} ms/refresh  "
+            f"re-analyzed after change: {result['reanalyzed_after_change']}"
+        )
@@ -0,0 +1,99 @@
+"""
+Benchmark sentiment history queries over months of records.
+
+Writes one record every ``--interval`` seconds for ``--days`` days for each
+of ``--companies`` companies into a temporary directory, then times
+``/news/{company}/history``-style queries over random ranges.
+
+Usage:
+    python benchmarks/bench_history.py --companies 300 --days 90
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+import offline  # noqa: F401  (puts the repository on sys.path)
+from history import RECORD_DTYPE, SentimentHistory
+
+def _populate(history: SentimentHistory, companies: int, days: int, interval: float) -> int:
+    """
+    Write synthetic history files in bulk.
+
+    Args:
+        history (SentimentHistory): Store to fill.
+        companies (int): Number of companies.
+        days (int): Days of history per company.
+        interval (float): Seconds between records.
+
+    Returns:
+        int: Records written per company.
+    """
+    rng = np.random.default_rng(0)
+    end = time.time()
+    timestamps = np.arange(end - days * 86400, end, interval)
+    for i in range(companies):
+        cache_key = f"company-{i}"
+        records = np.zeros(len(timestamps), dtype=RECORD_DTYPE)
+        records["timestamp"] = timestamps
+        records["company_id"] = history.company_id(cache_key)
+        counts = rng.integers(0, 10, size=(len(timestamps), 3))
+        records["positive"], records["negative"], records["neutral"] = counts.T
+        records["dominant"] = counts.argmax(axis=1)
+        records.tofile(history._path(cache_key))
+    return len(timestamps)
+
+def run_benchmark(companies: int, days: int, interval: float, queries: int) -> dict:
+    """
+    Time random range queries against a populated store.
+
+    Args:
+        companies (int): Number of companies.
+        days (int): Days of history per company.
+        interval (float): Seconds between records.
+        queries (int): Number of timed queries.
+
+    Returns:
+        dict: Store size and query latency percentiles.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        history = SentimentHistory(directory)
+        per_company = _populate(history, companies, days, interval)
+        size = sum(entry.stat().st_size for entry in os.scandir(directory))
+
+        rng = random.Random(0)
+        now = time.time()
+        samples = []
+        for _ in range(queries):
+            start = now - rng.uniform(0, days) * 86400
+            end = rng.uniform(start, now)
+            cache_key = f"company-{rng.randrange(companies)}"
+            begin = time.perf_counter()
+            history.query(cache_key, start, end, points=200)
+            samples.append((time.perf_counter() - begin) * 1000)
+
+    samples.sort()
+    return {
+        "records": per_company * companies,
+        "bytes": size,
+        "p50_ms": statistics.median(samples),
+        "p99_ms": samples[int(len(samples) * 0.99) - 1],
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark sentiment history queries.")
+    parser.add_argument("--companies", type=int, default=300)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--interval", type=float, default=900.0, help="Seconds between records")
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+
+    result = run_benchmark(args.companies, args.days, args.interval, args.queries)
+    print(
+        f"{result['records']} records, {result['bytes'] / 1e6:.1f} MB on disk  "
+        f"query p50 {result['p50_ms']:.3f}ms  p99 {result['p99_ms']:.3f}ms"
+    )
@@ -0,0 +1,156 @@
+"""
+Load test: cache-hit latency while cache misses are being analyzed.
+
+Each configuration runs in a fresh interpreter with its own
+``NEWS_CPU_WORKERS`` setting. A company is analyzed once so it is cached,
+then cache hits are timed alone and again while a burst of misses for
+distinct companies is analyzed. Feeds are synthetic and offline, so misses
+exercise the sentiment model on new articles. Misses beyond
+``NEWS_MAX_PENDING_ANALYSES`` are refused with 503 and counted.
+
+Usage:
+    python benchmarks/bench_load.py --workers 0 2 --misses 32 --hits 200
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+import zlib
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def _percentiles(samples: list) -> dict:
+    """
+    Summarize latencies.
+
+    Args:
+        samples (list): Latencies in seconds.
+
+    Returns:
+        dict: p50, p95 and p99 in milliseconds.
+    """
+    ordered = sorted(samples)
+    return {
+        f"p{percent}_ms": round(ordered[max(0, -(-len(ordered) * percent // 100) - 1)] * 1000, 3)
+        for percent in (50, 95, 99)
+    }
+
+async def _time_hits(client, count: int, stop: asyncio.Event = None) -> list:
+    """
+    Time sequential cache hits.
+
+    Args:
+        client: ``httpx.AsyncClient`` bound to the app.
+        count (int): Minimum number of requests.
+        stop (asyncio.Event): Keep going until set, if given.
+
+    Returns:
+        list: Latencies in seconds.
+    """
+    samples = []
+    while len(samples) < count or (stop is not None and not stop.is_set()):
+        start = time.perf_counter()
+        response = await client.get("/news", params={"company": "tesla"})
+        response.raise_for_status()
+        samples.append(time.perf_counter() - start)
+        await asyncio.sleep(0)  # Cached responses never suspend, so let the misses run
+    return samples
+
+async def _run(misses: int, hits: int) -> dict:
+    """
+    Measure one configuration in this interpreter.
+
+    Args:
+        misses (int): Concurrent cache misses in the burst.
+        hits (int): Cache hits timed per phase.
+
+    Returns:
+        dict: Hit latency alone and under load, and miss outcomes.
+    """
+    import httpx
+    import api
+    from offline import synthetic_articles
+
+    api._fetch_news = lambda company, conditional=False: (
+        synthetic_articles(20, seed=zlib.crc32(company.encode())), None
+    )
+    await api.start_background_tasks()
+    await api.app.state.warmup
+
+    transport = httpx.ASGITransport(app=api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        (await client.get("/news", params={"company": "tesla"})).raise_for_status()
+        idle = await _time_hits(client, hits)
+
+        stop = asyncio.Event()
+
+        async def _miss(i: int) -> int:
+            response = await client.get("/news", params={"company": f"company-{i}"})
+            return response.status_code
+
+        start = time.perf_counter()
+        burst = asyncio.gather(*(_miss(i) for i in range(misses)))
+        burst.add_done_callback(lambda _: stop.set())
+        loaded = await _time_hits(client, hits, stop)
+        statuses = await burst
+        burst_seconds = time.perf_counter() - start
+
+    await api.cleanup_cache()
+    return {
+        "hits_idle": _percentiles(idle),
+        "hits_under_load": {**_percentiles(loaded), "count": len(loaded)},
+        "misses_ok": statuses.count(200),
+        "misses_rejected": statuses.count(503),
+        "burst_s": round(burst_seconds, 3),
+    }
+
+def run_benchmark(workers: list, misses: int, hits: int) -> dict:
+    """
+    Measure each worker configuration in a new interpreter.
+
+    Args:
+        workers (list): ``NEWS_CPU_WORKERS`` values to compare.
+        misses (int): Concurrent cache misses in the burst.
+        hits (int): Cache hits timed per phase.
+
+    Returns:
+        dict: Results keyed by worker count.
+    """
+    results = {}
+    for count in workers:
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child",
+             "--misses", str(misses), "--hits", str(hits)],
+            check=True, capture_output=True, text=True,
+            env={**os.environ, "NEWS_CPU_WORKERS": str(count)}
+        ).stdout
+        results[count] = json.loads(output.strip().splitlines()[-1])
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test cache hits during misses.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 2])
+    parser.add_argument("--misses", type=int, default=32)
+    parser.add_argument("--hits", type=int, default=200)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        sys.path.insert(0, BENCH_DIR)
+        os.environ.pop("NEWS_CACHE_DB", None)
+        from offline import install_offline_stubs
+
+        install_offline_stubs()
+        print(json.dumps(asyncio.run(_run(args.misses, args.hits))))
+    else:
+        for count, result in run_benchmark(args.workers, args.misses, args.hits).items():
+            idle, loaded = result["hits_idle"], result["hits_under_load"]
+            print(
+                f"workers={count:<3} hit p50/p99 idle {idle['p50_ms']:.2f}/{idle['p99_ms']:.2f}ms  "
+                f"under load {loaded['p50_ms']:.2f}/{loaded['p99_ms']:.2f}ms  "
+                f"misses ok {result['misses_ok']} rejected {result['misses_rejected']} "
+                f"in {result['burst_s']:.2f}s"
+            )
@@ -0,0 +1,101 @@
+"""
+Benchmark per-article sentiment inference on raw and normalized summaries.
+
+Articles come from the recorded RSS fixture. Each run scores the raw
+Google News HTML summaries, then the same articles after
+``normalize_articles`` and token-budget truncation, and reports input size
+and inference time per article.
+
+Usage:
+    python benchmarks/bench_normalize.py --repeats 5
+"""
+import argparse
+import copy
+import statistics
+import time
+
+from offline import load_feed_fixture
+
+import feedparser
+import utils
+
+def _fixture_articles() -> list:
+    """
+    Parse the recorded feed into articles shaped like ``fetch_news`` output.
+
+    Returns:
+        list: Articles with title, summary, link and topics.
+    """
+    feed = feedparser.parse(load_feed_fixture())
+    return [
+        {"title": entry.title, "summary": entry.summary, "link": "", "topics": []}
+        for entry in feed.entries
+    ]
+
+def _time_inference(texts: list, repeats: int) -> float:
+    """
+    Median time to score every text once, bypassing all memo caches.
+
+    Args:
+        texts (list): Model inputs.
+        repeats (int): Timed runs.
+
+    Returns:
+        float: Median milliseconds per article.
+    """
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        utils.analyze_sentiment_batch(texts)
+        samples.append((time.perf_counter() - start) * 1000 / len(texts))
+    return statistics.median(samples)
+
+def run_benchmark(repeats: int) -> dict:
+    """
+    Compare raw and normalized model inputs.
+
+    Args:
+        repeats (int): Timed runs per input set.
+
+    Returns:
+        dict: Characters and inference milliseconds per article for each
+            input set, and the normalization cost per article.
+    """
+    raw = _fixture_articles()
+    utils.analyze_sentiment_batch(["warm up the sentiment model"])
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        normalized = utils.normalize_articles(copy.deepcopy(raw))
+    normalize_ms = (time.perf_counter() - start) * 1000 / (repeats * len(raw))
+
+    inputs = {
+        "raw": [article["summary"] for article in raw],
+        "normalized": [utils.truncate_tokens(article["summary"]) for article in normalized],
+    }
+    return {
+        "normalize_ms": round(normalize_ms, 4),
+        **{
+            name: {
+                "chars": round(sum(map(len, texts)) / len(texts), 1),
+                "inference_ms": round(_time_inference(texts, repeats), 3),
+            }
+            for name, texts in inputs.items()
+        },
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark summary normalization.")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.repeats)
+    print(f"normalization    {results['normalize_ms']:>9.4f}ms/article")
+    for name in ("raw", "normalized"):
+        stats = results[name]
+        print(
+            f"{name:<16} {stats['chars']:>7.1f} chars  "
+            f"{stats['inference_ms']:>9.3f}ms/article"
+        )
+    speedup = results["raw"]["inference_ms"] / results["normalized"]["inference_ms"]
+    print(f"normalized inference is {speedup:.1f}x faster")
@@ -0,0 +1,214 @@
+"""
+Offline benchmark of the news analysis pipeline.
+
+Feeds come from recorded RSS fixtures and translation/TTS from local stubs,
+so no network is needed. Each stage reports throughput and p50/p95/p99
+latency; results can be written as JSON and compared against an earlier
+run to flag regressions.
+
+Usage:
+    python benchmarks/bench_pipeline.py --output new.json --baseline old.json
+"""
+import argparse
+import asyncio
+import copy
+import json
+import os
+import sys
+import time
+
+from offline import install_offline_stubs, reset_caches, synthetic_articles
+
+os.environ.pop("NEWS_CACHE_DB", None)  # Keep runs independent of local state
+install_offline_stubs()
+
+import api
+import utils
+from fastapi.testclient import TestClient
+from news_extractor import fetch_news
+
+ARTICLE_COUNTS = (10, 100, 1000)
+DEFAULT_REPEATS = 20
+DEFAULT_THRESHOLD = 0.2  # Flag a stage whose p50 grows by more than 20%
+MIN_DELTA_MS = 0.5  # Ignore sub-millisecond jitter on very fast stages
+
+def _percentile(samples: list, percent: float) -> float:
+    """
+    Nearest-rank percentile of a sample.
+
+    Args:
+        samples (list): Latencies in seconds.
+        percent (float): Percentile between 0 and 100.
+
+    Returns:
+        float: The percentile value.
+    """
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+def _summarize(samples: list, items: int = 1) -> dict:
+    """
+    Reduce latencies to throughput and percentile statistics.
+
+    Args:
+        samples (list): Latencies in seconds.
+        items (int): Items processed per sample.
+
+    Returns:
+        dict: Throughput in items/sec and latencies in milliseconds.
+    """
+    total = sum(samples)
+    return {
+        "items": items,
+        "runs": len(samples),
+        "throughput": round(items * len(samples) / total, 2) if total else None,
+        "p50_ms": round(_percentile(samples, 50) * 1000, 3),
+        "p95_ms": round(_percentile(samples, 95) * 1000, 3),
+        "p99_ms": round(_percentile(samples, 99) * 1000, 3),
+    }
+
+def _time(fn, repeats: int, setup=None) -> list:
+    """
+    Time repeated calls, running an untimed setup before each one.
+
+    Args:
+        fn: Callable receiving the setup's return value.
+        repeats (int): Number of timed calls.
+        setup: Optional zero-argument callable.
+
+    Returns:
+        list: Latencies in seconds.
+    """
+    samples = []
+    for _ in range(repeats):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        fn(arg)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+def run_benchmarks(repeats: int = DEFAULT_REPEATS) -> dict:
+    """
+    Benchmark each pipeline stage and the end-to-end API.
+
+    Args:
+        repeats (int): Timed runs per stage.
+
+    Returns:
+        dict: Statistics keyed by stage name.
+    """
+    results = {}
+    fetch_news("tesla")
+    utils.analyze_sentiment_batch(["warm up the sentiment model"])
+
+    results["fetch_news"] = _summarize(
+        _time(lambda _: fetch_news("tesla"), repeats)
+    )
+
+    for count in ARTICLE_COUNTS:
+        articles = synthetic_articles(count)
+        runs = max(3, repeats // (count // 10))
+
+        def _fresh_articles():
+            utils.ARTICLE_MEMO.clear()
+            return copy.deepcopy(articles)
+
+        results[f"normalize_articles[{count}]"] = _summarize(
+            _time(utils.normalize_articles, runs, lambda: copy.deepcopy(articles)),
+            count
+        )
+
+        results[f"process_articles[{count}]"] = _summarize(
+            _time(lambda batch: utils.process_articles(batch, "Tesla"), runs, _fresh_articles),
+            count
+        )
+
+        scored = [{**article, "sentiment": "Neutral"} for article in articles]
+        results[f"coverage_differences[{count}]"] = _summarize(
+            _time(lambda _: utils._generate_coverage_differences(scored), runs),
+            count
+        )
+
+    text = "Final Sentiment Analysis: Tesla's latest news coverage is mostly Negative."
+
+    def _clear_audio_memos():
+        utils.TRANSLATION_MEMO.clear()
+        utils.AUDIO_MEMO.clear()
+
+    results["generate_audio"] = _summarize(
+        _time(lambda _: asyncio.run(utils.generate_audio(text)), repeats, _clear_audio_memos)
+    )
+
+    with TestClient(api.app) as client:
+        results["api_news_cold"] = _summarize(_time(
+            lambda _: client.get("/news", params={"company": "tesla"}).raise_for_status(),
+            repeats,
+            reset_caches
+        ))
+        results["api_news_cached"] = _summarize(_time(
+            lambda _: client.get("/news", params={"company": "tesla"}).raise_for_status(),
+            repeats
+        ))
+        results["api_news_audio"] = _summarize(_time(
+            lambda _: client.get("/news/tesla/audio").raise_for_status(),
+            repeats
+        ))
+
+    return results
+
+def compare(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """
+    Find stages whose median latency regressed beyond a threshold.
+
+    Args:
+        current (dict): Results of this run.
+        baseline (dict): Results of an earlier run.
+        threshold (float): Allowed relative p50 increase.
+
+    Returns:
+        list: Descriptions of regressed stages.
+    """
+    regressions = []
+    for stage, stats in current.items():
+        previous = baseline.get(stage)
+        if not previous or not previous["p50_ms"]:
+            continue
+        change = stats["p50_ms"] / previous["p50_ms"] - 1
+        if change > threshold and stats["p50_ms"] - previous["p50_ms"] > MIN_DELTA_MS:
+            regressions.append(
+                f"{stage}: p50 {previous['p50_ms']}ms -> {stats['p50_ms']}ms (+{change:.0%})"
+            )
+    return regressions
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against this JSON file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.repeats)
+
+    print(f"{'stage':<28}{'items/s':>12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for stage, stats in results.items():
+        print(
+            f"{stage:<28}{stats['throughput'] or 0:>12.1f}"
+            f"{stats['p50_ms']:>10.3f}{stats['p95_ms']:>10.3f}{stats['p99_ms']:>10.3f}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            regressions = compare(results, json.load(baseline), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""Benchmark batched sentiment inference throughput on CPU."""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import analyze_sentiment_batch
+
+BATCH_SIZES = (1, 8, 32)
+NUM_ARTICLES = 64
+
+def _synthetic_summaries(count: int) -> list:
+    """
+    Build distinct article summaries so deduplication does not skew timings.
+
+    Args:
+        count (int): Number of summaries to build.
+
+    Returns:
+        list: Synthetic summaries.
+    """
+    templates = (
+        "Company {i} reports record quarterly profit as demand surges.",
+        "Regulators open probe into Company {i} after product recall.",
+        "Company {i} shares trade flat ahead of annual meeting.",
+    )
+    return [templates[i % len(templates)].format(i=i) for i in range(count)]
+
+def run_benchmark(num_articles: int = NUM_ARTICLES) -> dict:
+    """
+    Measure articles per second for each configured batch size.
+
+    Args:
+        num_articles (int): Number of articles scored per run.
+
+    Returns:
+        dict: Articles per second keyed by batch size.
+    """
+    texts = _synthetic_summaries(num_articles)
+    analyze_sentiment_batch(texts[:2], batch_size=2)  # Load the model first
+
+    results = {}
+    for batch_size in BATCH_SIZES:
+        start = time.perf_counter()
+        analyze_sentiment_batch(texts, batch_size=batch_size)
+        elapsed = time.perf_counter() - start
+        results[batch_size] = num_articles / elapsed if elapsed else float("inf")
+    return results
+
+if __name__ == "__main__":
+    for size, rate in run_benchmark().items():
+        print(f"batch_size={size:<3} {rate:10.1f} articles/sec")
@@ -0,0 +1,84 @@
+"""
+Benchmark cold-start time of the API.
+
+Each run starts a fresh interpreter and reports the time to import ``api``,
+to serve the first successful ``/news`` and for ``/ready`` to report the
+models as warm. Feeds, translation and TTS use the offline stubs.
+
+Usage:
+    python benchmarks/bench_startup.py --runs 5
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def _child() -> None:
+    """
+    Measure one cold start and print the timings as JSON.
+    """
+    start = time.perf_counter()
+    sys.path.insert(0, BENCH_DIR)
+    os.environ.pop("NEWS_CACHE_DB", None)
+    os.environ["NEWS_HISTORY_DIR"] = ""
+
+    from offline import install_offline_stubs
+    import api
+    imported = time.perf_counter()
+
+    install_offline_stubs()
+    from fastapi.testclient import TestClient
+
+    with TestClient(api.app) as client:
+        client.get("/news", params={"company": "tesla"}).raise_for_status()
+        first_news = time.perf_counter()
+        while client.get("/ready").status_code != 200:
+            if api.WARMUP_STATE["error"] is not None:
+                raise RuntimeError(api.WARMUP_STATE["error"])
+            time.sleep(0.01)
+        ready = time.perf_counter()
+
+    print(json.dumps({
+        "import_api_s": round(imported - start, 3),
+        "first_news_s": round(first_news - start, 3),
+        "ready_s": round(ready - start, 3),
+    }))
+
+def run_benchmark(runs: int) -> list:
+    """
+    Measure several cold starts, each in a new interpreter.
+
+    Args:
+        runs (int): Number of cold starts.
+
+    Returns:
+        list: Timings of each run.
+    """
+    results = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child"],
+            check=True, capture_output=True, text=True
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark API cold start.")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child()
+    else:
+        for result in run_benchmark(args.runs):
+            print(
+                f"import api {result['import_api_s']:.3f}s  "
+                f"first /news {result['first_news_s']:.3f}s  "
+                f"ready {result['ready_s']:.3f}s"
+            )
@@ -0,0 +1,81 @@
+"""
+Benchmark chunked TTS synthesis and backend fallback.
+
+The gTTS backend uses the offline stub with ``--latency`` seconds added per
+call to stand in for the remote service. Texts are synthesized with one
+chunk at a time and with parallel chunks, then with a failing remote
+backend to exercise the fallback to the local engine (skipped when
+``espeak-ng`` or ``lameenc`` is missing).
+
+Usage:
+    python benchmarks/bench_tts.py --sentences 12 --latency 0.15
+"""
+import argparse
+import asyncio
+import time
+
+from offline import install_offline_stubs
+
+install_offline_stubs()
+
+from tts import GTTSBackend, OfflineBackend, SpeechSynthesizer, split_sentences
+
+SENTENCE = "Tesla shares moved after the company reported quarterly deliveries."
+
+class RemoteGTTS(GTTSBackend):
+    """Stubbed gTTS with a fixed round trip per call."""
+
+    def __init__(self, latency: float, fail: bool = False):
+        self.latency = latency
+        self.fail = fail
+
+    def synthesize(self, text: str, lang: str) -> bytes:
+        time.sleep(self.latency)
+        if self.fail:
+            raise ConnectionError("remote TTS unavailable")
+        return super().synthesize(text, lang)
+
+def _time(synthesizer: SpeechSynthesizer, text: str) -> tuple:
+    start = time.perf_counter()
+    audio, _ = asyncio.run(synthesizer.synthesize(text, "en"))
+    return time.perf_counter() - start, len(audio)
+
+def run_benchmark(sentences: int, latency: float) -> dict:
+    """
+    Time synthesis of one text under each configuration.
+
+    Args:
+        sentences (int): Sentences in the text.
+        latency (float): Simulated seconds per remote call.
+
+    Returns:
+        dict: Seconds and MP3 bytes keyed by configuration.
+    """
+    text = " ".join([SENTENCE] * sentences)
+    results = {"chunks": len(split_sentences(text))}
+    for name, concurrency in (("sequential", 1), ("parallel", 4)):
+        results[name] = _time(
+            SpeechSynthesizer([RemoteGTTS(latency)], concurrency=concurrency), text
+        )
+
+    offline = OfflineBackend()
+    if offline.available():
+        synthesizer = SpeechSynthesizer([RemoteGTTS(latency, fail=True), offline])
+        results["fallback_to_offline"] = _time(synthesizer, text)
+        results["fallbacks"] = synthesizer.stats()["gtts"]["failures"]
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark chunked TTS synthesis.")
+    parser.add_argument("--sentences", type=int, default=12)
+    parser.add_argument("--latency", type=float, default=0.15)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sentences, args.latency)
+    print(f"{results['chunks']} chunks")
+    for name in ("sequential", "parallel", "fallback_to_offline"):
+        if name in results:
+            seconds, size = results[name]
+            print(f"{name:<20} {seconds * 1000:8.1f} ms  {size:>7} bytes")
+    if "fallbacks" not in results:
+        print("offline engine unavailable (needs espeak-ng and lameenc)")
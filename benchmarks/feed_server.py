@@ -0,0 +1,88 @@
+"""Local RSS server that counts requests, connections and bytes sent."""
+import hashlib
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class StubFeedServer:
+    """
+    Serves one feed body for every path on ``127.0.0.1``.
+
+    With ``validators`` enabled responses carry an ETag and Last-Modified
+    date and matching conditional requests get a 304. Without them every
+    request gets the full body, as from servers that ignore validators.
+    Use as a context manager to run it on a background thread.
+    """
+
+    def __init__(self, body: bytes, validators: bool = True):
+        self.validators = validators
+        self.requests = 0
+        self.not_modified = 0
+        self.connections = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self.set_body(body)
+
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep connections alive
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def do_GET(self):
+                body, etag, modified = server.body, server.etag, server.last_modified
+                if "If-None-Match" in self.headers:  # Takes precedence over the date
+                    fresh = self.headers["If-None-Match"] == etag
+                else:
+                    fresh = self.headers.get("If-Modified-Since") == modified
+                fresh = server.validators and fresh
+                with server._lock:
+                    server.requests += 1
+                    server.not_modified += fresh
+                    server.bytes_sent += 0 if fresh else len(body)
+
+                self.send_response(304 if fresh else 200)
+                self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
+                self.send_header("Content-Length", "0" if fresh else str(len(body)))
+                if server.validators:
+                    self.send_header("ETag", etag)
+                    self.send_header("Last-Modified", modified)
+                self.end_headers()
+                if not fresh:
+                    self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def set_body(self, body: bytes) -> None:
+        """
+        Replace the feed, as when new articles are published.
+
+        Args:
+            body (bytes): New feed XML.
+        """
+        self.body = body
+        self.etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        self.last_modified = formatdate(usegmt=True)
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,138 @@
+"""Offline fixtures and stubs shared by the benchmarks."""
+import os
+import random
+import sys
+import tempfile
+from io import BytesIO
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FEED_FIXTURE = os.path.join(FIXTURES_DIR, "google_news_tesla.xml")
+
+sys.path.insert(0, ROOT_DIR)
+
+# One MPEG-1 Layer III frame header followed by silence
+_MP3_FRAME = b"\xff\xfb\x90\x64" + b"\x00" * 413
+
+class StubTranslator:
+    """Local stand-in for ``deep_translator.GoogleTranslator``."""
+
+    def __init__(self, source: str = "auto", target: str = "en", **kwargs):
+        self.source = source
+        self.target = target
+
+    def translate(self, text: str) -> str:
+        return f"[{self.target}] {text}"
+
+class StubTTS:
+    """Local stand-in for ``gtts.gTTS`` writing one MP3 frame per word."""
+
+    def __init__(self, text: str, lang: str = "en", **kwargs):
+        self.text = text
+        self.lang = lang
+
+    def write_to_fp(self, fp: BytesIO) -> None:
+        fp.write(_MP3_FRAME * max(1, len(self.text.split())))
+
+def load_feed_fixture(path: str = FEED_FIXTURE) -> bytes:
+    """
+    Read a recorded RSS feed.
+
+    Args:
+        path (str): Fixture path.
+
+    Returns:
+        bytes: Raw feed XML.
+    """
+    with open(path, "rb") as fixture:
+        return fixture.read()
+
+def install_offline_stubs(feed_path: str = FEED_FIXTURE) -> None:
+    """
+    Route remote downloads to a fixture and replace translation and TTS.
+
+    Requests to localhost still go out, so local API servers can be called.
+
+    Must run before ``api`` or ``news_extractor`` is imported so that
+    modules binding ``feedparser.parse`` at import time see the stub.
+    Sentiment history is written to a temporary directory.
+
+    Args:
+        feed_path (str): Recorded feed served for every remote URL.
+    """
+    import feedparser
+    import requests
+
+    os.environ["NEWS_HISTORY_DIR"] = tempfile.mkdtemp(prefix="news-history-")
+    original_parse = feedparser.parse
+    original_request = requests.Session.request
+    feed_bytes = load_feed_fixture(feed_path)
+
+    def _parse(url_file_stream_or_string, *args, **kwargs):
+        if (isinstance(url_file_stream_or_string, str) and
+                url_file_stream_or_string.startswith(("http://", "https://"))):
+            url_file_stream_or_string = feed_bytes
+        return original_parse(url_file_stream_or_string, *args, **kwargs)
+
+    def _request(self, method, url, *args, **kwargs):
+        if url.startswith(("http://127.0.0.1", "http://localhost")):
+            return original_request(self, method, url, *args, **kwargs)
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = feed_bytes
+        response.headers["Content-Type"] = "application/rss+xml; charset=utf-8"
+        return response
+
+    feedparser.parse = _parse
+    requests.Session.request = _request
+
+    import deep_translator
+    import gtts
+    deep_translator.GoogleTranslator = StubTranslator
+    gtts.gTTS = StubTTS
+
+def reset_caches() -> None:
+    """
+    Empty every result and memo cache so each run takes the cold path.
+    """
+    import api
+    import utils
+
+    api.NEWS_CACHE.clear()
+    utils.ARTICLE_MEMO.clear()
+    utils.TRANSLATION_MEMO.clear()
+    utils.AUDIO_MEMO.clear()
+
+def synthetic_articles(count: int, seed: int = 0) -> list:
+    """
+    Build Google News shaped articles for scaling runs.
+
+    Args:
+        count (int): Number of articles.
+        seed (int): Random seed.
+
+    Returns:
+        list: Articles with title, summary, link and topics.
+    """
+    rng = random.Random(seed)
+    subjects = ["Tesla", "Cybertruck", "Model Y", "Musk", "Shares", "Regulators"]
+    verbs = ["recalls", "surges", "slumps", "unveils", "faces probe over", "beats forecasts on"]
+    objects = ["steel panels", "quarterly deliveries", "autopilot", "China sales", "charging network"]
+    outlets = ["CNBC", "Reuters", "Bloomberg", "The Verge", "CNN", "The Guardian"]
+
+    articles = []
+    for i in range(count):
+        headline = f"{rng.choice(subjects)} {rng.choice(verbs)} {rng.choice(objects)} ({i})"
+        outlet = rng.choice(outlets)
+        link = f"https://news.google.com/rss/articles/CBMi{i:08d}{rng.getrandbits(64):016x}?oc=5"
+        articles.append({
+            "title": f"{headline} - {outlet}",
+            "summary": (
+                f'<a href="{link}" target="_blank">{headline}</a>'
+                f'&nbsp;&nbsp;<font color="#6f6f6f">{outlet}</font>'
+            ),
+            "link": link,
+            "topics": rng.sample([*subjects, *objects], 4),
+        })
+    return articles
@@ -0,0 +1,546 @@
+"""Result caches for news analyses: bounded in-memory, shared on-disk and memo."""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+class NewsCache:
+    """
+    LRU cache with a TTL, an entry limit and a byte budget.
+
+    Entries older than ``ttl`` but younger than ``ttl + stale_ttl`` are
+    still returned, flagged as stale, so callers can serve them while a
+    refresh runs in the background. Encoded response bodies can be
+    attached to an entry; they count toward the byte budget and are
+    dropped along with the entry.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int = 256,
+        max_bytes: int = 64 * 1024 * 1024,
+        stale_ttl: float = 0
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_ttl = stale_ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.encoded_hits = 0
+        self.encoded_misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @staticmethod
+    def _measure(data) -> tuple:
+        """
+        Approximate the memory held by a cached result and hash its content.
+
+        Args:
+            data: Cached value.
+
+        Returns:
+            tuple: Size of the value serialized as JSON in bytes, and the
+                first 32 hex digits of that serialization's SHA-256 digest.
+        """
+        encoded = json.dumps(data, default=str).encode("utf-8")
+        return len(encoded), hashlib.sha256(encoded).hexdigest()[:32]
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry["size"]
+
+    def _evict(self) -> None:
+        while self._entries and (
+                len(self._entries) > self.max_entries or
+                (self._bytes > self.max_bytes and len(self._entries) > 1)):
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def get(self, key: str, now: float = None):
+        """
+        Look up a cached value.
+
+        Args:
+            key (str): Cache key.
+            now (float): Current time, defaults to ``time.time()``.
+
+        Returns:
+            tuple: ``(data, is_stale)``, or ``None`` on a miss.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            age = now - entry["timestamp"]
+            if age >= self.ttl + self.stale_ttl:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            if age >= self.ttl:
+                self.stale_hits += 1
+                return entry["data"], True
+            self.hits += 1
+            return entry["data"], False
+
+    def age(self, key: str, now: float = None):
+        """
+        Report how old an entry is without counting a lookup.
+
+        Args:
+            key (str): Cache key.
+            now (float): Current time, defaults to ``time.time()``.
+
+        Returns:
+            float: Age in seconds, or ``None`` if the key is not cached.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else now - entry["timestamp"]
+
+    def peek(self, key: str, now: float = None):
+        """
+        Read a value, stale or not, without counting a lookup.
+
+        Args:
+            key (str): Cache key.
+            now (float): Current time, defaults to ``time.time()``.
+
+        Returns:
+            The cached value, or ``None`` if it is missing or past its stale
+            window.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now - entry["timestamp"] >= self.ttl + self.stale_ttl:
+                return None
+            return entry["data"]
+
+    def validator(self, key: str, data, now: float = None):
+        """
+        Report the content hash and age of the entry holding ``data``.
+
+        Args:
+            key (str): Cache key.
+            data: Value the caller is about to serve.
+            now (float): Current time, defaults to ``time.time()``.
+
+        Returns:
+            tuple: ``(content_hash, age)``, or ``None`` if ``data`` is no
+                longer the cached value.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["data"] is not data:
+                return None
+            return entry["hash"], now - entry["timestamp"]
+
+    def set(self, key: str, data, timestamp: float = None) -> None:
+        """
+        Store a value and evict least recently used entries over budget.
+
+        Args:
+            key (str): Cache key.
+            data: Value to cache.
+            timestamp (float): Creation time, defaults to ``time.time()``.
+        """
+        size, content_hash = self._measure(data)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = {
+                "data": data,
+                "timestamp": time.time() if timestamp is None else timestamp,
+                "size": size,
+                "hash": content_hash,
+                "encoded": {}
+            }
+            self._bytes += size
+            self._evict()
+
+    def get_encoded(self, key: str, data, variant: str):
+        """
+        Look up a body encoded from the entry holding ``data``.
+
+        Args:
+            key (str): Cache key.
+            data: Value the body was derived from.
+            variant (str): Identifies the encoding and selection applied.
+
+        Returns:
+            tuple: Body bytes and content coding, or ``None`` if there is no
+                such body or ``data`` is no longer the cached value.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            encoded = None
+            if entry is not None and entry["data"] is data:
+                encoded = entry["encoded"].get(variant)
+            if encoded is None:
+                self.encoded_misses += 1
+            else:
+                self.encoded_hits += 1
+            return encoded
+
+    def set_encoded(self, key: str, data, variant: str, body: bytes, coding: str) -> None:
+        """
+        Attach an encoded body to the entry holding ``data``.
+
+        Nothing is stored if ``data`` has been replaced or evicted meanwhile.
+
+        Args:
+            key (str): Cache key.
+            data: Value the body was derived from.
+            variant (str): Identifies the encoding and selection applied.
+            body (bytes): Encoded body.
+            coding (str): Content coding applied to ``body``.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["data"] is not data:
+                return
+            previous = entry["encoded"].get(variant)
+            added = len(body) - (len(previous[0]) if previous is not None else 0)
+            entry["encoded"][variant] = (body, coding)
+            entry["size"] += added
+            self._bytes += added
+            self._evict()
+
+    def sweep(self, now: float = None) -> int:
+        """
+        Drop entries past their stale window.
+
+        Args:
+            now (float): Current time, defaults to ``time.time()``.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            expired_keys = [
+                key for key, entry in self._entries.items()
+                if (now - entry["timestamp"]) >= self.ttl + self.stale_ttl
+            ]
+            for key in expired_keys:
+                self._remove(key)
+            self.expirations += len(expired_keys)
+        return len(expired_keys)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """
+        Report cache counters.
+
+        Returns:
+            dict: Entry, byte, hit, miss and eviction counts.
+        """
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "encoded_hits": self.encoded_hits,
+            "encoded_misses": self.encoded_misses
+        }
+
+class DiskCache:
+    """
+    SQLite-backed result cache shared by every worker process on a host.
+
+    Audio is stored as raw bytes beside the result rather than base64
+    inside it, and is cleared whenever the result is replaced. The
+    database runs in WAL mode with a busy timeout so concurrent writers
+    from several processes serialize safely.
+    """
+
+    def __init__(self, path: str, ttl: float, timeout: float = 30.0):
+        self.path = path
+        self.ttl = ttl
+        self.timeout = timeout
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS news_cache ("
+                "key TEXT PRIMARY KEY, "
+                "timestamp REAL NOT NULL, "
+                "payload TEXT NOT NULL, "
+                "audio BLOB)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Return this thread's connection, opening it on first use.
+
+        Returns:
+            sqlite3.Connection: Connection in WAL mode.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str, now: float = None):
+        """
+        Look up a result that has not yet expired.
+
+        Args:
+            key (str): Cache key.
+            now (float): Current time, defaults to ``time.time()``.
+
+        Returns:
+            tuple: ``(data, timestamp)``, or ``None`` on a miss.
+        """
+        now = time.time() if now is None else now
+        try:
+            row = self._connect().execute(
+                "SELECT timestamp, payload FROM news_cache "
+                "WHERE key = ? AND timestamp > ?",
+                (key, now - self.ttl)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading disk cache: {str(e)}")
+            self.errors += 1
+            return None
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        timestamp, payload = row
+        self.hits += 1
+        return json.loads(payload), timestamp
+
+    def set(self, key: str, data: dict, timestamp: float = None) -> None:
+        """
+        Store a result, replacing any previous entry for the key.
+
+        Args:
+            key (str): Cache key.
+            data (dict): Result to store.
+            timestamp (float): Creation time, defaults to ``time.time()``.
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO news_cache "
+                    "(key, timestamp, payload, audio) VALUES (?, ?, ?, NULL)",
+                    (key, timestamp, json.dumps(data))
+                )
+            self.writes += 1
+        except sqlite3.Error as e:
+            print(f"Error writing disk cache: {str(e)}")
+            self.errors += 1
+
+    def get_audio(self, key: str, now: float = None) -> tuple:
+        """
+        Look up the audio stored for a result that has not yet expired.
+
+        Args:
+            key (str): Cache key.
+            now (float): Current time, defaults to ``time.time()``.
+
+        Returns:
+            tuple: MP3 audio, or ``None`` if there is none, and the result's
+                timestamp, or ``None`` if no fresh result is stored.
+        """
+        now = time.time() if now is None else now
+        try:
+            row = self._connect().execute(
+                "SELECT audio, timestamp FROM news_cache WHERE key = ? AND timestamp > ?",
+                (key, now - self.ttl)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading disk cache: {str(e)}")
+            self.errors += 1
+            return None, None
+        return (row[0], row[1]) if row is not None else (None, None)
+
+    def set_audio(self, key: str, audio: bytes, timestamp: float) -> None:
+        """
+        Attach raw audio bytes to a stored result.
+
+        Nothing is written if the result has been replaced since
+        ``get_audio`` reported its timestamp, so audio for an old summary
+        never sticks to a newer result.
+
+        Args:
+            key (str): Cache key.
+            audio (bytes): MP3 audio.
+            timestamp (float): Timestamp of the result the audio was made for.
+        """
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "UPDATE news_cache SET audio = ? WHERE key = ? AND timestamp = ?",
+                    (audio, key, timestamp)
+                )
+        except sqlite3.Error as e:
+            print(f"Error writing disk cache: {str(e)}")
+            self.errors += 1
+
+    def sweep(self, now: float = None) -> int:
+        """
+        Delete expired rows.
+
+        Args:
+            now (float): Current time, defaults to ``time.time()``.
+
+        Returns:
+            int: Number of rows removed.
+        """
+        now = time.time() if now is None else now
+        try:
+            conn = self._connect()
+            with conn:
+                cursor = conn.execute(
+                    "DELETE FROM news_cache WHERE timestamp <= ?",
+                    (now - self.ttl,)
+                )
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            print(f"Error sweeping disk cache: {str(e)}")
+            self.errors += 1
+            return 0
+
+    def stats(self) -> dict:
+        """
+        Report disk cache counters.
+
+        Returns:
+            dict: Hit, miss, write and error counts.
+        """
+        return {
+            "path": self.path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "errors": self.errors
+        }
+
+class MemoCache:
+    """
+    Bounded LRU memo for content-addressed intermediate results.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """
+        Hash the parts identifying a memoized value.
+
+        Args:
+            *parts (str): Inputs that determine the value.
+
+        Returns:
+            str: Hex SHA-256 digest.
+        """
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        """
+        Look up a memoized value.
+
+        Args:
+            key (str): Key from ``make_key``.
+
+        Returns:
+            The memoized value, or ``None`` on a miss.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value) -> None:
+        """
+        Memoize a value, evicting the least recently used entry when full.
+
+        Args:
+            key (str): Key from ``make_key``.
+            value: Value to memoize.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Report memo counters.
+
+        Returns:
+            dict: Entry, hit, miss and eviction counts with the hit rate.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
@@ -0,0 +1,240 @@
+"""Response encodings for analysis results: JSON, MessagePack and compression."""
+import base64
+import gzip
+import json
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library encoder
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+# Bodies smaller than this are sent uncompressed
+COMPRESS_MIN_BYTES = 500
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+def _accepted(header: str) -> dict:
+    """
+    Parse an ``Accept`` or ``Accept-Encoding`` header.
+
+    Args:
+        header (str): Header value.
+
+    Returns:
+        dict: Quality value keyed by lowercase media type or coding.
+    """
+    accepted = {}
+    for item in (header or "").split(","):
+        name, *params = item.strip().split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+    return accepted
+
+def negotiate(accept: str, accept_encoding: str) -> tuple:
+    """
+    Choose the body format and content coding for a request.
+
+    MessagePack is used when the client accepts it at least as much as
+    JSON and ``msgpack`` is installed. Brotli is preferred over gzip when
+    both are accepted and ``brotli`` is installed.
+
+    Args:
+        accept (str): ``Accept`` header value.
+        accept_encoding (str): ``Accept-Encoding`` header value.
+
+    Returns:
+        tuple: Media type and content coding (``"br"``, ``"gzip"`` or
+            ``"identity"``).
+    """
+    media = _accepted(accept)
+    json_quality = max(media.get(JSON_MEDIA_TYPE, 0), media.get("*/*", 0)) if media else 1.0
+    msgpack_quality = max(media.get(name, 0) for name in MSGPACK_MEDIA_TYPES)
+    media_type = (
+        MSGPACK_MEDIA_TYPES[0]
+        if msgpack is not None and msgpack_quality > 0 and msgpack_quality >= json_quality
+        else JSON_MEDIA_TYPE
+    )
+
+    codings = _accepted(accept_encoding)
+    if brotli is not None and codings.get("br", 0) > 0:
+        coding = "br"
+    elif codings.get("gzip", 0) > 0:
+        coding = "gzip"
+    else:
+        coding = "identity"
+    return media_type, coding
+
+def select_fields(result: dict, fields: list) -> dict:
+    """
+    Keep only the requested parts of an analysis result.
+
+    Names may be top-level keys such as ``Final Sentiment Analysis`` or
+    keys of ``Comparative Sentiment Score`` such as ``Sentiment
+    Distribution``, which stay nested under their parent.
+
+    Args:
+        result (dict): Full analysis result.
+        fields (list): Field names to keep.
+
+    Returns:
+        dict: Result restricted to the requested fields.
+
+    Raises:
+        KeyError: If a field name is not part of the result.
+    """
+    comparative = result.get("Comparative Sentiment Score", {})
+    selected = {}
+    for field in fields:
+        if field in result:
+            selected[field] = result[field]
+        elif field in comparative:
+            selected.setdefault("Comparative Sentiment Score", {})[field] = comparative[field]
+        else:
+            raise KeyError(field)
+    return selected
+
+def _encode_cursor(article_id: str) -> str:
+    return base64.urlsafe_b64encode(article_id.encode("ascii")).decode("ascii").rstrip("=")
+
+def paginate_articles(result: dict, limit: int, cursor: str = None) -> dict:
+    """
+    Keep one page of a result's articles.
+
+    Pages follow the order of ``Articles`` in the result. A cursor names
+    the last article of the previous page by ID, so a refreshed result
+    continues after that article instead of at a shifted offset.
+    Everything other than ``Articles`` still covers the full set.
+
+    Args:
+        result (dict): Full analysis result.
+        limit (int): Maximum articles per page.
+        cursor (str): ``Next Cursor`` of the previous page, or ``None`` for
+            the first page.
+
+    Returns:
+        dict: Result with the page of articles and a ``Pagination`` block
+            holding the total count and the next page's cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed or its article is no longer
+            part of the result.
+    """
+    articles = result.get("Articles", [])
+    start = 0
+    if cursor:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            article_id = base64.urlsafe_b64decode(padded).decode("ascii")
+        except (ValueError, UnicodeDecodeError):
+            raise ValueError("Malformed cursor")
+        start = next(
+            (i + 1 for i, article in enumerate(articles) if article.get("ID") == article_id),
+            None
+        )
+        if start is None:
+            raise ValueError("Cursor does not match the current articles")
+
+    page = articles[start:start + limit]
+    more = start + limit < len(articles) and page and page[-1].get("ID")
+    return {
+        **result,
+        "Articles": page,
+        "Pagination": {
+            "Total Articles": len(articles),
+            "Limit": limit,
+            "Next Cursor": _encode_cursor(page[-1]["ID"]) if more else None
+        }
+    }
+
+def serialize(data, media_type: str = JSON_MEDIA_TYPE) -> bytes:
+    """
+    Serialize a result as JSON or MessagePack.
+
+    Args:
+        data: JSON-compatible value.
+        media_type (str): Target media type.
+
+    Returns:
+        bytes: Encoded body.
+    """
+    if media_type in MSGPACK_MEDIA_TYPES:
+        return msgpack.packb(data, use_bin_type=True)
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def compress(body: bytes, coding: str) -> tuple:
+    """
+    Compress a body unless it is too small to benefit.
+
+    Args:
+        body (bytes): Encoded body.
+        coding (str): ``"br"``, ``"gzip"`` or ``"identity"``.
+
+    Returns:
+        tuple: Possibly compressed body and the coding actually applied.
+    """
+    if coding == "identity" or len(body) < COMPRESS_MIN_BYTES:
+        return body, "identity"
+    if coding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY), "br"
+    return gzip.compress(body, compresslevel=GZIP_LEVEL), "gzip"
+
+def encode(data, media_type: str, coding: str) -> tuple:
+    """
+    Serialize and compress a result.
+
+    Args:
+        data: Value to encode.
+        media_type (str): Target media type.
+        coding (str): Requested content coding.
+
+    Returns:
+        tuple: Body bytes and the content coding applied.
+    """
+    return compress(serialize(data, media_type), coding)
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Check an ``If-None-Match`` header against an ETag.
+
+    Uses the weak comparison HTTP prescribes for ``If-None-Match``, so a
+    ``W/`` prefix on either side is ignored.
+
+    Args:
+        if_none_match (str): Header value, may be ``None``.
+        etag (str): Current ETag of the representation.
+
+    Returns:
+        bool: True if the client's copy is current.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    return any(
+        (candidate[2:] if candidate.startswith("W/") else candidate) == opaque
+        for candidate in (part.strip() for part in if_none_match.split(","))
+    )
@@ -0,0 +1,203 @@
+"""Pooled, conditional and rate-limited RSS feed downloads."""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import quote, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Feed searched for each company, ``{query}`` is the URL-quoted company name
+FEED_URL_TEMPLATE = os.environ.get(
+    "NEWS_FEED_URL", "https://news.google.com/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"
+)
+
+# Minimum seconds between requests to the same host
+FEED_HOST_INTERVAL = float(os.environ.get("NEWS_FEED_HOST_INTERVAL", "0.2"))
+
+FEED_CONNECT_TIMEOUT = 3.05
+FEED_READ_TIMEOUT = 10
+FEED_POOL_SIZE = 32  # Kept-alive connections per host
+FEED_MAX_TRACKED = 4096  # Feeds whose validators are remembered
+
+class FeedResult:
+    """
+    Outcome of a feed download.
+
+    Attributes:
+        url (str): Feed URL.
+        changed (bool): False if the server answered 304 or sent the same
+            bytes as last time.
+        content (bytes): Feed body, ``None`` when unchanged.
+        status (int): HTTP status code.
+        validators (tuple): ETag, Last-Modified date and digest of a changed
+            body, to pass to ``FeedFetcher.remember`` once it is processed.
+    """
+
+    __slots__ = ("url", "changed", "content", "status", "validators")
+
+    def __init__(
+        self,
+        url: str,
+        changed: bool,
+        content: bytes,
+        status: int,
+        validators: tuple = None
+    ):
+        self.url = url
+        self.changed = changed
+        self.content = content
+        self.status = status
+        self.validators = validators
+
+class FeedFetcher:
+    """
+    Downloads feeds over one kept-alive session with conditional requests.
+
+    Once the caller has processed a changed feed it hands the result to
+    ``remember``, which keeps the feed's ETag, Last-Modified date and
+    SHA-256 digest. The next download is sent with ``If-None-Match`` and
+    ``If-Modified-Since``, and a 304, or a 200 whose body hashes the same,
+    is reported as unchanged. Validators of a feed whose processing failed
+    are never kept, so it is processed again on the next download.
+    Requests to one host are spaced at least ``host_interval`` seconds
+    apart. The session is shared by every I/O thread and its connection
+    pool is thread-safe.
+    """
+
+    def __init__(
+        self,
+        host_interval: float = FEED_HOST_INTERVAL,
+        timeout: tuple = (FEED_CONNECT_TIMEOUT, FEED_READ_TIMEOUT),
+        pool_size: int = FEED_POOL_SIZE
+    ):
+        self.host_interval = host_interval
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._lock = threading.Lock()
+        self._validators = OrderedDict()
+        self._next_slot = {}
+        self.requests = 0
+        self.not_modified = 0
+        self.unchanged = 0
+        self.errors = 0
+        self.bytes = 0
+        self.throttled_seconds = 0.0
+
+    @staticmethod
+    def url_for(company: str) -> str:
+        """
+        Build the feed URL for a company.
+
+        Args:
+            company (str): Name of the company to search for.
+
+        Returns:
+            str: Feed URL.
+        """
+        return FEED_URL_TEMPLATE.format(query=quote(company))
+
+    def _wait_for_host(self, host: str) -> None:
+        """
+        Block until a request slot for the host is free.
+
+        Args:
+            host (str): Host name and port.
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.host_interval
+        if slot > now:
+            self.throttled_seconds += slot - now
+            time.sleep(slot - now)
+
+    def fetch(self, url: str, conditional: bool = True) -> FeedResult:
+        """
+        Download a feed, skipping the body if it has not changed.
+
+        Args:
+            url (str): Feed URL.
+            conditional (bool): Send validators from the previous download
+                and compare digests. Pass False when the caller has nothing
+                to reuse from that download.
+
+        Returns:
+            FeedResult: Whether the feed changed and, if so, its body.
+        """
+        with self._lock:
+            previous = self._validators.get(url) if conditional else None
+
+        headers = {}
+        if previous is not None:
+            etag, last_modified, _ = previous
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        self._wait_for_host(urlsplit(url).netloc)
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code != 304:
+                response.raise_for_status()
+        except requests.RequestException:
+            self.errors += 1
+            raise
+        finally:
+            self.requests += 1
+
+        content = response.content
+        self.bytes += len(content)
+        if response.status_code == 304:
+            self.not_modified += 1
+            return FeedResult(url, False, None, 304)
+
+        digest = hashlib.sha256(content).digest()
+        if previous is not None and previous[2] == digest:
+            self.unchanged += 1
+            return FeedResult(url, False, None, response.status_code)
+        validators = (
+            response.headers.get("ETag"), response.headers.get("Last-Modified"), digest
+        )
+        return FeedResult(url, True, content, response.status_code, validators)
+
+    def remember(self, feed: FeedResult) -> None:
+        """
+        Keep a processed feed's validators for the next conditional download.
+
+        Args:
+            feed (FeedResult): Changed feed whose content has been processed.
+        """
+        if feed.validators is None:
+            return
+        with self._lock:
+            self._validators[feed.url] = feed.validators
+            self._validators.move_to_end(feed.url)
+            if len(self._validators) > FEED_MAX_TRACKED:
+                self._validators.popitem(last=False)
+
+    def stats(self) -> dict:
+        """
+        Report download counters.
+
+        Returns:
+            dict: Requests, unchanged outcomes, errors, body bytes received
+                and seconds spent waiting on per-host rate limits.
+        """
+        return {
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "unchanged": self.unchanged,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "throttled_seconds": round(self.throttled_seconds, 3),
+            "tracked": len(self._validators),
+        }
+
+FEEDS = FeedFetcher()
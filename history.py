@@ -0,0 +1,178 @@
+"""Append-only per-company sentiment history in fixed-width record files."""
+import hashlib
+import os
+import threading
+import time
+import zlib
+
+import numpy as np
+
+LABELS = ("Positive", "Negative", "Neutral")
+
+# One record per fresh analysis: 19 bytes on disk
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("company_id", "<u4"),
+    ("positive", "<u2"),
+    ("negative", "<u2"),
+    ("neutral", "<u2"),
+    ("dominant", "u1"),
+])
+
+class SentimentHistory:
+    """
+    Sentiment Distribution snapshots, one binary file per company.
+
+    Each file is an append-only array of ``RECORD_DTYPE`` records in time
+    order. Queries memory-map the file and binary-search the timestamp
+    column, so only the pages covering the requested range are read.
+    Appends are single ``write`` calls on files opened in append mode,
+    which keeps concurrent writers from several processes from
+    interleaving records. The directory is created by the first append.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self.writes = 0
+        self.errors = 0
+
+    @staticmethod
+    def company_id(cache_key: str) -> int:
+        """
+        Derive the numeric company ID stored in each record.
+
+        Args:
+            cache_key (str): Normalized company name.
+
+        Returns:
+            int: CRC-32 of the name.
+        """
+        return zlib.crc32(cache_key.encode("utf-8"))
+
+    def _path(self, cache_key: str) -> str:
+        digest = hashlib.sha256(cache_key.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.directory, f"{digest}.bin")
+
+    def append(self, cache_key: str, counts: dict, timestamp: float = None) -> None:
+        """
+        Record a company's Sentiment Distribution.
+
+        Args:
+            cache_key (str): Normalized company name.
+            counts (dict): Article counts keyed by sentiment label.
+            timestamp (float): Analysis time, defaults to ``time.time()``.
+        """
+        record = np.zeros(1, dtype=RECORD_DTYPE)
+        record["timestamp"] = time.time() if timestamp is None else timestamp
+        record["company_id"] = self.company_id(cache_key)
+        record["positive"] = counts.get("Positive", 0)
+        record["negative"] = counts.get("Negative", 0)
+        record["neutral"] = counts.get("Neutral", 0)
+        record["dominant"] = LABELS.index(max(LABELS, key=lambda label: counts.get(label, 0)))
+
+        try:
+            with self._lock:
+                os.makedirs(self.directory, exist_ok=True)
+                with open(self._path(cache_key), "ab") as history_file:
+                    history_file.write(record.tobytes())
+            self.writes += 1
+        except OSError as e:
+            print(f"Error writing sentiment history: {str(e)}")
+            self.errors += 1
+
+    def _records(self, cache_key: str) -> np.ndarray:
+        """
+        Memory-map a company's records without reading them.
+
+        Args:
+            cache_key (str): Normalized company name.
+
+        Returns:
+            np.ndarray: Read-only record array, empty if there is no history.
+        """
+        path = self._path(cache_key)
+        try:
+            count = os.path.getsize(path) // RECORD_DTYPE.itemsize
+        except OSError:
+            count = 0
+        if count == 0:
+            return np.zeros(0, dtype=RECORD_DTYPE)
+        # Ignore a trailing partial record from an in-progress append
+        return np.memmap(path, dtype=RECORD_DTYPE, mode="r", shape=(count,))
+
+    def query(
+        self,
+        cache_key: str,
+        start: float = None,
+        end: float = None,
+        points: int = 200
+    ) -> dict:
+        """
+        Fetch a company's history, downsampled to at most ``points`` buckets.
+
+        The range is split into equal time buckets. Each bucket reports
+        the mean counts of its records and the label with the most
+        articles overall, stamped with the bucket's first record time.
+
+        Args:
+            cache_key (str): Normalized company name.
+            start (float): Earliest timestamp, inclusive.
+            end (float): Latest timestamp, inclusive.
+            points (int): Maximum number of buckets returned.
+
+        Returns:
+            dict: Number of records in range and the downsampled points.
+        """
+        records = self._records(cache_key)
+        timestamps = records["timestamp"]
+        lo = 0 if start is None else int(np.searchsorted(timestamps, start, side="left"))
+        hi = len(records) if end is None else int(np.searchsorted(timestamps, end, side="right"))
+        selected = np.array(records[lo:hi])
+        if len(selected) == 0:
+            return {"Records": 0, "Points": []}
+
+        times = selected["timestamp"]
+        if len(selected) <= points:
+            starts = np.arange(len(selected))
+        else:
+            edges = np.linspace(times[0], times[-1], points + 1)[:-1]
+            starts = np.unique(np.searchsorted(times, edges, side="left"))
+        sizes = np.diff(np.append(starts, len(selected)))
+
+        counts = np.stack([
+            np.add.reduceat(selected[field].astype(np.int64), starts)
+            for field in ("positive", "negative", "neutral")
+        ], axis=1)
+        means = np.round(counts / sizes[:, None], 2)
+        dominant = counts.argmax(axis=1)
+
+        return {
+            "Records": int(len(selected)),
+            "Points": [
+                {
+                    "Timestamp": float(times[first]),
+                    "Positive": float(mean[0]),
+                    "Negative": float(mean[1]),
+                    "Neutral": float(mean[2]),
+                    "Dominant": LABELS[label],
+                    "Samples": int(size),
+                }
+                for first, mean, label, size in zip(
+                    starts.tolist(), means, dominant.tolist(), sizes.tolist()
+                )
+            ]
+        }
+
+    def stats(self) -> dict:
+        """
+        Report history counters.
+
+        Returns:
+            dict: Companies on disk, records written and write errors.
+        """
+        try:
+            companies = sum(1 for name in os.listdir(self.directory) if name.endswith(".bin"))
+        except OSError:
+            companies = 0
+        return {"companies": companies, "writes": self.writes, "errors": self.errors}
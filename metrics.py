@@ -0,0 +1,188 @@
+"""Low-overhead stage timers, counters and Prometheus text rendering."""
+import contextvars
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+STAGE_METRIC = "news_stage_duration_seconds"
+STAGE_HELP = "Time spent in each pipeline stage."
+
+# Stage durations of the current request, for the Server-Timing header
+_REQUEST_TIMINGS = contextvars.ContextVar("request_timings", default=None)
+
+class MetricsRegistry:
+    """
+    Thread-safe store of labelled counters and latency histograms.
+    """
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self._help = {}
+        self._collectors = []
+
+    def increment(self, name: str, help_text: str, amount: float = 1, **labels) -> None:
+        """
+        Add to a counter.
+
+        Args:
+            name (str): Metric name.
+            help_text (str): Metric description.
+            amount (float): Amount to add.
+            **labels: Label values identifying the series.
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._help.setdefault(name, ("counter", help_text))
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name: str, help_text: str, value: float, **labels) -> None:
+        """
+        Record a value in a histogram.
+
+        Args:
+            name (str): Metric name.
+            help_text (str): Metric description.
+            value (float): Observed value in seconds.
+            **labels: Label values identifying the series.
+        """
+        key = (name, tuple(sorted(labels.items())))
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._help.setdefault(name, ("histogram", help_text))
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            histogram[0][index] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+    def register_collector(self, collector) -> None:
+        """
+        Add a callable producing samples at scrape time.
+
+        Args:
+            collector: Zero-argument callable returning a list of
+                ``(name, type, help, labels, value)`` tuples.
+        """
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: Exposition text.
+        """
+        with self._lock:
+            help_texts = dict(self._help)
+            counters = dict(self._counters)
+            histograms = {
+                key: (list(counts), total, count)
+                for key, (counts, total, count) in self._histograms.items()
+            }
+
+        samples = {}
+        for (name, labels), value in counters.items():
+            samples.setdefault(name, []).append((name, labels, value))
+
+        for (name, labels), (counts, total, count) in histograms.items():
+            series = samples.setdefault(name, [])
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += bucket_count
+                series.append((f"{name}_bucket", (*labels, ("le", str(bound))), cumulative))
+            series.append((f"{name}_sum", labels, total))
+            series.append((f"{name}_count", labels, count))
+
+        for collector in self._collectors:
+            for name, metric_type, help_text, labels, value in collector():
+                help_texts.setdefault(name, (metric_type, help_text))
+                samples.setdefault(name, []).append(
+                    (name, tuple(sorted(labels.items())), value)
+                )
+
+        lines = []
+        for name in sorted(samples):
+            metric_type, help_text = help_texts[name]
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for sample_name, labels, value in samples[name]:
+                label_text = ",".join(f'{key}="{val}"' for key, val in labels)
+                lines.append(
+                    f"{sample_name}{{{label_text}}} {value}" if label_text
+                    else f"{sample_name} {value}"
+                )
+        return "\n".join(lines) + "\n"
+
+REGISTRY = MetricsRegistry()
+
+def increment(name: str, help_text: str, amount: float = 1, **labels) -> None:
+    """
+    Add to a counter in the default registry.
+
+    Args:
+        name (str): Metric name.
+        help_text (str): Metric description.
+        amount (float): Amount to add.
+        **labels: Label values identifying the series.
+    """
+    REGISTRY.increment(name, help_text, amount, **labels)
+
+@contextmanager
+def stage_timer(stage: str):
+    """
+    Time a pipeline stage into the stage histogram and the current request.
+
+    Args:
+        stage (str): Stage name.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        REGISTRY.observe(STAGE_METRIC, STAGE_HELP, elapsed, stage=stage)
+        timings = _REQUEST_TIMINGS.get()
+        if timings is not None:
+            timings[stage] = timings.get(stage, 0.0) + elapsed
+
+class ServerTimingMiddleware:
+    """
+    ASGI middleware adding a ``Server-Timing`` header with stage durations.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = {}
+        token = _REQUEST_TIMINGS.set(timings)
+        start = time.perf_counter()
+
+        async def _send(message):
+            if message["type"] == "http.response.start":
+                entries = [
+                    f"{stage};dur={elapsed * 1000:.1f}"
+                    for stage, elapsed in timings.items()
+                ]
+                entries.append(f"total;dur={(time.perf_counter() - start) * 1000:.1f}")
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"server-timing", ", ".join(entries).encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            _REQUEST_TIMINGS.reset(token)
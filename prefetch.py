@@ -0,0 +1,289 @@
+"""Popularity-driven background refresh of hot cache entries."""
+import asyncio
+import math
+import os
+import threading
+import time
+
+# Most requested companies kept warm
+PREFETCH_TOP_K = int(os.environ.get("NEWS_PREFETCH_TOP_K", "20"))
+
+# Decayed request count a company needs to be kept warm
+PREFETCH_MIN_SCORE = float(os.environ.get("NEWS_PREFETCH_MIN_SCORE", "1.5"))
+
+# Companies kept warm regardless of traffic, comma-separated
+PREFETCH_WATCHLIST = [
+    company.strip()
+    for company in os.environ.get("NEWS_PREFETCH_WATCHLIST", "").split(",")
+    if company.strip()
+]
+
+# Refresh budget: concurrent refreshes and refreshes started per minute
+PREFETCH_CONCURRENCY = int(os.environ.get("NEWS_PREFETCH_CONCURRENCY", "2"))
+PREFETCH_PER_MINUTE = float(os.environ.get("NEWS_PREFETCH_PER_MINUTE", "30"))
+
+PREFETCH_INTERVAL = 30  # Seconds between scheduling passes
+PREFETCH_LEAD = 120  # Refresh entries this many seconds before they expire
+PREFETCH_HALF_LIFE = 3600  # Seconds for a request's popularity weight to halve
+PREFETCH_MAX_TRACKED = 10000
+PREFETCH_MAX_BACKOFF = 3600  # Longest wait before retrying a failing company
+
+class PrefetchScheduler:
+    """
+    Keeps the most requested companies and a static watchlist cached.
+
+    Each request adds to its company's exponentially decaying popularity
+    score. On every pass the top ``top_k`` companies scoring at least
+    ``min_score`` and the watchlist are refreshed if their cache entry is
+    missing or within ``lead`` seconds of expiring, subject to a
+    concurrency limit and a token bucket of refreshes per minute. A
+    company whose refresh fails waits ``interval`` seconds before the next
+    try, doubling with each consecutive failure up to ``max_backoff``. A refresh replaces the cache entry in a single
+    locked write, so readers keep getting the old result until the new one
+    is stored.
+    """
+
+    def __init__(
+        self,
+        refresh,
+        age_of,
+        ttl: float,
+        top_k: int = PREFETCH_TOP_K,
+        watchlist: list = None,
+        concurrency: int = PREFETCH_CONCURRENCY,
+        per_minute: float = PREFETCH_PER_MINUTE,
+        lead: float = PREFETCH_LEAD,
+        half_life: float = PREFETCH_HALF_LIFE,
+        min_score: float = PREFETCH_MIN_SCORE,
+        interval: float = PREFETCH_INTERVAL,
+        max_backoff: float = PREFETCH_MAX_BACKOFF
+    ):
+        """
+        Args:
+            refresh: Coroutine function ``(company, cache_key)`` that
+                analyzes a company and stores the result.
+            age_of: Callable returning a cache key's age in seconds, or
+                ``None`` if it is not cached.
+            ttl (float): Cache entry lifetime in seconds.
+            top_k (int): Number of most popular companies kept warm.
+            watchlist (list): Companies kept warm regardless of traffic.
+            concurrency (int): Maximum refreshes running at once.
+            per_minute (float): Maximum refreshes started per minute.
+            lead (float): Seconds before expiry at which to refresh.
+            half_life (float): Popularity decay half-life in seconds.
+            min_score (float): Lowest popularity score kept warm.
+            interval (float): Seconds between passes, and the first retry
+                delay after a failure.
+            max_backoff (float): Longest retry delay in seconds.
+        """
+        self.refresh = refresh
+        self.age_of = age_of
+        self.ttl = ttl
+        self.top_k = top_k
+        self.watchlist = {
+            company.lower().strip(): company
+            for company in (PREFETCH_WATCHLIST if watchlist is None else watchlist)
+        }
+        self.concurrency = concurrency
+        self.per_minute = per_minute
+        self.lead = lead
+        self._decay = math.log(2) / half_life
+        self.min_score = min_score
+        self.interval = interval
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._scores = {}
+        self._backoff = {}
+        self._tokens = float(per_minute)
+        self._refilled_at = time.monotonic()
+        self._prefetched = set()
+        self.prefetches = 0
+        self.failures = 0
+        self.rate_limited = 0
+        self.requests = 0
+        self.hits = 0
+        self.prefetched_requests = 0
+        self.prefetched_hits = 0
+
+    def record(self, cache_key: str, company: str, hit: bool, now: float = None) -> None:
+        """
+        Count a request towards a company's popularity.
+
+        Args:
+            cache_key (str): Normalized cache key.
+            company (str): Company name as requested.
+            hit (bool): Whether the request was served from the cache.
+            now (float): Current time, defaults to ``time.time()``.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            score, updated, _ = self._scores.get(cache_key, (0.0, now, company))
+            self._scores[cache_key] = (
+                score * math.exp(-self._decay * (now - updated)) + 1.0, now, company
+            )
+            if len(self._scores) > PREFETCH_MAX_TRACKED:
+                self._prune(now)
+
+            self.requests += 1
+            self.hits += hit
+            if cache_key in self._prefetched:
+                self.prefetched_requests += 1
+                self.prefetched_hits += hit
+
+    def _prune(self, now: float) -> None:
+        """
+        Forget the least popular half of the tracked companies.
+
+        Args:
+            now (float): Current time.
+        """
+        ranked = sorted(
+            self._scores.items(),
+            key=lambda item: item[1][0] * math.exp(-self._decay * (now - item[1][1]))
+        )
+        for cache_key, _ in ranked[:len(ranked) // 2]:
+            del self._scores[cache_key]
+
+    def hot(self, now: float = None) -> list:
+        """
+        Rank the most popular companies.
+
+        Args:
+            now (float): Current time, defaults to ``time.time()``.
+
+        Returns:
+            list: Up to ``top_k`` ``(cache_key, company, score)`` tuples
+                scoring at least ``min_score``, most popular first.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            scored = [
+                (cache_key, company, score * math.exp(-self._decay * (now - updated)))
+                for cache_key, (score, updated, company) in self._scores.items()
+            ]
+        scored = [item for item in scored if item[2] >= self.min_score]
+        scored.sort(key=lambda item: item[2], reverse=True)
+        return scored[:self.top_k]
+
+    def due(self, now: float = None) -> list:
+        """
+        Select watchlist and hot companies whose entries are about to expire.
+
+        Companies backing off after a failed refresh are skipped.
+
+        Args:
+            now (float): Current time, defaults to ``time.time()``.
+
+        Returns:
+            list: ``(cache_key, company)`` pairs, watchlist first.
+        """
+        now = time.time() if now is None else now
+        candidates = dict(self.watchlist)
+        for cache_key, company, _ in self.hot(now):
+            candidates.setdefault(cache_key, company)
+
+        with self._lock:
+            backing_off = {
+                cache_key for cache_key, (_, retry_at) in self._backoff.items() if now < retry_at
+            }
+
+        due = []
+        for cache_key, company in candidates.items():
+            if cache_key in backing_off:
+                continue
+            age = self.age_of(cache_key, now)
+            if age is None or age >= self.ttl - self.lead:
+                due.append((cache_key, company))
+        return due
+
+    def _take_token(self) -> bool:
+        """
+        Spend one refresh from the per-minute budget.
+
+        Returns:
+            bool: False if the budget is exhausted.
+        """
+        now = time.monotonic()
+        self._tokens = min(
+            self.per_minute, self._tokens + (now - self._refilled_at) * self.per_minute / 60
+        )
+        self._refilled_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def prefetch_due(self, now: float = None) -> int:
+        """
+        Refresh every due company that fits in the budget.
+
+        Args:
+            now (float): Current time, defaults to ``time.time()``.
+
+        Returns:
+            int: Number of refreshes started.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        started = []
+        for cache_key, company in self.due(now):
+            if not self._take_token():
+                self.rate_limited += 1
+                continue
+            started.append(self._prefetch(semaphore, cache_key, company))
+        await asyncio.gather(*started)
+        return len(started)
+
+    async def _prefetch(self, semaphore: asyncio.Semaphore, cache_key: str, company: str) -> None:
+        async with semaphore:
+            try:
+                await self.refresh(company, cache_key)
+            except Exception as e:
+                print(f"Error prefetching {company}: {str(e)}")
+                self.failures += 1
+                with self._lock:
+                    failures = self._backoff.get(cache_key, (0, 0))[0] + 1
+                    delay = min(self.max_backoff, self.interval * 2 ** (failures - 1))
+                    self._backoff[cache_key] = (failures, time.time() + delay)
+                return
+        self.prefetches += 1
+        with self._lock:
+            self._backoff.pop(cache_key, None)
+            self._prefetched.add(cache_key)
+
+    async def run(self) -> None:
+        """
+        Run scheduling passes every ``interval`` seconds until cancelled.
+        """
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.prefetch_due()
+            except Exception as e:
+                print(f"Error in prefetch pass: {str(e)}")
+
+    def stats(self) -> dict:
+        """
+        Report prefetch counters and hit rates.
+
+        Returns:
+            dict: Hot companies, refresh outcomes, and the hit rate over all
+                requests and over requests for prefetched companies.
+        """
+        with self._lock:
+            requests, hits = self.requests, self.hits
+            prefetched_requests, prefetched_hits = self.prefetched_requests, self.prefetched_hits
+            tracked = len(self._scores)
+            backing_off = len(self._backoff)
+        return {
+            "tracked": tracked,
+            "hot": [company for _, company, _ in self.hot()],
+            "watchlist": list(self.watchlist.values()),
+            "prefetches": self.prefetches,
+            "failures": self.failures,
+            "backing_off": backing_off,
+            "rate_limited": self.rate_limited,
+            "hit_rate": round(hits / requests, 4) if requests else None,
+            "prefetched_hit_rate": (
+                round(prefetched_hits / prefetched_requests, 4) if prefetched_requests else None
+            ),
+        }
@@ -0,0 +1,136 @@
+"""News analysis backends for the Streamlit dashboard."""
+import asyncio
+import threading
+
+import requests
+
+from cache import MemoCache
+
+# Pages whose result and ETag are kept for revalidation
+VALIDATED_MAX_ENTRIES = 128
+
+class NewsService:
+    """
+    Runs the analysis pipeline in process on a dedicated event loop.
+
+    Streamlit reruns the script on every interaction, so one instance should
+    be shared across reruns and sessions (e.g. via ``st.cache_resource``).
+    Results come back as Python objects and audio as raw bytes, with no
+    HTTP, JSON or base64 round trip.
+    """
+
+    def __init__(self):
+        import api  # Imported here so HTTP-only dashboards never load the pipeline
+
+        self._api = api
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="news-service", daemon=True
+        )
+        self._thread.start()
+        self._call(api.start_background_tasks())
+
+    def _call(self, coro, timeout: float = None):
+        """
+        Run a coroutine on the service loop and wait for its result.
+
+        Args:
+            coro: Coroutine to run.
+            timeout (float): Seconds to wait, or ``None`` for no limit.
+
+        Returns:
+            The coroutine's result.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    def get_news(self, company: str, limit: int = None, cursor: str = None) -> dict:
+        """
+        Analyze news for a company.
+
+        Args:
+            company (str): Name of the company to search for.
+            limit (int): Articles per page, or ``None`` for all of them.
+            cursor (str): ``Next Cursor`` of the previous page.
+
+        Returns:
+            dict: Comprehensive news analysis and sentiment report.
+        """
+        return self._call(self._api.analyze_news(company, limit=limit, cursor=cursor))
+
+    def get_audio(self, company: str) -> bytes:
+        """
+        Get the audio summary for a company.
+
+        Args:
+            company (str): Name of the company to search for.
+
+        Returns:
+            bytes: MP3 audio, empty if none is available.
+        """
+        from fastapi import HTTPException
+
+        try:
+            response = self._call(self._api.get_news_audio(company))
+        except HTTPException:
+            return b""
+        return response.body
+
+class HttpNewsService:
+    """
+    Calls a remote or separately started API server over HTTP.
+
+    The last result and ETag of recently requested pages are kept, so
+    repeat requests are revalidated and a 304 reuses the local copy without
+    a body.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 120.0):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._session = requests.Session()
+        self._validated = MemoCache(max_entries=VALIDATED_MAX_ENTRIES)
+
+    def get_news(self, company: str, limit: int = None, cursor: str = None) -> dict:
+        """
+        Analyze news for a company through ``/news``.
+
+        Args:
+            company (str): Name of the company to search for.
+            limit (int): Articles per page, or ``None`` for all of them.
+            cursor (str): ``Next Cursor`` of the previous page.
+
+        Returns:
+            dict: Comprehensive news analysis and sentiment report.
+        """
+        params = {"company": company, "limit": limit, "cursor": cursor}
+        key = MemoCache.make_key(company, str(limit), cursor or "")
+        etag, result = self._validated.get(key) or (None, None)
+        response = self._session.get(
+            f"{self.base_url}/news",
+            params={name: value for name, value in params.items() if value is not None},
+            headers={"If-None-Match": etag} if etag else None,
+            timeout=self.timeout
+        )
+        if response.status_code == 304 and result is not None:
+            return result
+        response.raise_for_status()
+        result = response.json()
+        if response.headers.get("ETag"):
+            self._validated.set(key, (response.headers["ETag"], result))
+        return result
+
+    def get_audio(self, company: str) -> bytes:
+        """
+        Get the audio summary for a company through its audio endpoint.
+
+        Args:
+            company (str): Name of the company to search for.
+
+        Returns:
+            bytes: MP3 audio, empty if none is available.
+        """
+        response = self._session.get(
+            f"{self.base_url}/news/{requests.utils.quote(company, safe='')}/audio",
+            timeout=self.timeout
+        )
+        return response.content if response.status_code == 200 else b""
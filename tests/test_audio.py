@@ -0,0 +1,45 @@
+"""Audio summaries: per-text syntheses, disk storage and missing backends."""
+import asyncio
+import time
+
+import api
+import utils
+from cache import DiskCache
+
+async def _untranslated(text: str, source: str, target: str) -> str:
+    return text
+
+def test_refreshed_summary_gets_its_own_audio(monkeypatch, tmp_path):
+    disk = DiskCache(str(tmp_path / "cache.db"), ttl=3600)
+    monkeypatch.setattr(api, "DISK_CACHE", disk)
+    monkeypatch.setattr(api.SYNTHESIZER, "preferred", lambda: "gtts")
+
+    async def _generate_audio_bytes(text: str) -> tuple:
+        await asyncio.sleep(0.2 if text == "mostly Positive" else 0.05)
+        return text.encode(), "gtts"
+
+    monkeypatch.setattr(api, "generate_audio_bytes", _generate_audio_bytes)
+
+    async def _refresh_during_synthesis() -> tuple:
+        disk.set("acme", {"Final Sentiment Analysis": "mostly Positive"}, time.time() - 10)
+        old = api._start_audio("acme", "mostly Positive")
+        await asyncio.sleep(0.01)
+        disk.set("acme", {"Final Sentiment Analysis": "mostly Negative"}, time.time())
+        new = api._start_audio("acme", "mostly Negative")
+        assert new is not old
+        return await old, await new
+
+    old_audio, new_audio = asyncio.run(_refresh_during_synthesis())
+
+    assert old_audio == b"mostly Positive"
+    assert new_audio == b"mostly Negative"
+    assert disk.get_audio("acme")[0] == b"mostly Negative"
+
+def test_no_backend_reports_unavailable(monkeypatch, capsys):
+    monkeypatch.setattr(api.SYNTHESIZER, "preferred", lambda: None)
+    monkeypatch.setattr(utils, "_translate", _untranslated)
+
+    audio, backend = asyncio.run(utils.generate_audio_bytes("mostly Positive"))
+
+    assert (audio, backend) == (b"", None)
+    assert "No TTS backend available" in capsys.readouterr().out
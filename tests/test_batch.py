@@ -0,0 +1,73 @@
+"""A batch analysis reports the same per-company results as single requests."""
+import asyncio
+
+import httpx
+import pytest
+
+import api
+import utils
+
+SHARED_STORY = "Carmakers rally as battery costs fall to a record low"
+
+FEEDS = {
+    "Acme": [
+        (f"{SHARED_STORY} - Reuters", "Battery prices fell sharply this quarter."),
+        (f"{SHARED_STORY} - Bloomberg", "Battery prices fell sharply this quarter, analysts said."),
+        ("Acme opens a new plant in Ohio", "The factory will employ 2,000 people."),
+    ],
+    "Ford": [
+        (f"{SHARED_STORY} - CNBC", "Cheaper batteries lift margins across the industry."),
+        (f"{SHARED_STORY} - AP", "Cheaper batteries lift margins across the industry, AP reports."),
+        ("Ford recalls pickups over a brake fault", "The recall covers 90,000 trucks."),
+    ],
+}
+
+def _infer(texts: list) -> list:
+    return ["Negative" if "recall" in text else "Positive" for text in texts]
+
+@pytest.fixture(autouse=True)
+def stub_pipeline(monkeypatch):
+    """Serve fixed feeds, score with a keyword rule and keep results in memory."""
+    def _fetch_news(company: str, conditional: bool = False) -> tuple:
+        articles = [
+            {"title": title, "summary": summary, "link": f"https://example.com/{i}"}
+            for i, (title, summary) in enumerate(FEEDS[company])
+        ]
+        return articles, None
+
+    monkeypatch.setattr(api, "_fetch_news", _fetch_news)
+    monkeypatch.setattr(api.POOLS, "infer", _infer)
+    monkeypatch.setattr(api, "DISK_CACHE", None)
+    monkeypatch.setattr(api, "HISTORY", None)
+    yield
+    api.NEWS_CACHE.clear()
+    utils.ARTICLE_MEMO.clear()
+
+def _reset() -> None:
+    api.NEWS_CACHE.clear()
+    utils.ARTICLE_MEMO.clear()
+
+def _summary(result: dict) -> tuple:
+    articles = [
+        (article["Title"], article["Sentiment"], article["Cluster Size"])
+        for article in result["Articles"]
+    ]
+    return articles, result["Article Reuse"], result["Comparative Sentiment Score"]
+
+async def _single_and_batch() -> tuple:
+    transport = httpx.ASGITransport(app=api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        single = {}
+        for company in FEEDS:
+            _reset()
+            single[company] = (await client.get("/news", params={"company": company})).json()
+        _reset()
+        batch = (await client.post("/news/batch", json={"companies": list(FEEDS)})).json()
+    return single, batch
+
+def test_batch_matches_single_requests():
+    single, batch = asyncio.run(_single_and_batch())
+
+    for company in FEEDS:
+        assert _summary(batch["results"][company]) == _summary(single[company])
+        assert [article["Cluster Size"] for article in single[company]["Articles"]] == [2, 2, 1]
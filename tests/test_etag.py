@@ -0,0 +1,63 @@
+"""Conditional /news requests and field selection on empty results."""
+import asyncio
+
+import httpx
+import pytest
+
+import api
+
+@pytest.fixture(autouse=True)
+def stub_fetch(monkeypatch):
+    """Serve an empty feed and keep results in memory only."""
+    monkeypatch.setattr(api, "_fetch_news", lambda company, conditional=False: ([], None))
+    monkeypatch.setattr(api, "DISK_CACHE", None)
+    monkeypatch.setattr(api, "HISTORY", None)
+    api.NEWS_CACHE.clear()
+    yield
+    api.NEWS_CACHE.clear()
+
+async def _get(*requests) -> list:
+    transport = httpx.ASGITransport(app=api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return [
+            await client.get("/news", params=params, headers=headers)
+            for params, headers in requests
+        ]
+
+def test_matching_etag_gets_empty_304():
+    first, = asyncio.run(_get(({"company": "Acme"}, {})))
+    etag = first.headers["ETag"]
+
+    revalidated, = asyncio.run(_get(({"company": "Acme"}, {"If-None-Match": etag})))
+
+    assert first.status_code == 200
+    assert etag.startswith('W/"')
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["ETag"] == etag
+
+def test_other_variant_does_not_match():
+    first, = asyncio.run(_get(({"company": "Acme"}, {})))
+    etag = first.headers["ETag"]
+
+    fields, limited = asyncio.run(_get(
+        ({"company": "Acme", "fields": "Sentiment Distribution"}, {"If-None-Match": etag}),
+        ({"company": "Acme", "limit": 1}, {"If-None-Match": etag}),
+    ))
+
+    for response in (fields, limited):
+        assert response.status_code == 200
+        assert response.content
+        assert response.headers["ETag"] != etag
+    assert fields.headers["ETag"] != limited.headers["ETag"]
+
+def test_empty_result_has_every_field():
+    fields = "Coverage Similarity,Coverage Differences,Article Reuse"
+    response, = asyncio.run(_get(({"company": "Acme", "fields": fields}, {})))
+
+    assert response.status_code == 200
+    data = response.json()
+    comparative = data["Comparative Sentiment Score"]
+    assert comparative["Coverage Similarity"] == {"Mean Similarity": None, "Coverage Clusters": []}
+    assert comparative["Coverage Differences"] == []
+    assert data["Article Reuse"] == {"Reused": 0, "Analyzed": 0}
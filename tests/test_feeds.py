@@ -0,0 +1,102 @@
+"""Conditional feed downloads against the local stub feed server."""
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "benchmarks"))
+
+import api
+import feeds
+from feed_server import StubFeedServer
+from feeds import FeedFetcher
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Acme</title>
+<item><title>Acme opens a new plant</title><link>https://example.com/1</link></item>
+</channel></rss>"""
+
+@pytest.fixture
+def extractor(monkeypatch):
+    """
+    Install a news extractor that records its downloads and parses.
+
+    Yields:
+        types.SimpleNamespace: Module with ``fetch_news`` and ``calls``.
+    """
+    module = types.SimpleNamespace(calls=[])
+
+    def _fetch_news(company: str) -> list:
+        module.calls.append(("fetch_news", company))
+        return [{"title": f"{company} news", "summary": "", "link": ""}]
+
+    module.fetch_news = _fetch_news
+    monkeypatch.setitem(sys.modules, "news_extractor", module)
+    monkeypatch.setattr(api, "FEEDS", FeedFetcher(host_interval=0, timeout=(0.5, 0.5)))
+    yield module
+
+@pytest.fixture
+def server(monkeypatch):
+    with StubFeedServer(FEED) as running:
+        monkeypatch.setattr(feeds, "FEED_URL_TEMPLATE", running.url + "/rss?q={query}")
+        yield running
+
+def test_unchanged_feed_gets_304_once_remembered(server):
+    fetcher = FeedFetcher(host_interval=0)
+    url = fetcher.url_for("Acme")
+
+    first = fetcher.fetch(url)
+    assert first.changed and first.content == FEED
+    # Not remembered yet, as when processing failed, so it is still new
+    assert fetcher.fetch(url).changed
+
+    fetcher.remember(first)
+    unchanged = fetcher.fetch(url)
+    assert not unchanged.changed and unchanged.status == 304
+    assert server.not_modified == 1
+
+    server.set_body(FEED.replace(b"new plant", b"second plant"))
+    assert fetcher.fetch(url).changed
+
+def test_unchanged_body_detected_by_digest():
+    with StubFeedServer(FEED, validators=False) as running:
+        fetcher = FeedFetcher(host_interval=0)
+        url = running.url + "/rss"
+        fetcher.remember(fetcher.fetch(url))
+
+        unchanged = fetcher.fetch(url)
+
+    assert not unchanged.changed and unchanged.status == 200
+    assert fetcher.stats()["unchanged"] == 1
+
+def test_parse_news_reads_pooled_download(server, extractor):
+    extractor.parse_news = lambda content, company: [{"title": company, "body": content}]
+
+    articles, feed = api._fetch_news("Acme")
+    api.FEEDS.remember(feed)
+    unchanged, _ = api._fetch_news("Acme", conditional=True)
+
+    assert articles == [{"title": "Acme", "body": FEED}]
+    assert unchanged is None
+    assert server.requests == 2 and server.not_modified == 1
+    assert extractor.calls == []
+
+def test_unconditional_fetch_skips_pooled_download(server, extractor):
+    articles, feed = api._fetch_news("Acme")
+
+    assert articles == [{"title": "Acme news", "summary": "", "link": ""}]
+    assert feed is None
+    assert server.requests == 0
+    assert extractor.calls == [("fetch_news", "Acme")]
+
+def test_failed_revalidation_falls_back_to_fetch_news(monkeypatch, extractor):
+    with StubFeedServer(FEED) as stopped:
+        url = stopped.url
+    monkeypatch.setattr(feeds, "FEED_URL_TEMPLATE", url + "/rss?q={query}")
+
+    articles, feed = api._fetch_news("Acme", conditional=True)
+
+    assert articles == [{"title": "Acme news", "summary": "", "link": ""}]
+    assert feed is None
+    assert extractor.calls == [("fetch_news", "Acme")]
@@ -0,0 +1,11 @@
+"""RSS markup is stripped from topics without touching ordinary words."""
+from utils import normalize_article
+
+def test_markup_words_dropped_from_topics():
+    article = normalize_article({
+        "title": "Target earnings beat forecasts - Reuters",
+        "summary": "Target reported higher sales.",
+        "topics": ["target earnings", "_blank target", "nbsp", "color https font"],
+    })
+
+    assert article["topics"] == ["target earnings", "target", "color https font"]
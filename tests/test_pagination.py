@@ -0,0 +1,31 @@
+"""Cursor pagination walks every article once, repeats included."""
+from encoding import paginate_articles
+from utils import article_ids, structure_article
+
+REPEATED = {"title": "Acme recalls pickups", "summary": "The recall covers 90,000 trucks.", "link": ""}
+OTHER = {"title": "Acme opens a new plant", "summary": "The factory will employ 2,000 people.", "link": ""}
+
+def _result(articles: list) -> dict:
+    return {
+        "Company": "Acme",
+        "Articles": [
+            structure_article({**article, "sentiment": "Neutral", "topics": []}, article_id)
+            for article, article_id in zip(articles, article_ids(articles))
+        ],
+    }
+
+def test_cursor_walks_past_repeated_articles():
+    result = _result([REPEATED, OTHER, REPEATED, REPEATED, OTHER])
+    ids = [article["ID"] for article in result["Articles"]]
+    assert len(set(ids)) == len(ids)
+
+    seen, cursor = [], None
+    for _ in range(len(ids)):
+        page = paginate_articles(result, 2, cursor)
+        seen.extend(article["ID"] for article in page["Articles"])
+        cursor = page["Pagination"]["Next Cursor"]
+        if cursor is None:
+            break
+
+    assert seen == ids
+    assert page["Pagination"]["Total Articles"] == len(ids)
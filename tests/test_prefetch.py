@@ -0,0 +1,60 @@
+"""Prefetching keeps popular companies warm and backs off from failures."""
+import asyncio
+
+import httpx
+
+import api
+from prefetch import PrefetchScheduler
+
+def _scheduler(refresh=None, **kwargs) -> PrefetchScheduler:
+    async def _refresh(company: str, cache_key: str) -> None:
+        pass
+
+    return PrefetchScheduler(
+        refresh or _refresh, lambda cache_key, now: None, ttl=900, watchlist=[], **kwargs
+    )
+
+def test_single_request_is_not_kept_warm():
+    scheduler = _scheduler(min_score=1.5)
+    scheduler.record("acme", "Acme", hit=False, now=1000)
+    scheduler.record("ford", "Ford", hit=False, now=1000)
+    scheduler.record("ford", "Ford", hit=True, now=1001)
+
+    assert [company for _, company, _ in scheduler.hot(now=1002)] == ["Ford"]
+
+def test_failing_refresh_backs_off():
+    calls = []
+
+    async def _failing(company: str, cache_key: str) -> None:
+        calls.append(company)
+        raise ConnectionError("feed unavailable")
+
+    scheduler = _scheduler(_failing, min_score=0.5, interval=30)
+    scheduler.record("acme", "Acme", hit=False)
+
+    assert asyncio.run(scheduler.prefetch_due()) == 1
+    assert scheduler.due() == []
+    assert calls == ["Acme"]
+    assert scheduler.stats()["backing_off"] == 1
+
+def test_audio_and_later_pages_do_not_count(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(api, "_fetch_news", lambda company, conditional=False: ([], None))
+    monkeypatch.setattr(api, "DISK_CACHE", None)
+    monkeypatch.setattr(api, "HISTORY", None)
+    monkeypatch.setattr(
+        api.PREFETCHER, "record", lambda cache_key, company, hit: recorded.append(cache_key)
+    )
+
+    async def _requests() -> None:
+        transport = httpx.ASGITransport(app=api.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get("/news", params={"company": "Acme"})
+            await client.get("/news/Acme/audio")
+            await api.analyze_news("Acme", limit=1)
+
+    api.NEWS_CACHE.clear()
+    asyncio.run(_requests())
+    api.NEWS_CACHE.clear()
+
+    assert recorded == ["acme", "acme"]
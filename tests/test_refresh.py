@@ -0,0 +1,39 @@
+"""Failed background refreshes of stale entries are counted."""
+import asyncio
+import time
+
+import httpx
+
+import api
+from metrics import REGISTRY
+
+def _refresh_failures() -> float:
+    for line in REGISTRY.render().splitlines():
+        if line.startswith("news_refresh_failures_total "):
+            return float(line.split()[1])
+    return 0.0
+
+def test_failed_stale_refresh_is_counted(monkeypatch):
+    def _fetch_news(company: str, conditional: bool = False) -> tuple:
+        raise ConnectionError("feed unavailable")
+
+    monkeypatch.setattr(api, "_fetch_news", _fetch_news)
+    monkeypatch.setattr(api, "DISK_CACHE", None)
+    stale = api.create_empty_result("Acme")
+    api.NEWS_CACHE.set("acme", stale, timestamp=time.time() - api.CACHE_EXPIRY - 1)
+    before = _refresh_failures()
+
+    async def _request() -> httpx.Response:
+        transport = httpx.ASGITransport(app=api.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/news", params={"company": "Acme"})
+        while "acme" in api.IN_FLIGHT:
+            await asyncio.sleep(0.01)
+        return response
+
+    response = asyncio.run(_request())
+    api.NEWS_CACHE.clear()
+
+    assert response.status_code == 200
+    assert response.json()["Company"] == "Acme"
+    assert _refresh_failures() == before + 1
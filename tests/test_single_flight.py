@@ -0,0 +1,64 @@
+"""Concurrent cold requests for one company share a single analysis."""
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+import api
+
+CONCURRENT_REQUESTS = 50
+
+@pytest.fixture
+def fetches(monkeypatch):
+    """
+    Replace the feed download with a slow stub that counts its calls.
+
+    Yields:
+        dict: ``calls`` made so far and ``error``, raised by the stub when set.
+    """
+    state = {"calls": 0, "error": None}
+    lock = threading.Lock()
+
+    def _fetch_news(company: str, conditional: bool = False) -> tuple:
+        with lock:
+            state["calls"] += 1
+        time.sleep(0.2)  # Keep the fetch running while every request arrives
+        if state["error"] is not None:
+            raise state["error"]
+        return [], None
+
+    monkeypatch.setattr(api, "_fetch_news", _fetch_news)
+    monkeypatch.setattr(api, "DISK_CACHE", None)
+    monkeypatch.setattr(api, "HISTORY", None)
+    api.NEWS_CACHE.clear()
+    yield state
+    api.NEWS_CACHE.clear()
+
+async def _get_concurrently(company: str) -> list:
+    transport = httpx.ASGITransport(app=api.app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(*(
+            client.get("/news", params={"company": company})
+            for _ in range(CONCURRENT_REQUESTS)
+        ))
+
+def test_concurrent_requests_fetch_once(fetches):
+    responses = asyncio.run(_get_concurrently("Acme"))
+
+    assert fetches["calls"] == 1
+    assert [response.status_code for response in responses] == [200] * CONCURRENT_REQUESTS
+    assert {response.json()["Company"] for response in responses} == {"Acme"}
+    assert "acme" in api.NEWS_CACHE
+    assert not api.IN_FLIGHT
+
+def test_failed_fetch_reaches_every_waiter(fetches):
+    fetches["error"] = ConnectionError("feed unavailable")
+
+    responses = asyncio.run(_get_concurrently("Acme"))
+
+    assert fetches["calls"] == 1
+    assert [response.status_code for response in responses] == [500] * CONCURRENT_REQUESTS
+    assert len(api.NEWS_CACHE) == 0
+    assert not api.IN_FLIGHT
@@ -0,0 +1,65 @@
+"""Streamed articles carry the same labels as the /news result."""
+import asyncio
+import json
+
+import httpx
+import pytest
+
+import api
+import utils
+
+SHARED_STORY = "Acme recalls pickups over a brake fault"
+
+ARTICLES = [
+    (f"{SHARED_STORY} - Reuters", "The recall covers 90,000 trucks."),
+    ("Acme opens a new plant in Ohio", "The factory will employ 2,000 people."),
+    ("Acme chief executive to retire next spring", "The board has begun a search."),
+    (f"{SHARED_STORY} - AP", "The recall covers 90,000 trucks, AP reports."),
+    ("Acme wins a defence contract", "The deal is worth $4 billion over ten years."),
+    ("Acme shares hit a record high", "Investors cheered strong quarterly sales."),
+]
+
+def _infer(texts: list) -> list:
+    return ["Negative" if "recall" in text else "Positive" for text in texts]
+
+@pytest.fixture(autouse=True)
+def stub_pipeline(monkeypatch):
+    """Serve a fixed feed, score in small chunks and keep results in memory."""
+    def _fetch_news(company: str, conditional: bool = False) -> tuple:
+        articles = [
+            {"title": title, "summary": summary, "link": f"https://example.com/{i}"}
+            for i, (title, summary) in enumerate(ARTICLES)
+        ]
+        return articles, None
+
+    monkeypatch.setattr(api, "_fetch_news", _fetch_news)
+    monkeypatch.setattr(api.POOLS, "infer", _infer)
+    # The repeated story is scored in the first chunk and repeated in the second
+    monkeypatch.setattr(api, "SENTIMENT_BATCH_SIZE", 2)
+    monkeypatch.setattr(api, "DISK_CACHE", None)
+    monkeypatch.setattr(api, "HISTORY", None)
+    api.NEWS_CACHE.clear()
+    utils.ARTICLE_MEMO.clear()
+    yield
+    api.NEWS_CACHE.clear()
+    utils.ARTICLE_MEMO.clear()
+
+def _labels(articles: list) -> list:
+    return [(article["ID"], article["Sentiment"], article["Cluster Size"]) for article in articles]
+
+async def _streamed_and_single() -> tuple:
+    transport = httpx.ASGITransport(app=api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        streamed = (await client.get("/news/stream", params={"company": "Acme"})).text
+        api.NEWS_CACHE.clear()
+        utils.ARTICLE_MEMO.clear()
+        single = (await client.get("/news", params={"company": "Acme"})).json()
+    events = [json.loads(line) for line in streamed.splitlines()]
+    return [event for event in events if event["event"] == "article"], single
+
+def test_streamed_labels_match_news():
+    streamed, single = asyncio.run(_streamed_and_single())
+
+    assert _labels(streamed) == _labels(single["Articles"])
+    assert [article["Cluster Size"] for article in streamed] == [2, 1, 1, 2, 1, 1]
+    assert streamed[3]["Sentiment"] == "Negative"
@@ -0,0 +1,37 @@
+"""A process pool broken by a dying worker is replaced."""
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import workers
+
+class _Executor:
+    """Process pool double whose first instance has lost a worker."""
+
+    created = []
+
+    def __init__(self, **kwargs):
+        self.broken = not _Executor.created
+        self.shut_down = False
+        _Executor.created.append(self)
+
+    def submit(self, fn, *args):
+        if self.broken:
+            raise BrokenProcessPool("A child process terminated abruptly")
+        future = Future()
+        future.set_result(["Positive"] * len(args[0]))
+        return future
+
+    def shutdown(self, wait=True):
+        self.shut_down = True
+
+def test_broken_pool_is_replaced_and_retried(monkeypatch):
+    monkeypatch.setattr(workers, "ProcessPoolExecutor", _Executor)
+    monkeypatch.setattr(_Executor, "created", [])
+    pools = workers.WorkerPools(processes=1)
+
+    assert pools.infer(["Shares rose."]) == ["Positive"]
+    assert pools.infer(["Shares fell."]) == ["Positive"]
+
+    broken, replacement = _Executor.created
+    assert broken.shut_down and not replacement.shut_down
+    assert pools.stats()["restarts"] == 1
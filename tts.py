@@ -0,0 +1,314 @@
+"""Text-to-speech backends with chunked, parallel MP3 synthesis."""
+import asyncio
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import wave
+from io import BytesIO
+
+try:
+    import lameenc
+except ImportError:  # The offline engine is unavailable without an MP3 encoder
+    lameenc = None
+
+from metrics import REGISTRY, increment, stage_timer
+
+# Backends tried in order, comma-separated
+TTS_BACKENDS = os.environ.get("NEWS_TTS_BACKENDS", "gtts,offline")
+
+# Seconds a backend gets to synthesize a whole text before the next is tried
+TTS_TIMEOUT = float(os.environ.get("NEWS_TTS_TIMEOUT", "20"))
+
+TTS_CHUNK_CHARS = 200  # gTTS sends at most 100 characters per remote call
+TTS_CONCURRENCY = 4  # Chunks synthesized at once per text
+TTS_SECONDS_METRIC = "news_tts_chunk_seconds"
+
+# Sentence ends, including the Devanagari danda used by Hindi translations
+_SENTENCE_END = re.compile(r"(?<=[.!?।])\s+")
+
+def split_sentences(text: str, max_chars: int = TTS_CHUNK_CHARS) -> list:
+    """
+    Split text into chunks at sentence boundaries.
+
+    Consecutive sentences are packed into chunks of at most ``max_chars``
+    characters. A longer sentence is split at whitespace.
+
+    Args:
+        text (str): Text to split.
+        max_chars (int): Maximum characters per chunk.
+
+    Returns:
+        list: Non-empty chunks in reading order.
+    """
+    chunks = []
+    current = ""
+    for sentence in _SENTENCE_END.split(text.strip()):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            cut = max_chars if cut <= 0 else cut
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return [chunk for chunk in chunks if chunk]
+
+def _strip_tags(audio: bytes) -> bytes:
+    """
+    Remove ID3 tags so MP3 chunks can be concatenated frame to frame.
+
+    Args:
+        audio (bytes): MP3 data.
+
+    Returns:
+        bytes: MPEG audio frames only.
+    """
+    if audio[:3] == b"ID3" and len(audio) >= 10:
+        size = 0
+        for byte in audio[6:10]:
+            size = (size << 7) | (byte & 0x7F)
+        footer = 10 if audio[5] & 0x10 else 0
+        audio = audio[10 + size + footer:]
+    if len(audio) >= 128 and audio[-128:-125] == b"TAG":
+        audio = audio[:-128]
+    return audio
+
+class GTTSBackend:
+    """Google Translate speech via ``gtts``; needs network access."""
+
+    name = "gtts"
+
+    def available(self) -> bool:
+        try:
+            import gtts  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def synthesize(self, text: str, lang: str) -> bytes:
+        """
+        Synthesize one chunk.
+
+        Args:
+            text (str): Text to speak.
+            lang (str): Language code.
+
+        Returns:
+            bytes: MP3 audio.
+        """
+        from gtts import gTTS  # Deferred to keep startup fast
+
+        mp3_fp = BytesIO()
+        gTTS(text=text, lang=lang).write_to_fp(mp3_fp)
+        return mp3_fp.getvalue()
+
+class OfflineBackend:
+    """
+    Local speech from the ``espeak-ng`` engine, encoded to MP3 by ``lameenc``.
+
+    Needs no network, so its latency only depends on the local machine.
+    """
+
+    name = "offline"
+    bit_rate = 64
+
+    def __init__(self, command: str = "espeak-ng"):
+        self.command = command
+
+    def available(self) -> bool:
+        return lameenc is not None and shutil.which(self.command) is not None
+
+    def synthesize(self, text: str, lang: str) -> bytes:
+        """
+        Synthesize one chunk.
+
+        Args:
+            text (str): Text to speak.
+            lang (str): Language code, used as the espeak voice.
+
+        Returns:
+            bytes: MP3 audio.
+        """
+        with tempfile.NamedTemporaryFile(suffix=".wav") as wav_file:
+            subprocess.run(
+                [self.command, "-v", lang, "-w", wav_file.name, text],
+                check=True, capture_output=True, timeout=TTS_TIMEOUT
+            )
+            with wave.open(wav_file.name, "rb") as wav:
+                channels, rate = wav.getnchannels(), wav.getframerate()
+                pcm = wav.readframes(wav.getnframes())
+
+        encoder = lameenc.Encoder()
+        encoder.set_bit_rate(self.bit_rate)
+        encoder.set_in_sample_rate(rate)
+        encoder.set_channels(channels)
+        encoder.set_quality(7)
+        return bytes(encoder.encode(pcm) + encoder.flush())
+
+BACKEND_TYPES = {
+    GTTSBackend.name: GTTSBackend,
+    OfflineBackend.name: OfflineBackend,
+}
+
+class SpeechSynthesizer:
+    """
+    Synthesizes text with the first backend that succeeds.
+
+    Text is split at sentence boundaries and the chunks are synthesized in
+    parallel, then their MP3 frames are concatenated. A backend that fails
+    or exceeds ``timeout`` on any chunk is abandoned for that text and the
+    next backend synthesizes it from scratch, so one text never mixes
+    voices.
+    """
+
+    def __init__(
+        self,
+        backends: list = None,
+        timeout: float = TTS_TIMEOUT,
+        concurrency: int = TTS_CONCURRENCY,
+        max_chars: int = TTS_CHUNK_CHARS
+    ):
+        """
+        Args:
+            backends (list): Backend instances in order of preference,
+                defaults to those named in ``NEWS_TTS_BACKENDS``.
+            timeout (float): Seconds each backend gets per text.
+            concurrency (int): Chunks synthesized at once per text.
+            max_chars (int): Maximum characters per chunk.
+        """
+        if backends is None:
+            backends = [
+                BACKEND_TYPES[name.strip()]()
+                for name in TTS_BACKENDS.split(",") if name.strip() in BACKEND_TYPES
+            ]
+        self.backends = backends
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.max_chars = max_chars
+        self._lock = threading.Lock()
+        self._stats = {
+            backend.name: {"texts": 0, "chunks": 0, "failures": 0, "seconds": 0.0}
+            for backend in backends
+        }
+
+    def _synthesize_chunk(self, backend, text: str, lang: str) -> bytes:
+        """
+        Synthesize and time one chunk.
+
+        Args:
+            backend: Backend to use.
+            text (str): Chunk text.
+            lang (str): Language code.
+
+        Returns:
+            bytes: MPEG frames without tags.
+        """
+        start = time.perf_counter()
+        audio = _strip_tags(backend.synthesize(text, lang))
+        elapsed = time.perf_counter() - start
+        REGISTRY.observe(
+            TTS_SECONDS_METRIC, "Chunk synthesis latency by backend.", elapsed,
+            backend=backend.name
+        )
+        with self._lock:
+            self._stats[backend.name]["chunks"] += 1
+            self._stats[backend.name]["seconds"] += elapsed
+        return audio
+
+    async def _synthesize_with(self, backend, chunks: list, lang: str) -> bytes:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _chunk(text: str) -> bytes:
+            async with semaphore:
+                return await asyncio.to_thread(self._synthesize_chunk, backend, text, lang)
+
+        parts = await asyncio.gather(*(_chunk(chunk) for chunk in chunks))
+        return b"".join(parts)
+
+    def preferred(self) -> str:
+        """
+        Name the backend used when nothing fails.
+
+        Returns:
+            str: First available backend, or ``None`` if none is available.
+        """
+        return next((backend.name for backend in self.backends if backend.available()), None)
+
+    async def synthesize(self, text: str, lang: str) -> tuple:
+        """
+        Synthesize text to MP3, falling back through the backends.
+
+        Args:
+            text (str): Text to speak.
+            lang (str): Language code.
+
+        Returns:
+            tuple: MP3 audio and the name of the backend that produced it,
+                ``None`` for empty text.
+
+        Raises:
+            RuntimeError: If every backend failed or none is available.
+        """
+        chunks = split_sentences(text, self.max_chars)
+        if not chunks:
+            return b"", None
+
+        errors = []
+        for backend in self.backends:
+            if not backend.available():
+                continue
+            try:
+                with stage_timer("tts"):
+                    audio = await asyncio.wait_for(
+                        self._synthesize_with(backend, chunks, lang), self.timeout
+                    )
+            except Exception as e:
+                print(f"Error synthesizing with {backend.name}: {str(e) or type(e).__name__}")
+                errors.append(f"{backend.name}: {str(e) or type(e).__name__}")
+                increment(
+                    "news_tts_fallbacks_total", "Texts a TTS backend failed to synthesize.",
+                    backend=backend.name
+                )
+                with self._lock:
+                    self._stats[backend.name]["failures"] += 1
+                continue
+            with self._lock:
+                self._stats[backend.name]["texts"] += 1
+            return audio, backend.name
+
+        raise RuntimeError("; ".join(errors) or "No TTS backend available")
+
+    def stats(self) -> dict:
+        """
+        Report per-backend counters.
+
+        Returns:
+            dict: Texts synthesized, chunks synthesized, failures and mean
+                chunk latency in milliseconds, keyed by backend name.
+        """
+        with self._lock:
+            return {
+                name: {
+                    "texts": counters["texts"],
+                    "chunks": counters["chunks"],
+                    "failures": counters["failures"],
+                    "mean_chunk_ms": (
+                        round(counters["seconds"] / counters["chunks"] * 1000, 2)
+                        if counters["chunks"] else None
+                    ),
+                }
+                for name, counters in self._stats.items()
+            }
+
+SYNTHESIZER = SpeechSynthesizer()
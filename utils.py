@@ -1,11 +1,54 @@
 """Utility Functions for News Analysis"""
 import base64
 import asyncio
-from io import BytesIO
+import html
+import os
+import re
+import zlib
 from collections import Counter
 
-from deep_translator import GoogleTranslator
-from gtts import gTTS
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+from cache import MemoCache
+from metrics import increment, stage_timer
+from tts import SYNTHESIZER
+
+# Sentiment inference batching
+SENTIMENT_BATCH_SIZE = 16
+SENTIMENT_MAX_LENGTH = 512
+
+# Whitespace tokens of each summary passed to the sentiment model
+SENTIMENT_TOKEN_BUDGET = int(os.environ.get("NEWS_SENTIMENT_TOKEN_BUDGET", "128"))
+
+# RSS summary markup, stripped before analysis
+_HTML_LINK = re.compile(r"""<a\s[^>]*?href=["']([^"']+)["']""", re.IGNORECASE)
+_HTML_OUTLET = re.compile(r"<font[^>]*>(.*?)</font>", re.IGNORECASE | re.DOTALL)
+_HTML_BREAK = re.compile(r"</?(?:li|p|br|div|ol|ul)\b[^>]*>", re.IGNORECASE)
+_HTML_TAG = re.compile(r"<[^>]+>")
+_MARKUP_WORDS = frozenset({"_blank", "href", "nbsp", "6f6f6f"})  # Never ordinary words
+
+# Memoized translation and speech synthesis, cached separately
+TRANSLATION_MEMO = MemoCache(max_entries=512)
+AUDIO_MEMO = MemoCache(max_entries=128)
+
+# Per-article analysis results, keyed by article fingerprint
+ARTICLE_MEMO = MemoCache(max_entries=4096)
+
+# Near-duplicate detection over headline MinHash signatures
+DEDUP_THRESHOLD = 0.7  # Minimum estimated Jaccard similarity of title shingles
+DEDUP_SHINGLE_SIZE = 3
+DEDUP_NUM_PERM = 64
+DEDUP_BAND_ROWS = 4
+_MINHASH_PRIME = np.uint64((1 << 61) - 1)
+_MINHASH_A = np.random.RandomState(2025).randint(1, 1 << 31, DEDUP_NUM_PERM).astype(np.uint64)
+_MINHASH_B = np.random.RandomState(2026).randint(0, 1 << 31, DEDUP_NUM_PERM).astype(np.uint64)
+_OUTLET_SUFFIX = re.compile(r"\s+-\s+[^-]+$")
+_NON_WORD = re.compile(r"[^\w\s]+")
+
+# Articles whose topic sets overlap at least this much share a coverage cluster
+COVERAGE_CLUSTER_THRESHOLD = 0.3
 
 def _get_stock_prediction(dominant_sentiment: str) -> str:
     """
@@ -23,123 +66,726 @@ def _get_stock_prediction(dominant_sentiment: str) -> str:
         return "Stock prices may decrease."
     return "Stock prices may remain constant."
 
-def _generate_coverage_differences(articles: list) -> list:
+def _topic_matrix(articles: list) -> tuple:
+    """
+    Build a sparse binary article x topic matrix.
+
+    Args:
+        articles (list): List of news articles.
+
+    Returns:
+        tuple: CSR matrix and the topic vocabulary in column order.
+    """
+    vocabulary = {}
+    indices = []
+    indptr = [0]
+    for article in articles:
+        columns = {vocabulary.setdefault(topic, len(vocabulary)) for topic in article["topics"]}
+        indices.extend(sorted(columns))
+        indptr.append(len(indices))
+
+    matrix = csr_matrix(
+        (np.ones(len(indices), dtype=np.float32), indices, indptr),
+        shape=(len(articles), len(vocabulary))
+    )
+    return matrix, list(vocabulary)
+
+def _coverage_similarity(matrix: csr_matrix) -> np.ndarray:
+    """
+    Compute pairwise Jaccard similarity of the articles' topic sets.
+
+    Args:
+        matrix (csr_matrix): Binary article x topic matrix.
+
+    Returns:
+        np.ndarray: Dense symmetric similarity matrix.
+    """
+    shared = (matrix @ matrix.T).toarray()
+    sizes = np.diag(shared)
+    union = sizes[:, None] + sizes[None, :] - shared
+    return np.divide(shared, union, out=np.zeros_like(shared), where=union > 0)
+
+def analyze_coverage(articles: list) -> dict:
+    """
+    Analyze topic coverage across all articles in one vectorized pass.
+
+    Args:
+        articles (list): List of news articles.
+
+    Returns:
+        dict: Topic Overlap, Coverage Differences and Coverage Similarity.
+    """
+    matrix, topics = _topic_matrix(articles)
+    topic_freq = np.asarray(matrix.sum(axis=0)).ravel()
+
+    common_mask = topic_freq > 1
+    if not common_mask.any():
+        common_mask[:] = True
+    common_topics = [
+        topics[i] for i in np.argsort(-topic_freq, kind="stable") if common_mask[i]
+    ]
+    common_set = set(common_topics)
+
+    unique_topics = {
+        f"Unique Topics in Article {i+1}": list(dict.fromkeys(
+            topic for topic in article["topics"] if topic not in common_set
+        ))
+        for i, article in enumerate(articles)
+    }
+
+    similarity = _coverage_similarity(matrix)
+    return {
+        "Topic Overlap": {
+            "Common Topics": common_topics,
+            **unique_topics
+        },
+        "Coverage Differences": _generate_coverage_differences(articles, similarity),
+        "Coverage Similarity": _summarize_similarity(similarity)
+    }
+
+def _summarize_similarity(similarity: np.ndarray) -> dict:
+    """
+    Condense a similarity matrix into pair extremes and coverage clusters.
+
+    Articles are clustered as connected components of the graph linking
+    pairs at or above ``COVERAGE_CLUSTER_THRESHOLD``.
+
+    Args:
+        similarity (np.ndarray): Pairwise similarity matrix.
+
+    Returns:
+        dict: Mean similarity, most and least similar pairs and clusters.
+    """
+    count = len(similarity)
+    if count <= 1:
+        return {"Mean Similarity": None, "Coverage Clusters": [[1]] if count else []}
+
+    rows, cols = np.triu_indices(count, k=1)
+    pair_scores = similarity[rows, cols]
+    most, least = int(np.argmax(pair_scores)), int(np.argmin(pair_scores))
+
+    _, labels = connected_components(
+        csr_matrix(similarity >= COVERAGE_CLUSTER_THRESHOLD), directed=False
+    )
+    clusters = {}
+    for i, label in enumerate(labels):
+        clusters.setdefault(label, []).append(i + 1)
+
+    return {
+        "Mean Similarity": round(float(pair_scores.mean()), 4),
+        "Most Similar Pair": [int(rows[most]) + 1, int(cols[most]) + 1,
+                              round(float(pair_scores[most]), 4)],
+        "Least Similar Pair": [int(rows[least]) + 1, int(cols[least]) + 1,
+                               round(float(pair_scores[least]), 4)],
+        "Coverage Clusters": list(clusters.values())
+    }
+
+def _generate_coverage_differences(articles: list, similarity: np.ndarray = None) -> list:
     """
-    Generate coverage differences between articles.
+    Generate coverage differences between the most dissimilar article pairs.
+
+    Pairs are ranked by ascending topic similarity, ties broken by article
+    order, so the result does not depend on where articles sit in the feed.
+    As many pairs are reported as there are articles minus one.
 
     Args:
         articles (list): List of news articles.
+        similarity (np.ndarray): Pairwise similarity matrix, computed from
+            the articles' topics when omitted.
 
     Returns:
         list: Coverage differences and sentiment impacts.
     """
     if len(articles) <= 1:
         return []
+    if similarity is None:
+        similarity = _coverage_similarity(_topic_matrix(articles)[0])
+
+    count = len(articles) - 1
+    rows, cols = np.triu_indices(len(articles), k=1)
+    scores = similarity[rows, cols]
+    # Pairs are in row-major order, so a stable sort of the candidates at or
+    # below the cut-off score breaks ties by article order
+    candidates = np.flatnonzero(scores <= np.partition(scores, count - 1)[count - 1])
+    order = candidates[np.argsort(scores[candidates], kind="stable")[:count]]
 
-    return [
-        {
+    differences = []
+    for i, j in zip(rows[order].tolist(), cols[order].tolist()):
+        first, second = articles[i], articles[j]
+        differences.append({
             "Comparison": (
-                f"Article {i+1} covers {articles[i]['topics']}, "
-                f"while Article {i+2} focuses on {articles[i+1]['topics']}."
+                f"Article {i+1} covers {first['topics']}, "
+                f"while Article {j+1} focuses on {second['topics']}."
             ),
             "Sentiment Impact": (
-                f"Article {i+1} has a {articles[i]['sentiment']} sentiment, "
-                f"while Article {i+2} has a {articles[i+1]['sentiment']} sentiment."
+                f"Article {i+1} has a {first['sentiment']} sentiment, "
+                f"while Article {j+1} has a {second['sentiment']} sentiment."
             ),
             "Stock Impact": (
                 "This may create uncertainty in stock trends."
-                if articles[i]['sentiment'] != articles[i+1]['sentiment']
+                if first['sentiment'] != second['sentiment']
                 else "The sentiment consistency may stabilize stock movements."
             )
-        }
-        for i in range(len(articles) - 1)
-    ]
+        })
+    return differences
 
-async def generate_audio(text: str) -> str:
+async def _translate(text: str, source: str, target: str) -> str:
     """
-    Generate audio in a non-blocking way.
+    Translate text, reusing earlier translations of identical input.
+
+    Args:
+        text (str): Text to translate.
+        source (str): Source language code.
+        target (str): Target language code.
+
+    Returns:
+        str: Translated text.
+    """
+    key = MemoCache.make_key(text, source, target, "google")
+    translated = TRANSLATION_MEMO.get(key)
+    if translated is None:
+        from deep_translator import GoogleTranslator  # Deferred to keep startup fast
+
+        with stage_timer("translation"):
+            translated = await asyncio.to_thread(
+                GoogleTranslator(source=source, target=target).translate,
+                text
+            )
+        TRANSLATION_MEMO.set(key, translated)
+    return translated
+
+async def _synthesize(text: str, lang: str) -> tuple:
+    """
+    Synthesize MP3 audio, reusing earlier audio for identical input.
+
+    Only audio from the preferred backend is memoized, so a text that fell
+    back to another backend is retried with the preferred one next time.
+
+    Args:
+        text (str): Text to speak.
+        lang (str): Language code of the text.
+
+    Returns:
+        tuple: MP3 audio and the name of the backend that produced it.
+
+    Raises:
+        RuntimeError: If no TTS backend is available.
+    """
+    preferred = SYNTHESIZER.preferred()
+    if preferred is None:
+        raise RuntimeError("No TTS backend available")
+    key = MemoCache.make_key(text, lang, lang, preferred)
+    audio_bytes = AUDIO_MEMO.get(key)
+    if audio_bytes is not None:
+        return audio_bytes, preferred
+
+    audio_bytes, backend = await SYNTHESIZER.synthesize(text, lang)
+    if backend == preferred:
+        AUDIO_MEMO.set(key, audio_bytes)
+    return audio_bytes, backend
+
+def warm_up_models() -> None:
+    """
+    Load the sentiment model and audio libraries ahead of the first request.
+
+    Runs a small batch through the model so lazy initialization and
+    first-call compilation happen before real traffic arrives.
+    """
+    import deep_translator  # noqa: F401
+    import gtts  # noqa: F401
+
+    analyze_sentiment_batch([
+        "Shares rallied after the company reported record quarterly revenue.",
+        "Regulators opened an investigation into the company's latest recall.",
+    ])
+
+def get_audio_memo_stats() -> dict:
+    """
+    Report hit rates of the translation and audio memos.
+
+    Returns:
+        dict: Memo counters per stage.
+    """
+    return {
+        "translation": TRANSLATION_MEMO.stats(),
+        "audio": AUDIO_MEMO.stats()
+    }
+
+async def generate_audio_bytes(text: str) -> tuple:
+    """
+    Generate MP3 audio in a non-blocking way.
 
     Args:
         text (str): Text to convert to audio.
 
     Returns:
-        str: Base64 encoded audio.
+        tuple: MP3 audio, empty if generation failed, and the name of the
+            TTS backend that produced it, ``None`` on failure.
     """
     try:
         # First try to translate to Hindi
         try:
-            translated_summary = await asyncio.to_thread(
-                GoogleTranslator(source="en", target="hi").translate,
-                text
-            )
+            translated_summary = await _translate(text, "en", "hi")
         except Exception:
             translated_summary = text  # Fall back to English if translation fails
+            increment(
+                "news_audio_fallbacks_total",
+                "Audio generated in English after translation failed."
+            )
 
-        # Generate audio data in memory
-        mp3_fp = BytesIO()
-        tts = await asyncio.to_thread(
-            gTTS,
-            text=translated_summary,
-            lang="hi" if translated_summary != text else "en"
+        return await _synthesize(
+            translated_summary,
+            "hi" if translated_summary != text else "en"
         )
-        await asyncio.to_thread(tts.write_to_fp, mp3_fp)
-        mp3_fp.seek(0)
-
-        # Convert to base64
-        audio_bytes = await asyncio.to_thread(mp3_fp.read)
-        return base64.b64encode(audio_bytes).decode('utf-8')
     except Exception as e:
         print(f"Error generating audio: {str(e)}")
-        return ""
+        increment("news_audio_failures_total", "Audio generations that failed.")
+        return b"", None
 
-def process_articles(articles: list, company: str) -> tuple:
+async def generate_audio(text: str) -> str:
+    """
+    Generate audio in a non-blocking way.
+
+    Args:
+        text (str): Text to convert to audio.
+
+    Returns:
+        str: Base64 encoded audio.
+    """
+    audio_bytes, _ = await generate_audio_bytes(text)
+    return base64.b64encode(audio_bytes).decode('utf-8')
+
+def analyze_sentiment_batch(
+    texts: list,
+    batch_size: int = SENTIMENT_BATCH_SIZE,
+    max_length: int = SENTIMENT_MAX_LENGTH
+) -> list:
+    """
+    Analyze sentiment for many texts, one model call per batch.
+
+    Identical texts are scored once. If the sentiment module provides a
+    batched ``analyze_sentiment_batch`` it receives each chunk together with
+    ``max_length``; otherwise the chunk falls back to ``analyze_sentiment``.
+
+    Args:
+        texts (list): Texts to classify.
+        batch_size (int): Maximum number of texts per model call.
+        max_length (int): Maximum padded token length per batch.
+
+    Returns:
+        list: Sentiment labels in the same order as ``texts``.
+    """
+    import news_sentiment_analysis  # Local import to avoid circular dependency
+
+    batch_fn = getattr(news_sentiment_analysis, "analyze_sentiment_batch", None)
+    unique_texts = list(dict.fromkeys(texts))
+    labels = {}
+
+    for start in range(0, len(unique_texts), max(1, batch_size)):
+        chunk = unique_texts[start:start + max(1, batch_size)]
+        if batch_fn is not None:
+            chunk_labels = batch_fn(chunk, max_length=max_length)
+        else:
+            chunk_labels = [
+                news_sentiment_analysis.analyze_sentiment(text) for text in chunk
+            ]
+        labels.update(zip(chunk, chunk_labels))
+
+    return [labels[text] for text in texts]
+
+def _html_to_text(markup: str) -> str:
+    """
+    Strip tags and entities from an HTML fragment.
+
+    Args:
+        markup (str): HTML fragment.
+
+    Returns:
+        str: Text with list items separated by ``; ``.
+    """
+    text = html.unescape(_HTML_TAG.sub(" ", _HTML_BREAK.sub("\n", markup)))
+    lines = (" ".join(line.split()) for line in text.split("\n"))
+    return "; ".join(line for line in lines if line)
+
+def _clean_topic(topic: str) -> str:
+    """
+    Drop markup words picked up by keyword extraction from raw summaries.
+
+    Args:
+        topic (str): Topic phrase, e.g. ``"_blank tesla"``.
+
+    Returns:
+        str: Topic without markup words, empty if nothing remains.
+    """
+    return " ".join(word for word in topic.split() if word.lower() not in _MARKUP_WORDS)
+
+def truncate_tokens(text: str, budget: int = SENTIMENT_TOKEN_BUDGET) -> str:
+    """
+    Keep the first whitespace-separated tokens of a text.
+
+    Args:
+        text (str): Text to truncate.
+        budget (int): Maximum number of tokens.
+
+    Returns:
+        str: Truncated text, unchanged if already within budget.
+    """
+    tokens = text.split(None, budget)
+    if len(tokens) <= budget:
+        return text
+    return " ".join(tokens[:budget])
+
+def normalize_article(article: dict) -> dict:
+    """
+    Replace an article's RSS HTML summary with plain text.
+
+    The first linked URL and the outlet name are kept as separate ``link``
+    and ``source`` fields, falling back to the feed link and the headline's
+    `` - Outlet`` suffix.
+
+    Args:
+        article (dict): Article as returned by ``fetch_news``.
+
+    Returns:
+        dict: The same article, updated in place.
+    """
+    summary = article.get("summary") or ""
+    if "<" in summary or "&" in summary:
+        link = _HTML_LINK.search(summary)
+        outlet = _HTML_OUTLET.search(summary)
+        if link and not article.get("link"):
+            article["link"] = html.unescape(link.group(1))
+        if outlet and not article.get("source"):
+            article["source"] = _html_to_text(outlet.group(1))
+        summary = _html_to_text(_HTML_OUTLET.sub(" ", summary))
+
+    if not article.get("source"):
+        suffix = _OUTLET_SUFFIX.search(article.get("title", ""))
+        article["source"] = suffix.group(0).split("-", 1)[1].strip() if suffix else ""
+
+    article["summary"] = summary or article.get("title", "")
+    article.setdefault("link", "")
+    article["topics"] = list(dict.fromkeys(
+        topic for topic in map(_clean_topic, article.get("topics") or []) if topic
+    ))
+    return article
+
+def normalize_articles(articles: list) -> list:
+    """
+    Normalize every fetched article before analysis.
+
+    Args:
+        articles (list): Articles as returned by ``fetch_news``.
+
+    Returns:
+        list: The same articles with plain-text summaries.
+    """
+    if not articles:
+        return articles
+    for article in articles:
+        normalize_article(article)
+    return articles
+
+def article_fingerprint(article: dict) -> str:
+    """
+    Compute a stable identifier for an article's analyzable content.
+
+    Args:
+        article (dict): News article.
+
+    Returns:
+        str: Hash of the title and summary.
+    """
+    return MemoCache.make_key(article["title"], article["summary"])
+
+def _normalize_title(title: str) -> str:
+    """
+    Reduce a headline to the words that identify its story.
+
+    Args:
+        title (str): Headline, possibly ending in `` - Outlet``.
+
+    Returns:
+        str: Lowercase headline without outlet suffix or punctuation.
+    """
+    title = _OUTLET_SUFFIX.sub("", title)
+    return " ".join(_NON_WORD.sub(" ", title.lower()).split())
+
+def _minhash_signatures(texts: list) -> np.ndarray:
+    """
+    Compute MinHash signatures of the texts' character shingles.
+
+    Args:
+        texts (list): Normalized, non-empty texts.
+
+    Returns:
+        np.ndarray: One row of ``DEDUP_NUM_PERM`` minimum hashes per text.
+    """
+    hashes = []
+    offsets = []
+    for text in texts:
+        text = text.ljust(DEDUP_SHINGLE_SIZE)
+        offsets.append(len(hashes))
+        hashes.extend({
+            zlib.crc32(text[i:i + DEDUP_SHINGLE_SIZE].encode("utf-8"))
+            for i in range(len(text) - DEDUP_SHINGLE_SIZE + 1)
+        })
+
+    shingles = np.array(hashes, dtype=np.uint64)
+    permuted = (shingles[:, None] * _MINHASH_A + _MINHASH_B) % _MINHASH_PRIME
+    return np.minimum.reduceat(permuted, offsets, axis=0)
+
+def cluster_near_duplicates(articles: list, threshold: float = DEDUP_THRESHOLD) -> list:
+    """
+    Group articles whose normalized titles are near-duplicates.
+
+    Candidate pairs come from locality-sensitive hashing over MinHash
+    bands and are kept when their estimated Jaccard similarity reaches
+    ``threshold``.
+
+    Args:
+        articles (list): List of news articles.
+        threshold (float): Minimum estimated Jaccard similarity.
+
+    Returns:
+        list: For each article, the index of its cluster's first article.
+    """
+    parents = list(range(len(articles)))
+
+    def _find(i: int) -> int:
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    titles = [_normalize_title(article["title"]) for article in articles]
+    candidates = [i for i, title in enumerate(titles) if title]
+    if len(candidates) < 2:
+        return parents
+
+    signatures = _minhash_signatures([titles[i] for i in candidates])
+    buckets = {}
+    for band in range(DEDUP_NUM_PERM // DEDUP_BAND_ROWS):
+        keys = np.ascontiguousarray(
+            signatures[:, band * DEDUP_BAND_ROWS:(band + 1) * DEDUP_BAND_ROWS]
+        ).view(f"V{8 * DEDUP_BAND_ROWS}").ravel()
+        for row, key in enumerate(keys.tolist()):
+            buckets.setdefault((band, key), []).append(row)
+
+    for rows in buckets.values():
+        for other in rows[1:]:
+            first, second = _find(candidates[rows[0]]), _find(candidates[other])
+            if first == second:
+                continue
+            similarity = np.mean(signatures[rows[0]] == signatures[other])
+            if similarity >= threshold:
+                parents[max(first, second)] = min(first, second)
+
+    return [_find(i) for i in range(len(articles))]
+
+def score_articles(articles: list, indices: list, infer=None) -> list:
+    """
+    Score the given articles, reusing stored results.
+
+    Articles seen before reuse their stored result, so only unseen stories
+    reach the sentiment model. Each scored article is marked with
+    ``reused`` so callers can report how much work was saved.
+
+    Args:
+        articles (list): List of news articles.
+        indices (list): Positions in ``articles`` to score.
+        infer: Callable scoring a list of texts, defaults to
+            ``analyze_sentiment_batch``.
+
+    Returns:
+        list: Sentiment labels in the same order as ``indices``.
+    """
+    sentiments = {}
+    unseen = []
+    for i in indices:
+        article = articles[i]
+        memo = ARTICLE_MEMO.get(article_fingerprint(article))
+        article["reused"] = memo is not None
+        if memo is not None:
+            sentiments[i] = memo["sentiment"]
+            article["topics"] = memo["topics"]
+        else:
+            unseen.append(i)
+
+    labels = (infer or analyze_sentiment_batch)([truncate_tokens(articles[i]["summary"]) for i in unseen])
+    increment(
+        "news_articles_total", "Articles scored, by model, memo or duplicate.",
+        len(indices) - len(unseen), source="reused"
+    )
+    increment(
+        "news_articles_total", "Articles scored, by model, memo or duplicate.",
+        len(unseen), source="model"
+    )
+    for i, sentiment in zip(unseen, labels):
+        sentiments[i] = sentiment
+        ARTICLE_MEMO.set(article_fingerprint(articles[i]), {
+            "sentiment": sentiment,
+            "topics": articles[i]["topics"]
+        })
+
+    return [sentiments[i] for i in indices]
+
+def copy_cluster_labels(articles: list, clusters: list, sentiments: list, indices=None) -> None:
+    """
+    Copy each cluster's label from its first article to the other members.
+
+    Every labelled article records its ``cluster_size``, and duplicates are
+    marked as ``reused``.
+
+    Args:
+        articles (list): List of news articles.
+        clusters (list): Cluster assignments from ``cluster_near_duplicates``.
+        sentiments (list): Labels by article position, filled in place. The
+            first article of each cluster must already be labelled.
+        indices: Positions to label, defaults to every article.
+    """
+    cluster_sizes = Counter(clusters)
+    duplicates = 0
+    for i in range(len(articles)) if indices is None else indices:
+        representative = clusters[i]
+        articles[i]["cluster_size"] = cluster_sizes[representative]
+        if representative != i:
+            sentiments[i] = sentiments[representative]
+            articles[i]["reused"] = True
+            duplicates += 1
+    increment(
+        "news_articles_total", "Articles scored, by model, memo or duplicate.",
+        duplicates, source="duplicate"
+    )
+
+def analyze_article_sentiments(articles: list, infer=None) -> list:
+    """
+    Score articles, reusing stored results and collapsing near-duplicates.
+
+    Near-duplicate articles are clustered and only the first article of
+    each cluster is scored with ``score_articles``; its label is copied to
+    the other members by ``copy_cluster_labels``.
+
+    Args:
+        articles (list): List of news articles.
+        infer: Callable scoring a list of texts, defaults to
+            ``analyze_sentiment_batch``.
+
+    Returns:
+        list: Sentiment labels in the same order as ``articles``.
+    """
+    return analyze_grouped_sentiments([articles], infer)[0]
+
+def analyze_grouped_sentiments(groups: list, infer=None) -> list:
+    """
+    Score several companies' articles with one sentiment pass.
+
+    Each group is clustered on its own, so copies of a story in two
+    companies' coverage are not merged, and the representatives of every
+    group are scored together with ``score_articles``.
+
+    Args:
+        groups (list): Lists of news articles, one per company.
+        infer: Callable scoring a list of texts, defaults to
+            ``analyze_sentiment_batch``.
+
+    Returns:
+        list: Sentiment labels for each group, in the same order.
+    """
+    with stage_timer("dedup"):
+        clusters = [cluster_near_duplicates(articles) for articles in groups]
+
+    flattened = [article for articles in groups for article in articles]
+    representatives = []
+    offset = 0
+    for articles, assignments in zip(groups, clusters):
+        representatives.extend(offset + i for i in sorted(set(assignments)))
+        offset += len(articles)
+    labels = dict(zip(representatives, score_articles(flattened, representatives, infer)))
+
+    results = []
+    offset = 0
+    for articles, assignments in zip(groups, clusters):
+        sentiments = [labels.get(offset + i) for i in range(len(articles))]
+        copy_cluster_labels(articles, assignments, sentiments)
+        results.append(sentiments)
+        offset += len(articles)
+    return results
+
+def article_ids(articles: list) -> list:
+    """
+    Assign IDs that are unique within one result.
+
+    An ID is the start of the article's fingerprint. Repeats of the same
+    title and summary get an occurrence suffix, so ``-1`` marks the second.
+
+    Args:
+        articles (list): List of news articles.
+
+    Returns:
+        list: IDs in the same order as ``articles``.
+    """
+    seen = Counter()
+    ids = []
+    for article in articles:
+        article_id = article_fingerprint(article)[:16]
+        ids.append(f"{article_id}-{seen[article_id]}" if seen[article_id] else article_id)
+        seen[article_id] += 1
+    return ids
+
+def structure_article(article: dict, article_id: str) -> dict:
+    """
+    Convert an analyzed article into its response shape.
+
+    Args:
+        article (dict): Article with its sentiment set.
+        article_id (str): ID from ``article_ids``.
+
+    Returns:
+        dict: ID, title, summary, source, link, sentiment, topics and
+            duplicate cluster size.
+    """
+    return {
+        "ID": article_id,
+        "Title": article["title"],
+        "Summary": article["summary"],
+        "Source": article.get("source", ""),
+        "Link": article.get("link", ""),
+        "Sentiment": article["sentiment"],
+        "Topics": article["topics"],
+        "Cluster Size": article.get("cluster_size", 1),
+    }
+
+def process_articles(articles: list, company: str, sentiments: list = None) -> tuple:
     """
     Process articles for sentiment and topic analysis.
 
     Args:
         articles (list): List of news articles.
         company (str): Company name.
+        sentiments (list): Precomputed sentiment labels, one per article.
 
     Returns:
         tuple: Sentiment counts, structured articles, and analysis results.
     """
-    from news_sentiment_analysis import analyze_sentiment  # Local import to avoid circular dependency
-
     sentiment_counts = {"Positive": 0, "Negative": 0, "Neutral": 0}
     structured_articles = []
-    all_topics = []
-    topic_sets = []
-    unique_topics = {}
 
-    for article in articles:
-        sentiment = analyze_sentiment(article["summary"])
+    if sentiments is None:
+        with stage_timer("sentiment"):
+            sentiments = analyze_article_sentiments(articles)
+
+    for article, sentiment in zip(articles, sentiments):
         article["sentiment"] = sentiment
         sentiment_counts[sentiment] += 1
-        all_topics.extend(article["topics"])
-        topic_sets.append(set(article["topics"]))
-
-    # Topic frequency and analysis
-    topic_freq = Counter(all_topics)
-    common_topics = {
-        topic for topic, freq in topic_freq.items() if freq > 1
-    } or set(topic_freq.keys())
-
-    for i, article in enumerate(articles):
-        unique_topics[f"Unique Topics in Article {i+1}"] = list(
-            set(article["topics"]) - common_topics
-        )
 
-    # Coverage differences
-    coverage_differences = _generate_coverage_differences(articles)
+    # Topic overlap, coverage differences and similarity in one pass
+    with stage_timer("coverage"):
+        coverage = analyze_coverage(articles)
 
     # Structured articles
-    for article in articles:
-        structured_articles.append({
-            "Title": article["title"],
-            "Summary": article["summary"],
-            "Sentiment": article["sentiment"],
-            "Topics": article["topics"],
-        })
+    for article, article_id in zip(articles, article_ids(articles)):
+        structured_articles.append(structure_article(article, article_id))
 
     # Sentiment and stock prediction
     dominant_sentiment = max(sentiment_counts, key=sentiment_counts.get)
@@ -149,13 +795,15 @@ def process_articles(articles: list, company: str) -> tuple:
         f"mostly {dominant_sentiment}. {stock_prediction}"
     )
 
+    reused = sum(1 for article in articles if article.get("reused"))
+
     return sentiment_counts, structured_articles, {
         "Final Sentiment Analysis": sentiment_summary,
-        "Coverage Differences": coverage_differences,
-        "Topic Overlap": {
-            "Common Topics": list(common_topics),
-            **unique_topics
-        }
+        "Article Reuse": {
+            "Reused": reused,
+            "Analyzed": len(articles) - reused
+        },
+        **coverage
     }
 
 def create_empty_result(company: str) -> dict:
@@ -173,9 +821,12 @@ def create_empty_result(company: str) -> dict:
         "Articles": [],
         "Comparative Sentiment Score": {
             "Sentiment Distribution": {"Positive": 0, "Negative": 0, "Neutral": 0},
-            "Topic Overlap": {"Common Topics": [], "Unique Topics": {}}
+            "Coverage Differences": [],
+            "Topic Overlap": {"Common Topics": [], "Unique Topics": {}},
+            "Coverage Similarity": {"Mean Similarity": None, "Coverage Clusters": []}
         },
         "Final Sentiment Analysis": f"No significant news coverage found for {company}.",
+        "Article Reuse": {"Reused": 0, "Analyzed": 0},
         "Audio": "",
         "AudioBase64": ""
     }
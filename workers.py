@@ -0,0 +1,204 @@
+"""Executors keeping model inference and blocking I/O off the event loop."""
+import asyncio
+import contextvars
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from metrics import increment
+
+# Worker processes running sentiment inference, 0 to run it in process
+CPU_WORKERS = int(os.environ.get("NEWS_CPU_WORKERS", "1"))
+
+# Threads coordinating analyses (dedup, memo lookups, topic coverage)
+ANALYSIS_THREADS = int(os.environ.get("NEWS_ANALYSIS_THREADS", "4"))
+
+# Threads for feed fetches, translation, TTS and disk cache access
+IO_THREADS = int(os.environ.get("NEWS_IO_THREADS", "32"))
+
+def _init_worker() -> None:
+    """
+    Load the sentiment model once when a worker process starts.
+    """
+    from utils import warm_up_models
+
+    try:
+        warm_up_models()
+    except Exception as e:
+        print(f"Error warming up worker: {str(e)}")
+
+def _warm_worker() -> int:
+    """
+    Check that a worker's model is loaded, raising if it cannot be.
+
+    Returns:
+        int: Worker process id.
+    """
+    from utils import warm_up_models
+
+    warm_up_models()
+    return os.getpid()
+
+class WorkerPools:
+    """
+    Executors for CPU-bound analysis and blocking I/O.
+
+    Analysis coordination runs on a small thread pool, while sentiment
+    inference is shipped to worker processes that each load the model once.
+    Network and disk waits get a separate, larger thread pool. Pools are
+    created lazily on first use, and a process pool broken by a worker
+    dying is replaced on the next inference.
+    """
+
+    def __init__(
+        self,
+        processes: int = CPU_WORKERS,
+        threads: int = ANALYSIS_THREADS,
+        io_threads: int = IO_THREADS
+    ):
+        self.processes = processes
+        self.threads = threads
+        self.io_threads = io_threads
+        self._process_pool = None
+        self._thread_pool = None
+        self._lock = threading.Lock()
+        self.restarts = 0
+
+    @property
+    def process_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._process_pool is None and self.processes > 0:
+                # Spawned workers avoid inheriting the parent's threads and locks
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker
+                )
+            return self._process_pool
+
+    def _discard_process_pool(self, pool: ProcessPoolExecutor) -> None:
+        """
+        Drop a broken process pool so the next use starts a new one.
+
+        Args:
+            pool (ProcessPoolExecutor): Pool that raised ``BrokenProcessPool``.
+        """
+        with self._lock:
+            if self._process_pool is not pool:
+                return  # Another thread already replaced it
+            self._process_pool = None
+            self.restarts += 1
+        pool.shutdown(wait=False)
+        increment("news_worker_pool_restarts_total", "Process pools replaced after a worker died.")
+
+    @property
+    def thread_pool(self) -> ThreadPoolExecutor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.threads, thread_name_prefix="news-analysis"
+            )
+        return self._thread_pool
+
+    def install_io_pool(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Give a loop a default executor sized for I/O.
+
+        ``asyncio.to_thread`` and ``run_in_executor(None, ...)`` then use a
+        pool sized for network and disk waits instead of the CPU-sized
+        default. The loop owns the pool and shuts it down when it closes.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): Loop serving requests.
+        """
+        loop.set_default_executor(ThreadPoolExecutor(
+            max_workers=self.io_threads, thread_name_prefix="news-io"
+        ))
+
+    def infer(self, texts: list) -> list:
+        """
+        Score texts with the sentiment model, blocking until done.
+
+        Args:
+            texts (list): Texts to classify.
+
+        Returns:
+            list: Sentiment labels in the same order as ``texts``.
+        """
+        from utils import analyze_sentiment_batch
+
+        if not texts:
+            return []
+        pool = self.process_pool
+        if pool is None:
+            return analyze_sentiment_batch(texts)
+        try:
+            return pool.submit(analyze_sentiment_batch, texts).result()
+        except BrokenProcessPool as e:
+            # A worker died (e.g. out of memory); retry once on a fresh pool
+            print(f"Error in sentiment worker, restarting the pool: {str(e)}")
+            self._discard_process_pool(pool)
+            return self.process_pool.submit(analyze_sentiment_batch, texts).result()
+
+    async def run(self, fn, *args, **kwargs):
+        """
+        Run a function on the analysis thread pool.
+
+        The caller's context is copied, so stage timers inside ``fn`` still
+        report to the current request.
+
+        Args:
+            fn: Blocking callable.
+            *args: Positional arguments for ``fn``.
+            **kwargs: Keyword arguments for ``fn``.
+
+        Returns:
+            The function's result.
+        """
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            self.thread_pool, lambda: context.run(fn, *args, **kwargs)
+        )
+
+    def warm_up(self) -> None:
+        """
+        Start every worker process and load its model.
+
+        Without worker processes the model is loaded in this process.
+        """
+        if self.process_pool is None:
+            _warm_worker()
+            return
+        # Each task submitted while all workers are busy starts another one
+        tasks = [self.process_pool.submit(_warm_worker) for _ in range(self.processes)]
+        for task in tasks:
+            task.result()
+
+    def stats(self) -> dict:
+        """
+        Report pool sizes and queued analysis work.
+
+        Returns:
+            dict: Configured workers and threads, process pool restarts and
+                the analysis backlog.
+        """
+        return {
+            "processes": self.processes,
+            "restarts": self.restarts,
+            "analysis_threads": self.threads,
+            "io_threads": self.io_threads,
+            "queued": self._thread_pool._work_queue.qsize() if self._thread_pool else 0
+        }
+
+    def shutdown(self) -> None:
+        """
+        Stop the pools, waiting for running work to finish.
+        """
+        for pool in (self._process_pool, self._thread_pool):
+            if pool is not None:
+                pool.shutdown(wait=True)
+        self._process_pool = None
+        self._thread_pool = None
+
+POOLS = WorkerPools()